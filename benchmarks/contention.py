@@ -0,0 +1,83 @@
+"""
+    PyFSM
+
+    Concurrent signals contention benchmark
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import List, Optional
+import pyfsm
+from pyfsm.fsm import FSM
+from pyfsm.transition import Transition, TransitionFactory, TransitionTable
+
+
+class BenchmarkContext(pyfsm.StatefulInterface):
+    """ Benchmark stateful entity """
+
+    def __init__(self):
+        self.__state = pyfsm.State('odd')
+
+    @property
+    def state(self) -> pyfsm.StateInterface:
+        """ Gets state """
+        return self.__state
+
+    @state.setter
+    def state(self, state: pyfsm.StateInterface):
+        """ Sets state """
+        self.__state = state
+
+
+class IOListener(pyfsm.ListenerInterface):
+    """ Listener imitating input output latency """
+
+    def listen(self, event: pyfsm.Event):
+        """ Processes transition event """
+        time.sleep(0.0002 if event else 0)
+
+
+def get_fsm(locks: Optional[pyfsm.StripedLock]) -> FSM:
+    """ Gets state machine toggling context state """
+    listener = IOListener()
+    table = TransitionTable(TransitionFactory(None, None, None), [])
+    odd, even = pyfsm.State('odd'), pyfsm.State('even')
+    table.add_transition(Transition(odd, even, 'flip', (), [listener]))
+    table.add_transition(Transition(even, odd, 'flip', (), [listener]))
+
+    return FSM('BenchmarkContext', table, locks)
+
+
+def measure(fsm: FSM, contexts: List[BenchmarkContext]) -> float:
+    """ Measures signals per second sent by threads """
+    signals = 4000
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(
+            lambda context: fsm.signal(context, 'flip'),
+            (contexts[number % len(contexts)] for number in range(signals))
+        ))
+
+    return signals / (time.perf_counter() - started)
+
+
+def main():
+    """ Executing """
+    cases = (
+        ('global lock', 1),
+        ('striped locks', 64)
+    )
+
+    for contexts in (1, 16, 1024):
+        for name, stripes in cases:
+            rate = measure(
+                get_fsm(pyfsm.StripedLock(stripes)),
+                [BenchmarkContext() for _ in range(contexts)]
+            )
+            print('%5d contexts, %13s: %8.0f signals/s' %
+                  (contexts, name, rate))
+
+
+if __name__ == '__main__':
+    main()
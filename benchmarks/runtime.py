@@ -0,0 +1,79 @@
+"""
+    PyFSM
+
+    Sharded runtime benchmark with I/O bound listener
+"""
+
+import time
+import pyfsm
+
+
+class IOListener(pyfsm.ListenerInterface):
+    """ Listener waiting for I/O """
+
+    def listen(self, event: pyfsm.Event):
+        """ Processes transition event """
+        time.sleep(0.001)
+
+
+class Entity(pyfsm.IdentifiableInterface):
+    """ Benchmark entity """
+
+    def __init__(self, identifier: int):
+        self.__id = identifier
+        self.__state = pyfsm.State('from')
+
+    @property
+    def id(self) -> int:
+        """ Gets identifier """
+        return self.__id
+
+    @property
+    def state(self) -> pyfsm.StateInterface:
+        """ Gets state """
+        return self.__state
+
+    @state.setter
+    def state(self, state: pyfsm.StateInterface):
+        """ Sets state """
+        self.__state = state
+
+
+def main():
+    """ Executing """
+    listener_manager = pyfsm.ListenerManager()
+    listener_manager.add_listener(IOListener())
+    fsm = pyfsm.FSMFactory(
+        {
+            'Entity': {
+                'states': {'from': {}, 'to': {}},
+                'transitions': [
+                    {'from': 'from', 'to': 'to', 'signal': 'go',
+                     'after': ['IOListener']},
+                    {'from': 'to', 'to': 'from', 'signal': 'go',
+                     'after': ['IOListener']}
+                ]
+            }
+        },
+        pyfsm.GuardManager(),
+        listener_manager
+    ).get_fsm(Entity(0))
+
+    for shards in (1, 2, 4, 8):
+        with pyfsm.ShardedRuntime(fsm, shards) as runtime:
+            for identifier in range(1000):
+                runtime.add(Entity(identifier))
+
+            start = time.perf_counter()
+            for identifier in range(1000):
+                runtime.signal(identifier, 'go')
+            runtime.flush()
+            seconds = time.perf_counter() - start
+
+            print('%d shards: %.0f signals per second, max latency %.3f s' %
+                  (shards, 1000 / seconds,
+                   max(stats.latency_max for stats in runtime.stats())))
+
+
+if __name__ == '__main__':
+    main()
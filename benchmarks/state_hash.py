@@ -0,0 +1,36 @@
+"""
+    PyFSM
+
+    States keyed collections benchmark
+"""
+
+import timeit
+import pyfsm
+
+
+def main():
+    """ Executing """
+    repeat = 1000000
+    states = [pyfsm.State('state{0}'.format(number)) for number in range(100)]
+    mapping = {state: state.name for state in states}
+    members = set(states)
+    names = {state.name: state for state in states}
+    probe = states[50]
+    equal = pyfsm.State('state50')
+    cases = {
+        'dict by same': lambda: mapping[probe],
+        'dict by equal': lambda: mapping[equal],
+        'dict by name': lambda: names[probe.name],
+        'set by same': lambda: probe in members,
+        'set by equal': lambda: equal in members,
+        'same state': lambda: probe == states[50],
+        'equal state': lambda: probe == equal,
+    }
+
+    for name, case in cases.items():
+        seconds = timeit.timeit(case, number=repeat)
+        print('%14s: %.1f ns per operation' % (name, seconds / repeat * 1e9))
+
+
+if __name__ == '__main__':
+    main()
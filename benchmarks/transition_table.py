@@ -0,0 +1,53 @@
+"""
+    PyFSM
+
+    Transitions table lookup benchmark
+"""
+
+import timeit
+import pyfsm
+from pyfsm.transition import Transition, TransitionTable, TransitionFactory
+
+
+class BenchmarkContext(pyfsm.StatefulInterface):
+    """ Benchmark stateful entity """
+
+    state = pyfsm.State('state0')
+
+
+def get_table(size: int) -> TransitionTable:
+    """ Gets table with given transitions count """
+    table = TransitionTable(TransitionFactory(None, None, None), [])
+
+    for number in range(size):
+        table.add_transition(
+            Transition(
+                pyfsm.State('state{0}'.format(number // 3)),
+                pyfsm.State('state{0}'.format(number // 3 + 1)),
+                'signal{0}'.format(number % 3)
+            )
+        )
+
+    return table
+
+
+def measure(table: TransitionTable, repeat: int) -> float:
+    """ Measures lookup time in microseconds """
+    context = BenchmarkContext()
+    seconds = timeit.timeit(
+        lambda: next(table.find_transitions(context, 'signal2'), None),
+        number=repeat
+    )
+
+    return seconds / repeat * 1e6
+
+
+def main():
+    """ Executing """
+    for size in (10, 100, 1000, 10000):
+        print('%6d transitions: %.3f us per lookup' %
+              (size, measure(get_table(size), 100000)))
+
+
+if __name__ == '__main__':
+    main()
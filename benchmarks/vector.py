@@ -0,0 +1,43 @@
+"""
+    PyFSM
+
+    Vectorized state engine benchmark, requires NumPy
+"""
+
+from functools import partial
+import timeit
+import numpy
+import pyfsm
+from pyfsm.transition import Transition, TransitionFactory, TransitionTable
+
+
+def get_table(size: int) -> TransitionTable:
+    """ Gets chain table with given states count """
+    table = TransitionTable(TransitionFactory(None, None, None), [])
+
+    for number in range(size - 1):
+        table.add_transition(
+            Transition(
+                pyfsm.State('state{0}'.format(number)),
+                pyfsm.State('state{0}'.format(number + 1)),
+                'next'
+            )
+        )
+
+    return table
+
+
+def main():
+    """ Executing """
+    fsm = pyfsm.VectorFSM(get_table(100))
+
+    for population in (10000, 1000000, 10000000):
+        states = numpy.random.randint(0, 100, population).astype(numpy.int32)
+        seconds = timeit.timeit(partial(fsm.signal, states, 'next'), number=5)
+
+        print('%9d entities: %.3f ms per signal' %
+              (population, seconds / 5 * 1e3))
+
+
+if __name__ == '__main__':
+    main()
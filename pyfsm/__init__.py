@@ -4,8 +4,22 @@
     Final State Machine
 """
 
-from .entity import StatefulInterface
-from .fsm import FSMFactory, FSMInterface, FSMNotFoundException
+from .analyzer import AnalysisReport, MachineAnalyzer
+from .artifact import InvalidArtifactException, MachineArtifact
+from .async_fsm import AsyncFSMInterface
+from .dispatch import DispatcherOverflowException, ListenerDispatcher
+from .entity import (
+    IdentifiableInterface,
+    StatefulInterface,
+    VersionedInterface
+)
+from .fsm import (
+    FSMFactory,
+    FSMInterface,
+    FSMNotFoundException,
+    Outcome,
+    TransitionConflictException
+)
 from .guard import GuardInterface, GuardManager
 from .listener import (
     Event,
@@ -13,6 +27,19 @@ from .listener import (
     ListenerManager,
     ListenerNotFoundException
 )
+from .journal import Journal, JournalReader, JournalRecord, JournalStorage
+from .lock import StripedLock
+from .mailbox import Mailbox, MailboxOverflowException
+from .metrics import (
+    Metrics,
+    MeasuredFSM,
+    MeasuredGuardManager,
+    MeasuredListenerManager,
+    MeasuredStorage
+)
+from .parallel import ParallelFSMRunner, ParallelResult
+from .replay import Checkpoint
+from .runtime import EntityNotFoundException, ShardedRuntime, ShardStats
 from .state import (
     StateInterface,
     State,
@@ -20,26 +47,70 @@ from .state import (
     IncorrectStateConfigException,
     StateNotFoundException
 )
+from .storage import (
+    StateStorageInterface,
+    AttributeStorage,
+    SQLStateStorage,
+    StaleStateException
+)
+from .timer import TimedFSM
 from .transition import InvalidTransitionConfig
+from .vector import VectorFSM, VectorGuardInterface
 
 __version__ = '0.0.1.dev0'
 
 __all__ = [
     'StatefulInterface',
+    'IdentifiableInterface',
+    'VersionedInterface',
+    'AnalysisReport',
+    'MachineAnalyzer',
+    'MachineArtifact',
+    'InvalidArtifactException',
+    'AsyncFSMInterface',
     'FSMInterface',
     'FSMFactory',
     'FSMNotFoundException',
+    'Outcome',
+    'TransitionConflictException',
     'GuardInterface',
     'GuardManager',
     'Event',
     'ListenerInterface',
     'ListenerManager',
     'ListenerNotFoundException',
+    'ListenerDispatcher',
+    'DispatcherOverflowException',
+    'Journal',
+    'JournalReader',
+    'JournalRecord',
+    'JournalStorage',
+    'StripedLock',
+    'Mailbox',
+    'MailboxOverflowException',
+    'Metrics',
+    'MeasuredFSM',
+    'MeasuredGuardManager',
+    'MeasuredListenerManager',
+    'MeasuredStorage',
+    'ParallelFSMRunner',
+    'ParallelResult',
+    'Checkpoint',
+    'ShardedRuntime',
+    'ShardStats',
+    'EntityNotFoundException',
     'StateInterface',
     'State',
     'IncorrectStateTypeException',
     'IncorrectStateConfigException',
     'StateNotFoundException',
+    'StateStorageInterface',
+    'AttributeStorage',
+    'SQLStateStorage',
+    'StaleStateException',
+    'TimedFSM',
     'InvalidTransitionConfig',
+    'VectorFSM',
+    'VectorGuardInterface',
     '__version__'
 ]
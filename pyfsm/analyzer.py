@@ -0,0 +1,271 @@
+"""
+    PyFSM.analyzer
+
+    Static machine analysis module
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
+from .guard import GuardInterface, unwrap_guards
+from .state import State
+from .transition import Transition, TransitionTable
+
+
+Literals = FrozenSet[Tuple[int, bool]]
+Search = Tuple[Dict[str, int], Dict[str, int], List[str], List[List[str]]]
+
+
+@dataclass()
+class AnalysisReport:
+    """ Machine analysis report
+
+        Conflicts are pairs of transitions from one state by one signal,
+        which guards are not provably exclusive, so the first one wins
+    """
+
+    __unreachable: List[str] = field(default_factory=list)
+    __sinks: List[str] = field(default_factory=list)
+    __conflicts: List[Tuple[Transition, Transition]] = field(
+        default_factory=list
+    )
+    __cycles: List[List[str]] = field(default_factory=list)
+
+    @property
+    def unreachable(self) -> List[str]:
+        """ Gets states not reachable from initial ones """
+        return self.__unreachable
+
+    @property
+    def sinks(self) -> List[str]:
+        """ Gets not final states without outgoing transitions """
+        return self.__sinks
+
+    @property
+    def conflicts(self) -> List[Tuple[Transition, Transition]]:
+        """ Gets overlapping transitions pairs """
+        return self.__conflicts
+
+    @property
+    def cycles(self) -> List[List[str]]:
+        """ Gets states of automatic transitions cycles """
+        return self.__cycles
+
+    @property
+    def messages(self) -> List[str]:
+        """ Gets report lines """
+        return [
+            "State '{0}' is unreachable".format(name)
+            for name in self.__unreachable
+        ] + [
+            "State '{0}' has no outgoing transitions".format(name)
+            for name in self.__sinks
+        ] + [
+            "Transitions {0!r} and {1!r} overlap".format(first, second)
+            for first, second in self.__conflicts
+        ] + [
+            "Automatic transitions cycle through states {0}".format(
+                ', '.join("'{0}'".format(name) for name in cycle)
+            )
+            for cycle in self.__cycles
+        ]
+
+
+class MachineAnalyzer:
+    """ Compiled transitions table analyzer
+
+        Works in time linear to states and transitions count,
+        except pairwise guards check of transitions sharing
+        initial state and signal. States inherit transitions of
+        composite states, which are reached with their children
+    """
+
+    def __init__(self, transition_table: TransitionTable):
+        self.__table = transition_table
+        self.__transitions = list(transition_table)
+
+    def analyze(
+            self,
+            initial: Iterable[str],
+            states: Iterable[str] = ()
+    ) -> AnalysisReport:
+        """ Analyzes machine started from initial states
+
+            States are all configured states names,
+            states of transitions are used by default
+        """
+        graph = self.__get_graph(states)
+        parents = {self.__table.get_parent(name) for name in graph}
+        finals = set(self.__table.get_states(State.TYPE_FINAL))
+
+        return AnalysisReport(
+            self.__get_unreachable(graph, initial),
+            [
+                name for name, edges in graph.items()
+                if not edges and name not in parents and name not in finals
+            ],
+            self.__get_conflicts(),
+            self.__get_cycles({
+                name: [
+                    transition.state_to.name for transition in edges
+                    if transition.signal is None
+                ]
+                for name, edges in graph.items()
+            })
+        )
+
+    def __get_graph(
+            self,
+            states: Iterable[str]
+    ) -> Dict[str, List[Transition]]:
+        """ Gets transitions by initial state names """
+        graph = {name: [] for name in states}
+
+        for name in self.__table.get_states():
+            graph.setdefault(name, [])
+
+        for name, edges in graph.items():
+            for candidates in self.__table.get_signals_candidates(
+                    State(name)
+            ).values():
+                edges.extend(candidates)
+
+        return graph
+
+    def __get_unreachable(
+            self,
+            graph: Dict[str, List[Transition]],
+            initial: Iterable[str]
+    ) -> List[str]:
+        """ Gets states not reachable from initial ones """
+        stack = []
+        visited = set()
+        self.__visit(
+            [name for name in initial if name in graph],
+            stack,
+            visited
+        )
+
+        while stack:
+            self.__visit(
+                [edge.state_to.name for edge in graph[stack.pop()]],
+                stack,
+                visited
+            )
+
+        return [name for name in graph if name not in visited]
+
+    def __visit(self, names: List[str], stack: List[str], visited: Set[str]):
+        """ Marks states and their composite states visited """
+        for name in names:
+            while name is not None and name not in visited:
+                visited.add(name)
+                stack.append(name)
+                name = self.__table.get_parent(name)
+
+    def __get_conflicts(self) -> List[Tuple[Transition, Transition]]:
+        """ Gets pairs of not exclusive transitions by state and signal """
+        groups = {}
+        conflicts = []
+
+        for transition in self.__transitions:
+            key = transition.state_from.name, transition.signal
+            literals = self.__get_literals(transition.guards)
+
+            for other, other_literals in groups.get(key, ()):
+                if not self.__is_exclusive(literals, other_literals):
+                    conflicts.append((other, transition))
+
+            groups.setdefault(key, []).append((transition, literals))
+
+        return conflicts
+
+    @classmethod
+    def __get_cycles(cls, graph: Dict[str, List[str]]) -> List[List[str]]:
+        """ Gets strongly connected components with cycles
+
+            Iterative Tarjan algorithm, states leave low links map
+            when their component is complete
+        """
+        search = ({}, {}, [], [])
+
+        for name in graph:
+            if name not in search[0]:
+                work = []
+                cls.__enter(graph, name, work, search)
+
+                while work:
+                    cls.__advance(graph, work, search)
+
+        return search[3]
+
+    @classmethod
+    def __advance(
+            cls,
+            graph: Dict[str, List[str]],
+            work: List[Tuple[str, Iterator[str]]],
+            search: Search
+    ):
+        """ Follows next edge of current state or leaves it """
+        index, low, _, _ = search
+        name, edges = work[-1]
+        target = next(edges, None)
+
+        if target is None:
+            work.pop()
+            if work:
+                low[work[-1][0]] = min(low[work[-1][0]], low[name])
+            cls.__leave(graph, name, search)
+        elif target not in index:
+            cls.__enter(graph, target, work, search)
+        elif target in low:
+            low[name] = min(low[name], index[target])
+
+    @classmethod
+    def __enter(
+            cls,
+            graph: Dict[str, List[str]],
+            name: str,
+            work: List[Tuple[str, Iterator[str]]],
+            search: Search
+    ):
+        """ Starts state visiting """
+        index, low, stack, _ = search
+        index[name] = low[name] = len(index)
+        stack.append(name)
+        work.append((name, iter(graph[name])))
+
+    @classmethod
+    def __leave(
+            cls,
+            graph: Dict[str, List[str]],
+            name: str,
+            search: Search
+    ):
+        """ Pops component rooted at state if any """
+        index, low, stack, cycles = search
+
+        if low[name] != index[name]:
+            return
+
+        component = []
+        member = None
+
+        while member != name:
+            member = stack.pop()
+            component.append(member)
+            del low[member]
+
+        if len(component) > 1 or name in graph[name]:
+            cycles.append(list(reversed(component)))
+
+    @classmethod
+    def __is_exclusive(cls, first: Literals, second: Literals) -> bool:
+        """ Checks guards contain some guard and its reverse """
+        return any((guard, not reverse) in second for guard, reverse in first)
+
+    @classmethod
+    def __get_literals(cls, guards: Iterable[GuardInterface]) -> Literals:
+        """ Gets guards identities with reverse flags """
+        return frozenset(
+            (id(guard), reverse) for guard, reverse in unwrap_guards(guards)
+        )
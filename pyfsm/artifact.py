@@ -0,0 +1,370 @@
+"""
+    PyFSM.artifact
+
+    Compiled machines artifact module
+"""
+
+from hashlib import sha256
+import json
+import os
+import pickle
+from sys import intern
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .entity import StatefulInterface
+from .guard import (
+    GuardInterface,
+    GuardManager,
+    NullGuard,
+    ReverseGuard,
+    unwrap_guards
+)
+from .listener import Event, ListenerInterface, ListenerManager
+from .state import State
+from .transition import Transition, TransitionFactory, TransitionTable
+
+
+Machine = Tuple[
+    Tuple[Tuple[str, str, Optional[str]], ...],
+    Tuple[
+        Tuple[int, int, Optional[str], tuple, tuple, tuple, Optional[float]],
+        ...
+    ]
+]
+
+
+class LazyGuard(GuardInterface):
+    """ Guard resolved by name on first check """
+
+    def __init__(self, guard_manager: Optional[GuardManager], name: str):
+        self.__guard_manager = guard_manager
+        self.__name = name
+        self.__guard = None
+
+    @property
+    def name(self) -> str:
+        """ Gets guard name """
+        return self.__name
+
+    @property
+    def guard(self) -> GuardInterface:
+        """ Gets resolved guard """
+        if self.__guard is None:
+            guard = self.__guard_manager.get_guard(self.__name)
+            self.__guard = NullGuard() if guard is NullGuard else guard
+
+        return self.__guard
+
+    def is_satisfied(self, target: StatefulInterface) -> bool:
+        """ Checks guard condition """
+        return self.guard.is_satisfied(target)
+
+
+class LazyListener(ListenerInterface):
+    """ Listener resolved by name on first event """
+
+    def __init__(
+            self,
+            listener_manager: Optional[ListenerManager],
+            name: str
+    ):
+        self.__listener_manager = listener_manager
+        self.__name = name
+        self.__listener = None
+
+    @property
+    def name(self) -> str:
+        """ Gets listener name """
+        return self.__name
+
+    @property
+    def listener(self) -> ListenerInterface:
+        """ Gets resolved listener """
+        if self.__listener is None:
+            self.__listener = self.__listener_manager.get_listener(
+                self.__name
+            )
+
+        return self.__listener
+
+    def listen(self, event: Event):
+        """ Processes transition event """
+        self.listener.listen(event)
+
+    def listen_batch(self, events: Iterable[Event]):
+        """ Processes deferred transition events in order """
+        self.listener.listen_batch(events)
+
+
+class LazyGuardManager(GuardManager):
+    """ Guard manager giving guards resolved on first check
+
+        Reverse guard wraps lazy original one,
+        so both share one condition check per call.
+        Not added guards are null ones as in wrapped manager,
+        without wrapped manager all guards are kept by names
+    """
+
+    def __init__(self, guard_manager: Optional[GuardManager] = None):
+        super().__init__()
+        self.__guard_manager = guard_manager
+        self.__guards = {}
+
+    def get_guard(self, name: str) -> GuardInterface:
+        """ Gets lazy guard by name """
+        if name not in self.__guards:
+            self.__guards[name] = self.__get_lazy(name)
+
+        return self.__guards[name]
+
+    def has_guard(self, name: str) -> bool:
+        """ Checks guard is added by name """
+        return self.__guard_manager is None \
+            or self.__guard_manager.has_guard(name)
+
+    def __get_lazy(self, name: str) -> GuardInterface:
+        """ Gets lazy guard or null one if it is not added """
+        if name.startswith('!'):
+            guard = self.get_guard(name[1:])
+
+            return guard if guard is NullGuard else ReverseGuard(guard)
+
+        if not self.has_guard(name):
+            return NullGuard
+
+        return LazyGuard(self.__guard_manager, name)
+
+
+class LazyListenerManager(ListenerManager):
+    """ Listener manager giving listeners resolved on first event """
+
+    def __init__(self, listener_manager: Optional[ListenerManager] = None):
+        super().__init__()
+        self.__listener_manager = listener_manager
+        self.__listeners = {}
+
+    def get_listener(self, name: str) -> ListenerInterface:
+        """ Gets lazy listener by name """
+        if name not in self.__listeners:
+            self.__listeners[name] = LazyListener(
+                self.__listener_manager,
+                name
+            )
+
+        return self.__listeners[name]
+
+
+class MachineArtifact:
+    """ Compiled machines artifact
+
+        Holds validated states and transitions of machines with guards
+        and listeners by names, and hash of config compiled from
+    """
+
+    FORMAT: str = 'PyFSM'
+    VERSION: int = 3
+
+    def __init__(self, config_hash: str, machines: Dict[str, Machine]):
+        self.__config_hash = config_hash
+        self.__machines = machines
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__machines
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__machines)
+
+    @property
+    def config_hash(self) -> str:
+        """ Gets hash of config artifact is compiled from """
+        return self.__config_hash
+
+    @classmethod
+    def compile(
+            cls,
+            config: Dict[str, Dict[str, Any]],
+            machines: Dict[str, Tuple[List[State], TransitionTable]]
+    ) -> 'MachineArtifact':
+        """ Gets artifact of machines compiled by lazy managers """
+        return cls(
+            get_config_hash(config),
+            {
+                name: cls.__compile_machine(states, table)
+                for name, (states, table) in machines.items()
+            }
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'MachineArtifact':
+        """ Loads artifact by one read """
+        with open(path, 'rb') as file:
+            data = pickle.loads(file.read())
+
+        if data[:2] != (cls.FORMAT, cls.VERSION):
+            message = "File '{0}' is not artifact of version {1}".format(
+                path,
+                cls.VERSION
+            )
+            raise InvalidArtifactException(message)
+
+        return cls(data[2], data[3])
+
+    def dump(self, path: str):
+        """ Writes artifact atomically """
+        with open(path + '.tmp', 'wb') as file:
+            pickle.dump(
+                (
+                    self.FORMAT,
+                    self.VERSION,
+                    self.__config_hash,
+                    self.__machines
+                ),
+                file,
+                pickle.HIGHEST_PROTOCOL
+            )
+
+        os.replace(path + '.tmp', path)
+
+    def matches(self, config: Dict[str, Dict[str, Any]]) -> bool:
+        """ Checks artifact is compiled from config """
+        return self.__config_hash == get_config_hash(config)
+
+    def get_states(self, name: str) -> List[str]:
+        """ Gets machine states names """
+        return [state[0] for state in self.__machines[name][0]]
+
+    def get_transition_table(
+            self,
+            name: str,
+            guard_manager: GuardManager,
+            listener_manager: ListenerManager
+    ) -> TransitionTable:
+        """ Gets machine transitions table without validation
+
+            Guards and listeners are got from managers by names
+        """
+        states_config, transitions_config = self.__machines[name]
+        config = {
+            state: (state_type, parent)
+            for state, state_type, parent in states_config
+        }
+        created = {}
+        states = [
+            self.__get_state(config, created, state) for state in config
+        ]
+        managers = guard_manager, listener_manager
+        table = TransitionTable(TransitionFactory(None, None, None), [])
+
+        for transition in transitions_config:
+            table.add_transition(
+                self.__get_transition(states, transition, managers)
+            )
+
+        table.add_states(states)
+
+        return table
+
+    @classmethod
+    def __get_state(
+            cls,
+            config: Dict[str, Tuple[str, Optional[str]]],
+            states: Dict[str, State],
+            name: str
+    ) -> State:
+        """ Gets state created after its parent """
+        if name not in states:
+            state_type, parent = config[name]
+            states[name] = State(
+                intern(name),
+                state_type,
+                None if parent is None
+                else cls.__get_state(config, states, parent)
+            )
+
+        return states[name]
+
+    @classmethod
+    def __get_transition(
+            cls,
+            states: List[State],
+            config: Tuple[
+                int, int, Optional[str], tuple, tuple, tuple, Optional[float]
+            ],
+            managers: Tuple[GuardManager, ListenerManager]
+    ) -> Transition:
+        """ Gets transition with guards and listeners by names """
+        state_from, state_to, signal, guards, before, after, timeout = config
+        guard_manager, listener_manager = managers
+
+        return Transition(
+            states[state_from],
+            states[state_to],
+            signal,
+            [guard_manager.get_guard(name) for name in guards],
+            [listener_manager.get_listener(name) for name in before],
+            [listener_manager.get_listener(name) for name in after],
+            timeout
+        )
+
+    @classmethod
+    def __compile_machine(
+            cls,
+            states: List[State],
+            table: TransitionTable
+    ) -> Machine:
+        """ Gets machine states and transitions by names """
+        index = {state.name: position for position, state in enumerate(states)}
+
+        return (
+            tuple(
+                (
+                    state.name,
+                    state.type,
+                    None if state.parent is None else state.parent.name
+                )
+                for state in states
+            ),
+            tuple(
+                (
+                    index[transition.state_from.name],
+                    index[transition.state_to.name],
+                    transition.signal,
+                    tuple(get_name(guard) for guard in transition.guards),
+                    tuple(listener.name for listener in transition.before),
+                    tuple(listener.name for listener in transition.after),
+                    transition.timeout
+                )
+                for transition in table
+            )
+        )
+
+
+def resolve(transition_table: TransitionTable):
+    """ Resolves lazy guards and listeners of transitions table """
+    for transition in list(transition_table):
+        proxies = [guard for guard, _ in unwrap_guards(transition.guards)] \
+            + list(transition.before) + list(transition.after)
+
+        for proxy in proxies:
+            if isinstance(proxy, LazyGuard):
+                proxy.guard  # pylint: disable=pointless-statement
+            elif isinstance(proxy, LazyListener):
+                proxy.listener  # pylint: disable=pointless-statement
+
+
+def get_config_hash(config: Dict[str, Dict[str, Any]]) -> str:
+    """ Gets config hash """
+    return sha256(
+        json.dumps(config, sort_keys=True, default=repr).encode('utf-8')
+    ).hexdigest()
+
+
+def get_name(guard: GuardInterface) -> str:
+    """ Gets name of lazy or reversed lazy guard """
+    if isinstance(guard, ReverseGuard):
+        return '!' + get_name(guard.guard)
+
+    return guard.name
+
+
+class InvalidArtifactException(Exception):
+    """ Error if artifact format or version is not supported """
@@ -0,0 +1,189 @@
+"""
+    PyFSM.async_fsm
+
+    Asynchronous state machine module
+"""
+
+from abc import abstractmethod, ABCMeta
+from asyncio import gather
+from inspect import isawaitable
+from typing import Any, Dict, Optional
+from .entity import StatefulInterface
+from .guard import unwrap_guards
+from .state import StateInterface
+from .storage import StateStorageInterface, get_event, store
+from .transition import Transition, TransitionTable
+
+
+class AsyncFSMInterface(metaclass=ABCMeta):
+    """ Asynchronous State Machine Interface """
+
+    @abstractmethod
+    async def refresh(self, context: StatefulInterface):
+        """ Sets context to actually state """
+
+    @abstractmethod
+    async def signal(
+            self,
+            context: StatefulInterface,
+            signal: str,
+            params=()
+    ):
+        """ Sends signal """
+
+    @abstractmethod
+    async def is_signal(self, context: StatefulInterface, signal: str) -> bool:
+        """ Checks is signal transition possible """
+
+
+class AsyncFSM(AsyncFSMInterface):
+    """ Asynchronous state machine
+
+        Guards and listeners may be either regular or coroutine ones,
+        guards of one transition are awaited concurrently.
+        Storage is called synchronously
+    """
+
+    def __init__(
+            self,
+            transition_table: TransitionTable,
+            storage: Optional[StateStorageInterface] = None
+    ):
+        self.__transitions_table = transition_table
+        self.__storage = storage
+
+    async def refresh(self, context: StatefulInterface):
+        """ Sets context to actually state """
+        await self.__perform_path(context)
+        transition = await self.__get_transition(context)
+
+        while transition:
+            await self.__perform_transition(context, transition)
+            await self.__perform_path(context)
+            transition = await self.__get_transition(context)
+
+    async def signal(
+            self,
+            context: StatefulInterface,
+            signal: str,
+            params: Optional[Dict[str, Any]] = ()
+    ):
+        """ Sends signal """
+        await self.refresh(context)
+
+        transition = await self.__get_transition(context, signal)
+
+        if transition:
+            await self.__perform_transition(context, transition, params)
+            await self.refresh(context)
+
+    async def is_signal(self, context: StatefulInterface, signal: str) -> bool:
+        """ Checks is signal transition possible
+
+            Context is not changed and listeners are not called,
+            automatic transitions are only simulated
+        """
+        state = await self.__get_actual_state(context)
+
+        return bool(await self.__get_transition(context, signal, state))
+
+    async def __perform_path(self, context: StatefulInterface):
+        """ Performs automatic transitions always taken from context state """
+        path = self.__transitions_table.get_automatic_path(context.state)
+
+        for transition in path:
+            await self.__perform_transition(context, transition)
+
+    async def __get_actual_state(
+            self,
+            context: StatefulInterface
+    ) -> StateInterface:
+        """ Gets state context would be refreshed to """
+        state = context.state
+        visited = {state.name}
+        transition = await self.__get_transition(context, None, state)
+
+        while transition and transition.state_to.name not in visited:
+            state = transition.state_to
+            visited.add(state.name)
+            transition = await self.__get_transition(context, None, state)
+
+        return state
+
+    async def __get_transition(
+            self,
+            context: StatefulInterface,
+            signal: Optional[str] = None,
+            state: Optional[StateInterface] = None
+    ) -> Optional[Transition]:
+        """ Get possible transition """
+        candidates = self.__transitions_table.get_candidates(
+            context.state if state is None else state,
+            signal
+        )
+
+        results = {}
+
+        for transition in candidates:
+            if await self.__is_satisfied(context, transition, results):
+                return transition
+
+        return None
+
+    @classmethod
+    async def __is_satisfied(
+            cls,
+            context: StatefulInterface,
+            transition: Transition,
+            results: Dict[int, bool]
+    ) -> bool:
+        """ Checks all transition guards concurrently
+
+            Guards results are shared by sibling transitions in results
+        """
+        guards = unwrap_guards(transition.guards)
+        pending = {
+            id(guard): guard
+            for guard, _ in guards
+            if id(guard) not in results
+        }
+
+        if pending:
+            values = await gather(*(
+                cls.__resolve(guard.is_satisfied(context))
+                for guard in pending.values()
+            ))
+            results.update(zip(pending, map(bool, values)))
+
+        return all(
+            results[id(guard)] is not reverse
+            for guard, reverse in guards
+        )
+
+    async def __perform_transition(
+            self,
+            context: StatefulInterface,
+            transition: Transition,
+            params: Optional[Dict[str, Any]] = ()
+    ):
+        """ Makes transition """
+        event = get_event(context, transition, params, self.__storage)
+
+        if event is None:
+            return
+
+        for listener in transition.before:
+            await self.__resolve(listener.listen(event))
+
+        store(event, self.__storage)
+
+        for listener in transition.after:
+            await self.__resolve(listener.listen(event))
+
+    @classmethod
+    async def __resolve(cls, result: Any) -> Any:
+        """ Awaits coroutine result or passes regular one """
+        if isawaitable(result):
+            return await result
+
+        return result
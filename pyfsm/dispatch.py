@@ -0,0 +1,203 @@
+"""
+    PyFSM.dispatch
+
+    Deferred listeners dispatch module
+"""
+
+from queue import Empty, Full, Queue
+from threading import Lock, RLock, Thread, local
+from typing import Iterable, List, Optional, Tuple
+from .listener import Event, ListenerInterface
+
+
+Dispatch = Tuple[Iterable[ListenerInterface], Event]
+
+
+class ListenerDispatcher:
+    """ Deferred after listeners dispatcher
+
+        Events are queued by context stripe and passed to listeners
+        by batches, so events of one context reach each listener
+        in transitions order. Workers process queues in background,
+        without workers queues are processed by flush or when full.
+        Full queue blocks dispatching until worker processes it.
+        Listener can not wait for queue it may be the only consumer of,
+        so dispatching from worker to full queue or to full queue being
+        processed by calling thread raises overflow error
+    """
+
+    def __init__(
+            self,
+            workers: int = 1,
+            max_pending: int = 10000,
+            batch_size: int = 100
+    ):
+        if workers < 0:
+            message = "Workers count must not be negative, {0} given".format(
+                workers
+            )
+            raise ValueError(message)
+
+        self.__batch_size = batch_size
+        self.__queues = tuple(
+            Queue(max_pending) for _ in range(max(workers, 1))
+        )
+        self.__errors = []
+        self.__lock = Lock()
+        self.__draining = RLock()
+        self.__local = local()
+        self.__workers = [
+            Thread(target=self.__work, args=(queue,), daemon=True)
+            for queue in self.__queues[:workers]
+        ]
+
+        for worker in self.__workers:
+            worker.start()
+
+    def __enter__(self) -> 'ListenerDispatcher':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def dispatch(self, listeners: Iterable[ListenerInterface], event: Event):
+        """ Queues event for listeners """
+        queue = self.__queues[(id(event.context) >> 4) % len(self.__queues)]
+
+        try:
+            queue.put_nowait((listeners, event))
+        except Full:
+            self.__put_full(queue, (listeners, event))
+
+    def flush(self):
+        """ Waits queued events are processed
+
+            First error raised by listeners since last flush is reraised
+        """
+        for queue in self.__queues:
+            if self.__workers:
+                queue.join()
+            else:
+                with self.__draining:
+                    self.__drain(queue)
+
+        with self.__lock:
+            errors, self.__errors = self.__errors, []
+
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        """ Flushes queued events and stops workers """
+        try:
+            self.flush()
+        finally:
+            for queue in self.__queues[:len(self.__workers)]:
+                queue.put(None)
+
+            for worker in self.__workers:
+                worker.join()
+
+            self.__workers = []
+
+    def __put_full(self, queue: Queue, item: Dispatch):
+        """ Queues item to full queue """
+        processing = getattr(self.__local, 'queue', None)
+
+        if processing is not None and (self.__workers or processing is queue):
+            message = "Listeners queue of {0} events is full".format(
+                queue.maxsize
+            )
+            raise DispatcherOverflowException(message)
+
+        if self.__workers:
+            queue.put(item)
+        else:
+            self.__drain_put(queue, item)
+
+    def __drain_put(self, queue: Queue, item: Dispatch):
+        """ Processes full queue in calling thread until item is queued """
+        while True:
+            with self.__draining:
+                self.__drain(queue)
+
+            try:
+                queue.put_nowait(item)
+                return
+            except Full:
+                pass
+
+    def __work(self, queue: Queue):
+        """ Processes queue until stopped """
+        stopped = False
+
+        while not stopped:
+            items = self.__take(queue, [queue.get()])
+            stopped = items[-1] is None
+            self.__process(queue, items)
+
+    def __drain(self, queue: Queue):
+        """ Processes queued events in calling thread """
+        items = self.__take(queue, [])
+
+        while items:
+            self.__process(queue, items)
+            items = self.__take(queue, [])
+
+    def __take(
+            self,
+            queue: Queue,
+            items: List[Optional[Dispatch]]
+    ) -> List[Optional[Dispatch]]:
+        """ Takes available items up to batch size or stop mark """
+        while len(items) < self.__batch_size and None not in items[-1:]:
+            try:
+                items.append(queue.get_nowait())
+            except Empty:
+                break
+
+        return items
+
+    def __process(self, queue: Queue, items: List[Optional[Dispatch]]):
+        """ Passes events to listeners by batches """
+        processing = getattr(self.__local, 'queue', None)
+        self.__local.queue = queue
+
+        try:
+            for listener, events in self.__group(items):
+                self.__listen(listener, events)
+        finally:
+            self.__local.queue = processing
+
+        for _ in items:
+            queue.task_done()
+
+    def __listen(self, listener: ListenerInterface, events: List[Event]):
+        """ Passes events to listener, keeps its error """
+        try:
+            listener.listen_batch(events)
+        except Exception as error:  # pylint: disable=broad-except
+            with self.__lock:
+                self.__errors.append(error)
+
+    @classmethod
+    def __group(
+            cls,
+            items: List[Optional[Dispatch]]
+    ) -> Iterable[Tuple[ListenerInterface, List[Event]]]:
+        """ Groups events by listener keeping their order """
+        batches = {}
+
+        for item in filter(None, items):
+            listeners, event = item
+
+            for listener in listeners:
+                batches.setdefault(id(listener), (listener, []))[1].append(
+                    event
+                )
+
+        return batches.values()
+
+
+class DispatcherOverflowException(Exception):
+    """ Error if listener dispatches event to full queue it waits for """
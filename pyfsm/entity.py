@@ -6,6 +6,7 @@
 """
 
 from abc import abstractmethod, ABCMeta
+from typing import Any
 from .state import StateInterface
 
 
@@ -21,3 +22,26 @@ class StatefulInterface(metaclass=ABCMeta):
     @abstractmethod
     def state(self, state: StateInterface):
         """ Sets state """
+
+
+class IdentifiableInterface(StatefulInterface):
+    """ Identified state aware interface """
+
+    @property
+    @abstractmethod
+    def id(self) -> Any:
+        """ Gets identifier """
+
+
+class VersionedInterface(IdentifiableInterface):
+    """ Identified state aware interface with state version """
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """ Gets state version """
+
+    @version.setter
+    @abstractmethod
+    def version(self, version: int):
+        """ Sets state version """
@@ -5,140 +5,887 @@
 """
 
 from abc import abstractmethod, ABCMeta
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from threading import Lock
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from .analyzer import AnalysisReport, MachineAnalyzer
+from .artifact import (
+    LazyGuardManager,
+    LazyListenerManager,
+    MachineArtifact,
+    resolve
+)
+from .async_fsm import AsyncFSM, AsyncFSMInterface
+from .dispatch import ListenerDispatcher
 from .entity import StatefulInterface
 from .guard import GuardManager
 from .listener import Event, ListenerManager
-from .state import StateFactory, StateManager
+from .lock import StripedLock
+from .replay import Checkpoint, FoldContext, SignalRecord
+from .state import StateFactory, StateInterface, StateManager
+from .storage import StateStorageInterface, get_event, store
 from .transition import Transition, TransitionFactory, TransitionTable
 
 
+@dataclass()
+class Outcome:
+    """ Batch operation outcome for context """
+
+    STATUS_TRANSITIONED: ClassVar[str] = 'transitioned'
+    STATUS_REJECTED: ClassVar[str] = 'rejected'
+    STATUS_ERROR: ClassVar[str] = 'error'
+
+    __context: StatefulInterface
+    __status: str
+    __error: Optional[Exception] = None
+
+    @property
+    def context(self) -> StatefulInterface:
+        """ Gets target context """
+        return self.__context
+
+    @property
+    def status(self) -> str:
+        """ Gets outcome status """
+        return self.__status
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """ Gets error raised while processing context """
+        return self.__error
+
+
 class FSMInterface(metaclass=ABCMeta):
     """State Machine Interface"""
 
     @abstractmethod
-    def refresh(self, context: StatefulInterface):
-        """ Sets context to actually state """
+    def refresh(self, context: StatefulInterface) -> bool:
+        """ Sets context to actually state, checks it is transitioned """
 
     @abstractmethod
-    def signal(self, context: StatefulInterface, signal: str, params=()):
-        """ Sends signal """
+    def signal(
+            self,
+            context: StatefulInterface,
+            signal: str,
+            params=(),
+            expected_state: Optional[StateInterface] = None
+    ) -> bool:
+        """ Sends signal, checks context is transitioned """
 
     @abstractmethod
     def is_signal(self, context: StatefulInterface, signal: str) -> bool:
         """ Checks is signal transition possible """
 
+    @abstractmethod
+    def is_final(self, context: StatefulInterface) -> bool:
+        """ Checks context is in final state """
+
+    @property
+    @abstractmethod
+    def final_states(self) -> FrozenSet[str]:
+        """ Gets final states names """
+
+    @abstractmethod
+    def available_signals(self, context: StatefulInterface) -> List[str]:
+        """ Gets signals possible for context """
+
+    @abstractmethod
+    def refresh_many(
+            self,
+            contexts: Iterable[StatefulInterface]
+    ) -> List[Outcome]:
+        """ Sets contexts to actually states """
+
+    @abstractmethod
+    def replay(
+            self,
+            context: StatefulInterface,
+            signals: Iterable[SignalRecord],
+            silent: bool = False,
+            checkpoint: Optional[Checkpoint] = None
+    ) -> int:
+        """ Applies signals history to context """
+
+    @abstractmethod
+    def fold(
+            self,
+            state: StateInterface,
+            signals: Iterable[SignalRecord]
+    ) -> StateInterface:
+        """ Gets state signals history leads to """
+
+    @abstractmethod
+    def signal_many(
+            self,
+            contexts: Iterable[StatefulInterface],
+            signal: str,
+            params=()
+    ) -> List[Outcome]:
+        """ Sends signal to contexts """
+
 
 class FSM(FSMInterface):
-    """ State machine """
+    """ State machine
 
-    def __init__(self, name: str, transition_table: TransitionTable):
+        With dispatcher, after listeners are deferred to it,
+        before listeners are still called inline. Contexts in final
+        states are left as is without transitions table lookups
+    """
+
+    def __init__(
+            self,
+            name: str,
+            transition_table: TransitionTable,
+            locks: Optional[StripedLock] = None,
+            storage: Optional[StateStorageInterface] = None,
+            dispatcher: Optional[ListenerDispatcher] = None
+    ):
         self.__name = name
         self.__transitions_table = transition_table
+        self.__locks = locks
+        self.__storage = storage
+        self.__dispatcher = dispatcher
+        self.__finals = frozenset(
+            transition_table.get_states(StateInterface.TYPE_FINAL)
+        )
+
+    @property
+    def final_states(self) -> FrozenSet[str]:
+        """ Gets final states names """
+        return self.__finals
+
+    def refresh(self, context: StatefulInterface) -> bool:
+        """ Sets context to actually state, checks it is transitioned """
+        if self.is_final(context):
+            return False
+
+        if self.__locks is None:
+            return self.__refresh(context)
+
+        with self.__locks.get_lock(context):
+            return self.__refresh(context)
+
+    def signal(
+            self,
+            context: StatefulInterface,
+            signal: str,
+            params: Optional[Dict[str, Any]] = (),
+            expected_state: Optional[StateInterface] = None
+    ) -> bool:
+        """ Sends signal, checks context is transitioned
+
+            With expected state, fails instead of waiting for context lock
+            and if context is in other state
+        """
+        if self.is_final(context):
+            return False
+
+        if expected_state is not None:
+            return self.__compare_and_signal(
+                context,
+                signal,
+                params,
+                expected_state
+            )
+
+        if self.__locks is None:
+            return self.__signal(context, signal, params)
+
+        with self.__locks.get_lock(context):
+            return self.__signal(context, signal, params)
+
+    def is_signal(self, context: StatefulInterface, signal: str) -> bool:
+        """ Checks is signal transition possible
+
+            Context is not changed and listeners are not called,
+            automatic transitions are only simulated
+        """
+        return not self.is_final(context) and bool(
+            self.__find_transition(
+                context,
+                self.__transitions_table.get_candidates(
+                    self.__get_actual_state(context),
+                    signal
+                )
+            )
+        )
+
+    def available_signals(self, context: StatefulInterface) -> List[str]:
+        """ Gets signals possible for context
+
+            Context is not changed and listeners are not called,
+            automatic transitions are only simulated
+        """
+        if self.is_final(context):
+            return []
+
+        candidates = self.__transitions_table.get_signals_candidates(
+            self.__get_actual_state(context)
+        )
 
-    def refresh(self, context: StatefulInterface):
-        """ Sets context to actually state """
+        return [
+            signal for signal, transitions in candidates.items()
+            if signal is not None and
+            self.__find_transition(context, transitions)
+        ]
+
+    def is_final(self, context: StatefulInterface) -> bool:
+        """ Checks context is in final state """
+        return context.state.name in self.__finals
+
+    def refresh_many(
+            self,
+            contexts: Iterable[StatefulInterface]
+    ) -> List[Outcome]:
+        """ Sets contexts to actually states
+
+            Contexts in final states are rejected at once
+        """
+        outcomes = self.__get_outcomes(contexts)
+        moved = self.__refresh_many(outcomes, self.__get_active(outcomes))
+        self.__mark_transitioned(outcomes, moved)
+
+        return outcomes
+
+    def signal_many(
+            self,
+            contexts: Iterable[StatefulInterface],
+            signal: str,
+            params: Optional[Dict[str, Any]] = ()
+    ) -> List[Outcome]:
+        """ Sends signal to contexts
+
+            Contexts in final states are rejected at once
+        """
+        outcomes = self.__get_outcomes(contexts)
+        self.__refresh_many(outcomes, self.__get_active(outcomes))
+
+        moved = self.__step_many(
+            outcomes,
+            self.__get_active(outcomes),
+            signal,
+            params
+        )
+        self.__refresh_many(outcomes, moved)
+        self.__mark_transitioned(outcomes, moved)
+
+        return outcomes
+
+    def replay(
+            self,
+            context: StatefulInterface,
+            signals: Iterable[SignalRecord],
+            silent: bool = False,
+            checkpoint: Optional[Checkpoint] = None
+    ) -> int:
+        """ Applies signals history to context, gets signals count
+
+            Signals are pairs of signal and params consumed one by one,
+            context is refreshed only after transitions. Silent replay
+            sets states without listeners and storage
+        """
+        if self.__locks is None:
+            return self.__replay(context, signals, silent, checkpoint)
+
+        with self.__locks.get_lock(context):
+            return self.__replay(context, signals, silent, checkpoint)
+
+    def fold(
+            self,
+            state: StateInterface,
+            signals: Iterable[SignalRecord]
+    ) -> StateInterface:
+        """ Gets state signals history leads to
+
+            Guards get bare context with state only
+        """
+        context = FoldContext(state)
+        self.__replay(context, signals, True, None)
+
+        return context.state
+
+    def __replay(
+            self,
+            context: StatefulInterface,
+            signals: Iterable[SignalRecord],
+            silent: bool,
+            checkpoint: Optional[Checkpoint]
+    ) -> int:
+        """ Applies signals history to context """
+        refresh = self.__refresh_silently if silent else self.__refresh
+        position = 0 if checkpoint is None else checkpoint.start
+        refresh(context)
+
+        for signal, params in signals:
+            transition = self.__get_transition(context, signal)
+
+            if transition:
+                self.__apply(context, transition, params, silent)
+                refresh(context)
+
+            position += 1
+
+            if checkpoint is not None:
+                checkpoint.notify(context, position)
+
+        return position
+
+    def __apply(
+            self,
+            context: StatefulInterface,
+            transition: Transition,
+            params: Optional[Dict[str, Any]],
+            silent: bool
+    ):
+        """ Makes transition or only sets state silently """
+        if silent:
+            context.state = transition.state_to
+        else:
+            self.__perform_transition(context, transition, params)
+
+    def __refresh_silently(self, context: StatefulInterface):
+        """ Sets state of automatic transitions without listeners """
+        transition = True
+
+        while transition:
+            path = self.__transitions_table.get_automatic_path(context.state)
+
+            if path:
+                context.state = path[-1].state_to
+
+            transition = self.__get_transition(context)
+
+            if transition:
+                context.state = transition.state_to
+
+    def __get_transition(
+            self,
+            context: StatefulInterface,
+            signal: Optional[str] = None
+    ) -> Optional[Transition]:
+        """ Get possible transition """
+        if context.state.name in self.__finals:
+            return None
+
+        return next(
+            self.__transitions_table.find_transitions(context, signal),
+            None
+        )
+
+    def __refresh(self, context: StatefulInterface) -> bool:
+        """ Performs automatic transitions, checks any is performed """
+        performed = self.__perform_path(context)
         transition = self.__get_transition(context)
 
         while transition:
             self.__perform_transition(context, transition)
+            self.__perform_path(context)
             transition = self.__get_transition(context)
+            performed = True
 
-    def signal(
+        return performed
+
+    def __signal(
             self,
             context: StatefulInterface,
             signal: str,
             params: Optional[Dict[str, Any]] = ()
-    ):
-        """ Sends signal """
-        self.refresh(context)
+    ) -> bool:
+        """ Performs signal transition, checks any transition is performed """
+        performed = self.__refresh(context)
 
         transition = self.__get_transition(context, signal)
 
         if transition:
             self.__perform_transition(context, transition, params)
-            self.refresh(context)
+            self.__refresh(context)
 
-    def is_signal(self, context: StatefulInterface, signal: str) -> bool:
-        """ Checks is signal transition possible """
-        self.refresh(context)
+        return performed or bool(transition)
+
+    def __compare_and_signal(
+            self,
+            context: StatefulInterface,
+            signal: str,
+            params: Optional[Dict[str, Any]],
+            expected_state: StateInterface
+    ) -> bool:
+        """ Performs signal transition if context is free and in state """
+        lock = self.__locks.get_lock(context) if self.__locks else None
+
+        if lock is not None and not lock.acquire(blocking=False):
+            message = "Context is locked by other transition"
+            raise TransitionConflictException(message)
+
+        try:
+            if context.state != expected_state:
+                message = "Context is in state '{0}' instead of '{1}'".format(
+                    context.state,
+                    expected_state
+                )
+                raise TransitionConflictException(message)
+
+            return self.__signal(context, signal, params)
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def __perform_path(self, context: StatefulInterface) -> bool:
+        """ Performs automatic transitions always taken from context state """
+        path = self.__transitions_table.get_automatic_path(context.state)
+
+        for transition in path:
+            self.__perform_transition(context, transition)
 
-        return bool(self.__get_transition(context, signal))
+        return bool(path)
 
-    def __get_transition(
+    def __find_transition(
             self,
             context: StatefulInterface,
-            signal: Optional[str] = None
+            candidates: Iterable[Transition]
     ) -> Optional[Transition]:
-        """ Get possible transition """
+        """ Gets first candidate satisfied by context """
         return next(
-            self.__transitions_table.find_transitions(context, signal),
+            self.__transitions_table.filter_transitions(context, candidates),
             None
         )
 
+    def __get_actual_state(
+            self,
+            context: StatefulInterface
+    ) -> StateInterface:
+        """ Gets state context would be refreshed to """
+        state = context.state
+        visited = {state.name}
+        transition = self.__find_transition(
+            context,
+            self.__transitions_table.get_candidates(state)
+        )
+
+        while transition and transition.state_to.name not in visited:
+            state = transition.state_to
+            visited.add(state.name)
+            transition = self.__find_transition(
+                context,
+                self.__transitions_table.get_candidates(state)
+            )
+
+        return state
+
+    def __refresh_many(
+            self,
+            outcomes: List[Outcome],
+            positions: Iterable[int]
+    ) -> List[int]:
+        """ Performs automatic transitions, returns moved positions """
+        moved = []
+        positions = self.__step_many(outcomes, positions)
+
+        while positions:
+            moved.extend(positions)
+            positions = self.__step_many(outcomes, positions)
+
+        return moved
+
+    def __step_many(
+            self,
+            outcomes: List[Outcome],
+            positions: Iterable[int],
+            signal: Optional[str] = None,
+            params: Optional[Dict[str, Any]] = ()
+    ) -> List[int]:
+        """ Performs one transition per context, returns moved positions """
+        moved = []
+
+        for group in self.__group_by_state(outcomes, positions):
+            moved.extend(self.__perform_many(outcomes, group, signal, params))
+
+        return moved
+
+    def __perform_many(
+            self,
+            outcomes: List[Outcome],
+            group: Tuple[StateInterface, List[int]],
+            signal: Optional[str] = None,
+            params: Optional[Dict[str, Any]] = ()
+    ) -> Iterator[int]:
+        """ Performs first satisfied candidate for each context of group """
+        state, positions = group
+        candidates = self.__transitions_table.get_candidates(state, signal)
+
+        for position in positions if candidates else ():
+            context = outcomes[position].context
+
+            try:
+                if self.__perform_first(context, state, candidates, params):
+                    yield position
+            except Exception as error:  # pylint: disable=broad-except
+                outcomes[position] = Outcome(
+                    context,
+                    Outcome.STATUS_ERROR,
+                    error
+                )
+
+    def __perform_first(
+            self,
+            context: StatefulInterface,
+            state: StateInterface,
+            candidates: List[Transition],
+            params: Optional[Dict[str, Any]] = ()
+    ) -> bool:
+        """ Performs first satisfied candidate, checks it is performed """
+        if self.__locks is None:
+            return self.__perform_found(context, state, candidates, params)
+
+        with self.__locks.get_lock(context):
+            return self.__perform_found(context, state, candidates, params)
+
+    def __perform_found(
+            self,
+            context: StatefulInterface,
+            state: StateInterface,
+            candidates: List[Transition],
+            params: Optional[Dict[str, Any]] = ()
+    ) -> bool:
+        """ Performs first satisfied candidate if context is still in state
+
+            Context may be moved by earlier transition of the same batch
+        """
+        if context.state != state:
+            return False
+
+        transition = self.__find_transition(context, candidates)
+
+        if transition:
+            self.__perform_transition(context, transition, params)
+
+        return bool(transition)
+
+    def __get_active(self, outcomes: List[Outcome]) -> List[int]:
+        """ Gets positions of not failed contexts in not final states """
+        return [
+            position for position, outcome in enumerate(outcomes)
+            if outcome.status != Outcome.STATUS_ERROR
+            and not self.is_final(outcome.context)
+        ]
+
     @classmethod
-    def __perform_transition(
+    def __group_by_state(
             cls,
+            outcomes: List[Outcome],
+            positions: Iterable[int]
+    ) -> Iterable[Tuple[StateInterface, List[int]]]:
+        """ Groups contexts positions by current state """
+        groups = {}
+
+        for position in positions:
+            state = outcomes[position].context.state
+            groups.setdefault(state.name, (state, []))[1].append(position)
+
+        return groups.values()
+
+    @classmethod
+    def __get_outcomes(
+            cls,
+            contexts: Iterable[StatefulInterface]
+    ) -> List[Outcome]:
+        """ Gets initial outcomes for contexts """
+        return [
+            Outcome(context, Outcome.STATUS_REJECTED) for context in contexts
+        ]
+
+    @classmethod
+    def __mark_transitioned(
+            cls,
+            outcomes: List[Outcome],
+            positions: Iterable[int]
+    ):
+        """ Marks transitioned contexts outcomes """
+        for position in positions:
+            if outcomes[position].status != Outcome.STATUS_ERROR:
+                outcomes[position] = Outcome(
+                    outcomes[position].context,
+                    Outcome.STATUS_TRANSITIONED
+                )
+
+    def __perform_transition(
+            self,
             context: StatefulInterface,
             transition: Transition,
             params: Optional[Dict[str, Any]] = ()
     ):
         """ Makes transition """
-        event = Event(
-            context,
-            transition.state_from,
-            transition.state_to,
-            transition.signal,
-            params
-        )
+        event = get_event(context, transition, params, self.__storage)
+
+        if event is None:
+            return
 
         for listener in transition.before:
             listener.listen(event)
 
-        context.state = transition.state_to
+        store(event, self.__storage)
+
+        self.__notify_after(transition, event)
+
+    def __notify_after(self, transition: Transition, event: Event):
+        """ Calls after listeners or defers them to dispatcher """
+        if self.__dispatcher is not None and transition.after:
+            self.__dispatcher.dispatch(transition.after, event)
+            return
 
         for listener in transition.after:
             listener.listen(event)
 
 
 class FSMFactory:
-    """ State Machines Factory """
+    """ State Machines Factory
+
+        Config may be compiled artifact, its machines are not validated
+        and their guards and listeners are resolved on first use
+    """
 
     KEY_STATES: str = 'states'
     KEY_TRANSITIONS: str = 'transitions'
 
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
     def __init__(
             self,
-            config: Dict[str, Dict[str, Any]],
+            config: Union[Dict[str, Dict[str, Any]], MachineArtifact],
             guard_manager: GuardManager,
-            listener_manager: ListenerManager
+            listener_manager: ListenerManager,
+            locks: Optional[StripedLock] = None,
+            storage: Optional[StateStorageInterface] = None,
+            dispatcher: Optional[ListenerDispatcher] = None
     ):
         self.__config = config
         self.__guard_manager = guard_manager
         self.__listener_manager = listener_manager
+        self.__fsm_options = (locks, storage, dispatcher)
+        self.__tables = {}
+        self.__machines = {}
+        self.__lock = Lock()
 
     def get_fsm(self, context: StatefulInterface) -> FSMInterface:
         """ Gets FSM """
-        name = type(context).__name__
+        return self.__get_machine(FSM, type(context).__name__)
 
-        if name not in self.__config:
-            message = "FSM with name '{0}' is not found in config".format(name)
-            raise FSMNotFoundException(message)
+    def get_async_fsm(self, context: StatefulInterface) -> AsyncFSMInterface:
+        """ Gets asynchronous FSM with factory storage
 
-        config = self.__config[name]
+            Locks and dispatcher are not supported by asynchronous FSM
+        """
+        return self.__get_machine(AsyncFSM, type(context).__name__)
+
+    def analyze(
+            self,
+            name: str,
+            initial: Optional[Iterable[str]] = None
+    ) -> AnalysisReport:
+        """ Analyzes FSM by context type name started from initial states
+
+            Configured initial states are used by default
+        """
+        with self.__lock:
+            table = self.__get_compiled_table(name)
+
+        if initial is None:
+            initial = table.get_states(StateInterface.TYPE_INITIAL)
+
+        if not initial:
+            message = "There are no initial states of FSM '{0}'".format(name)
+            raise InvalidConfigException(message)
+
+        if isinstance(self.__config, MachineArtifact):
+            states = self.__config.get_states(name)
+        else:
+            states = self.__get_states_config(name, self.__config[name])
+
+        return MachineAnalyzer(table).analyze(initial, states)
+
+    def get_transition_table(self, name: str) -> TransitionTable:
+        """ Gets transitions table shared by FSMs of context type name """
+        with self.__lock:
+            return self.__get_compiled_table(name)
+
+    def get_final_states(self, name: str) -> FrozenSet[str]:
+        """ Gets final states names of FSM by context type name """
+        with self.__lock:
+            table = self.__get_compiled_table(name)
+
+        return frozenset(table.get_states(StateInterface.TYPE_FINAL))
+
+    def export_artifact(self) -> MachineArtifact:
+        """ Compiles all configured FSMs to artifact
+
+            Guards and listeners are stored by names,
+            artifact config is exported as is
+        """
+        if isinstance(self.__config, MachineArtifact):
+            return self.__config
+
+        return MachineArtifact.compile(
+            self.__config,
+            {
+                name: (
+                    self.__get_states(name, config),
+                    self.__build_table(
+                        name,
+                        LazyGuardManager(),
+                        LazyListenerManager()
+                    )
+                )
+                for name, config in self.__config.items()
+            }
+        )
+
+    def warmup(self, names: Optional[Iterable[str]] = None):
+        """ Compiles FSMs by context type names or all of them
+
+            Guards and listeners of FSMs are resolved at once instead
+            of first transition, already compiled lazy FSMs are resolved
+        """
+        for name in list(self.__config if names is None else names):
+            with self.__lock:
+                if name in self.__tables:
+                    resolve(self.__tables[name])
+                else:
+                    self.__get_compiled_table(name, False)
+
+            self.__get_machine(FSM, name)
+
+    def invalidate(self, name: Optional[str] = None):
+        """ Drops compiled FSM by context type name or all of them """
+        with self.__lock:
+            if name is None:
+                self.__tables.clear()
+                self.__machines.clear()
+                return
+
+            self.__tables.pop(name, None)
+            for key in [key for key in self.__machines if key[1] == name]:
+                del self.__machines[key]
+
+    def __get_machine(self, machine_type: type, name: str) -> Any:
+        """ Gets compiled machine of type """
+        try:
+            return self.__machines[machine_type, name]
+        except KeyError:
+            return self.__compile(machine_type, name)
+
+    def __compile(self, machine_type: type, name: str) -> Any:
+        """ Compiles machine once and caches it """
+        with self.__lock:
+            key = machine_type, name
+
+            if key not in self.__machines:
+                self.__machines[key] = self.__create(machine_type, name)
+
+            return self.__machines[key]
+
+    def __create(self, machine_type: type, name: str) -> Any:
+        """ Creates machine of type """
+        table = self.__get_compiled_table(name)
+
+        if machine_type is FSM:
+            return FSM(name, table, *self.__fsm_options)
+
+        locks, storage, dispatcher = self.__fsm_options
+
+        if locks is not None or dispatcher is not None:
+            message = "Asynchronous FSM '{0}' does not support locks " \
+                "and dispatcher".format(name)
+            raise InvalidConfigException(message)
+
+        return machine_type(table, storage)
+
+    def __get_compiled_table(
+            self,
+            name: str,
+            lazy: bool = True
+    ) -> TransitionTable:
+        """ Gets transitions table shared by machines of one name """
+        if name not in self.__tables:
+            if name not in self.__config:
+                message = "FSM with name '{0}' is not found in config".format(
+                    name
+                )
+                raise FSMNotFoundException(message)
+
+            self.__tables[name] = self.__build_table(
+                name,
+                *self.__get_managers(lazy)
+            )
+
+        return self.__tables[name]
+
+    def __get_managers(
+            self,
+            lazy: bool
+    ) -> Tuple[GuardManager, ListenerManager]:
+        """ Gets guard and listener managers
+
+            Lazy managers resolve guards and listeners on first use
+        """
+        if lazy:
+            return LazyGuardManager(self.__guard_manager), \
+                LazyListenerManager(self.__listener_manager)
+
+        return self.__guard_manager, self.__listener_manager
+
+    def __build_table(
+            self,
+            name: str,
+            guard_manager: GuardManager,
+            listener_manager: ListenerManager
+    ) -> TransitionTable:
+        """ Builds transitions table from config or artifact """
+        if isinstance(self.__config, MachineArtifact):
+            return self.__config.get_transition_table(
+                name,
+                guard_manager,
+                listener_manager
+            )
 
-        return FSM(name, self.__get_transition_table(name, config))
+        config = self.__config[name]
 
-    def __get_transition_table(self, name: str, config: Dict[str, Any]):
-        """ Gets transitions table """
         return TransitionTable(
             self.__get_transition_factory(
-                self.__get_states_config(name, config)
+                self.__get_states_config(name, config),
+                guard_manager,
+                listener_manager
             ),
-            self.__get_transitions_config(name, config)
+            self.__get_transitions_config(name, config),
+            self.__get_states(name, config)
         )
 
-    def __get_transition_factory(self, config: Dict[str, Dict[str, str]]):
+    def __get_states(
+            self,
+            name: str,
+            config: Dict[str, Dict[str, Any]]
+    ) -> List[StateInterface]:
+        """ Gets validated configured states """
+        states_config = self.__get_states_config(name, config)
+        state_factory = StateFactory(states_config)
+
+        return [state_factory.get_state(state) for state in states_config]
+
+    @classmethod
+    def __get_transition_factory(
+            cls,
+            config: Dict[str, Dict[str, str]],
+            guard_manager: GuardManager,
+            listener_manager: ListenerManager
+    ):
         """ Gets transition factory """
         state_factory = StateFactory(config)
         state_manager = StateManager()
@@ -148,8 +895,8 @@ class FSMFactory:
 
         return TransitionFactory(
             state_manager,
-            self.__guard_manager,
-            self.__listener_manager
+            guard_manager,
+            listener_manager
         )
 
     @classmethod
@@ -184,6 +931,10 @@ class FSMFactory:
         return self.__get_sub_config(name, config, self.KEY_STATES)
 
 
+class TransitionConflictException(Exception):
+    """ Error if context is locked or is not in expected state """
+
+
 class FSMNotFoundException(Exception):
     """ Error if FSM config is not found """
 
@@ -5,6 +5,8 @@
 """
 
 from abc import abstractmethod, ABCMeta
+from inspect import isawaitable
+from typing import Awaitable, Dict, Iterable, Optional, Tuple
 from .entity import StatefulInterface
 
 
@@ -30,9 +32,58 @@ class ReverseGuard(GuardInterface):
     def __init__(self, guard: GuardInterface):
         self.__guard = guard
 
+    @property
+    def guard(self) -> GuardInterface:
+        """ Gets reversed guard """
+        return self.__guard
+
     def is_satisfied(self, target: StatefulInterface) -> bool:
         """ Checks guard condition """
-        return not self.__guard.is_satisfied(target)
+        result = self.__guard.is_satisfied(target)
+
+        if isawaitable(result):
+            return self.__reverse(result)
+
+        return not result
+
+    @classmethod
+    async def __reverse(cls, result: Awaitable[bool]) -> bool:
+        """ Reverses coroutine guard condition """
+        return not await result
+
+
+class GuardChain:
+    """ Compiled guards conjunction
+
+        Stops on first unsatisfied guard, results shared by call are reused,
+        reverse guard reuses result of reversed one
+    """
+
+    def __init__(self, guards: Iterable[GuardInterface]):
+        self.__guards = unwrap_guards(guards)
+
+    def __call__(
+            self,
+            target: StatefulInterface,
+            results: Optional[Dict[int, bool]] = None
+    ) -> bool:
+        """ Checks all guards conditions """
+        if results is None:
+            results = {}
+
+        for guard, reverse in self.__guards:
+            key = id(guard)
+
+            if key not in results:
+                results[key] = bool(guard.is_satisfied(target))
+
+            if results[key] is reverse:
+                return False
+
+        return True
+
+    def __len__(self) -> int:
+        return len(self.__guards)
 
 
 class GuardManager:
@@ -45,9 +96,34 @@ class GuardManager:
         """ Gets guard by name """
         return self.__guards[name] if name in self.__guards else NullGuard
 
+    def has_guard(self, name: str) -> bool:
+        """ Checks guard is added by name """
+        return name in self.__guards
+
     def add_guard(self, guard: GuardInterface):
         """ Adds guard """
         name = type(guard).__name__
 
         self.__guards[name] = guard
         self.__guards['!' + name] = ReverseGuard(guard)
+
+
+def unwrap_guards(
+        guards: Iterable[GuardInterface]
+) -> Tuple[Tuple[GuardInterface, bool], ...]:
+    """ Gets original guards with reverse flags, null guards are dropped """
+    unwrapped = []
+
+    for guard in guards:
+        reverse = False
+
+        if guard is NullGuard or isinstance(guard, NullGuard):
+            continue
+
+        while isinstance(guard, ReverseGuard):
+            guard = guard.guard
+            reverse = not reverse
+
+        unwrapped.append((guard, reverse))
+
+    return tuple(unwrapped)
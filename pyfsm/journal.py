@@ -0,0 +1,390 @@
+"""
+    PyFSM.journal
+
+    Transitions journal module
+"""
+
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from mmap import mmap, ACCESS_READ
+import os
+import pickle
+from struct import Struct
+from threading import RLock, Timer, local
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from zlib import crc32
+from .entity import IdentifiableInterface
+from .listener import Event
+from .storage import AttributeStorage, StateStorageInterface
+
+
+Position = Tuple[int, int]
+
+
+@dataclass()
+class JournalRecord:
+    """ Journaled transition """
+
+    __context_id: Any
+    __state_from: str
+    __state_to: str
+    __signal: Optional[str]
+    __params: Any
+
+    @property
+    def context_id(self) -> Any:
+        """ Gets context identifier """
+        return self.__context_id
+
+    @property
+    def state_from(self) -> str:
+        """ Gets initial state name """
+        return self.__state_from
+
+    @property
+    def state_to(self) -> str:
+        """ Gets final state name """
+        return self.__state_to
+
+    @property
+    def signal(self) -> Optional[str]:
+        """ Gets transition signal """
+        return self.__signal
+
+    @property
+    def params(self) -> Any:
+        """ Gets extra parameters """
+        return self.__params
+
+
+class Journal:
+    """ Append only transitions journal
+
+        Records are framed by payload length, checksum and kind and
+        written to numbered segment files. Abort frame lists positions
+        of records whose transitions were not stored, readers skip them.
+        Records are synced to disk by groups, when batch size is reached
+        or after interval since first not synced record. Last segment is
+        truncated to its last complete record on opening
+    """
+
+    HEADER: Struct = Struct('<IIB')
+    KIND_RECORD: int = 0
+    KIND_ABORT: int = 1
+    SEGMENT_SUFFIX: str = '.log'
+    SNAPSHOT_NAME: str = 'snapshot'
+
+    def __init__(
+            self,
+            directory: str,
+            sync_interval: float = 1.0,
+            sync_batch: int = 1000,
+            segment_size: int = 64 * 1024 * 1024
+    ):
+        os.makedirs(directory, exist_ok=True)
+
+        self.__directory = directory
+        self.__limits = (sync_interval, sync_batch, segment_size)
+        self.__lock = RLock()
+        self.__timer = None
+        self.__pending = 0
+        self.__segment = max(get_segments(directory), default=0)
+        path = self.__get_path(self.__segment)
+
+        if os.path.exists(path):
+            os.truncate(path, get_valid_size(path))
+
+        # pylint: disable=consider-using-with
+        self.__file = open(path, 'ab')
+
+    def __enter__(self) -> 'Journal':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def position(self) -> Position:
+        """ Gets segment and offset of next record """
+        with self.__lock:
+            return self.__segment, self.__file.tell()
+
+    def append(self, record: JournalRecord) -> Position:
+        """ Appends record, gets its position """
+        return self.__write(
+            self.KIND_RECORD,
+            (
+                record.context_id,
+                record.state_from,
+                record.state_to,
+                record.signal,
+                record.params
+            )
+        )
+
+    def abort(self, positions: Iterable[Position]):
+        """ Marks records by positions as not applied """
+        self.__write(self.KIND_ABORT, tuple(positions))
+
+    def sync(self):
+        """ Writes appended records to disk """
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+
+            if self.__pending and not self.__file.closed:
+                self.__file.flush()
+                os.fsync(self.__file.fileno())
+                self.__pending = 0
+
+    def snapshot(self, states: Dict[Any, str]):
+        """ Stores contexts states reached at current position """
+        with self.__lock:
+            self.sync()
+            path = os.path.join(self.__directory, self.SNAPSHOT_NAME)
+
+            with open(path + '.tmp', 'wb') as file:
+                pickle.dump(
+                    (self.position, states),
+                    file,
+                    pickle.HIGHEST_PROTOCOL
+                )
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(path + '.tmp', path)
+
+    def close(self):
+        """ Syncs and closes journal """
+        with self.__lock:
+            self.sync()
+            self.__file.close()
+
+    def __write(self, kind: int, data: Any) -> Position:
+        """ Appends frame, gets its position """
+        payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        frame = self.HEADER.pack(len(payload), crc32(payload), kind) \
+            + payload
+
+        with self.__lock:
+            if self.__file.tell() >= self.__limits[2]:
+                self.__rotate()
+
+            position = self.__segment, self.__file.tell()
+            self.__file.write(frame)
+            self.__pending += 1
+
+            if self.__pending >= self.__limits[1]:
+                self.sync()
+            elif self.__timer is None:
+                self.__timer = Timer(self.__limits[0], self.sync)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+        return position
+
+    def __rotate(self):
+        """ Starts next segment """
+        self.sync()
+        self.__file.close()
+        self.__segment += 1
+        # pylint: disable=consider-using-with
+        self.__file = open(self.__get_path(self.__segment), 'ab')
+
+    def __get_path(self, segment: int) -> str:
+        """ Gets segment file path """
+        return os.path.join(
+            self.__directory,
+            '{0:020d}{1}'.format(segment, self.SEGMENT_SUFFIX)
+        )
+
+
+class JournalReader:
+    """ Transitions journal reader """
+
+    def __init__(self, directory: str):
+        self.__directory = directory
+
+    def replay(self) -> Dict[Any, str]:
+        """ Gets contexts states from last snapshot and journal tail """
+        position, states = self.__load_snapshot()
+
+        for record in self.records(position):
+            states[record.context_id] = record.state_to
+
+        return states
+
+    def records(self, position: Position = (0, 0)) -> Iterator[JournalRecord]:
+        """ Reads records from position
+
+            Reading of segment stops at first incomplete or damaged
+            frame, aborted records are skipped
+        """
+        aborted = {
+            record
+            for _, records in self.__read(position, Journal.KIND_ABORT)
+            for record in records
+        }
+
+        for record, data in self.__read(position, Journal.KIND_RECORD):
+            if record not in aborted:
+                yield JournalRecord(*data)
+
+    def __read(
+            self,
+            position: Position,
+            kind: int
+    ) -> Iterator[Tuple[Position, Any]]:
+        """ Reads frames of kind from position """
+        first, offset = position
+
+        for segment in get_segments(self.__directory):
+            if segment >= first:
+                yield from self.__read_segment(
+                    segment,
+                    offset if segment == first else 0,
+                    kind
+                )
+
+    def __read_segment(
+            self,
+            segment: int,
+            offset: int,
+            kind: int
+    ) -> Iterator[Tuple[Position, Any]]:
+        """ Reads segment frames of kind by memory mapping """
+        path = os.path.join(
+            self.__directory,
+            '{0:020d}{1}'.format(segment, Journal.SEGMENT_SUFFIX)
+        )
+
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+
+            if size > offset:
+                with mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+                    for start, frame_kind, payload in read_frames(
+                            data,
+                            offset,
+                            size
+                    ):
+                        if frame_kind == kind:
+                            yield (segment, start), pickle.loads(data[payload])
+
+    def __load_snapshot(self) -> Tuple[Position, Dict[Any, str]]:
+        """ Loads last snapshot """
+        path = os.path.join(self.__directory, Journal.SNAPSHOT_NAME)
+
+        if not os.path.exists(path):
+            return (0, 0), {}
+
+        with open(path, 'rb') as file:
+            position, states = pickle.load(file)
+
+        return position, dict(states)
+
+
+class JournalStorage(StateStorageInterface):
+    """ Write ahead journaling storage
+
+        Transition is journaled before inner storage stores it and
+        aborted in journal if inner storage rejects it. Inside batch
+        transitions of its thread are aborted if inner storage batch
+        fails, so rejected transitions are not replayed
+    """
+
+    def __init__(
+            self,
+            journal: Journal,
+            storage: Optional[StateStorageInterface] = None
+    ):
+        self.__journal = journal
+        self.__storage = storage or AttributeStorage()
+        self.__batch = local()
+
+    def store(self, event: Event):
+        """ Journals transition and sets final state to context """
+        context: IdentifiableInterface = event.context
+        position = self.__journal.append(
+            JournalRecord(
+                context.id,
+                event.state_from.name,
+                event.state_to.name,
+                event.signal,
+                event.params
+            )
+        )
+
+        try:
+            self.__storage.store(event)
+        except Exception:
+            self.__journal.abort([position])
+            raise
+
+        positions = getattr(self.__batch, 'positions', None)
+
+        if positions is not None:
+            positions.append(position)
+
+    @contextmanager
+    def batch(self) -> Iterator['JournalStorage']:
+        """ Runs inner storage batch, aborts its transitions on error """
+        batch = getattr(self.__storage, 'batch', nullcontext)
+        self.__batch.positions = []
+
+        try:
+            with batch():
+                yield self
+        except Exception:
+            if self.__batch.positions:
+                self.__journal.abort(self.__batch.positions)
+            raise
+        finally:
+            self.__batch.positions = None
+
+
+def read_frames(
+        data: mmap,
+        offset: int,
+        size: int
+) -> Iterator[Tuple[int, int, slice]]:
+    """ Reads frames offsets, kinds and payloads slices
+
+        Reading stops at first incomplete or damaged frame
+    """
+    header = Journal.HEADER
+
+    while offset + header.size <= size:
+        length, checksum, kind = header.unpack_from(data, offset)
+        payload = slice(offset + header.size, offset + header.size + length)
+
+        if payload.stop > size or crc32(data[payload]) != checksum:
+            return
+
+        yield offset, kind, payload
+        offset = payload.stop
+
+
+def get_valid_size(path: str) -> int:
+    """ Gets size of segment complete frames """
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+
+        if not size:
+            return 0
+
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+            return max(
+                (payload.stop for _, _, payload in read_frames(data, 0, size)),
+                default=0
+            )
+
+
+def get_segments(directory: str) -> List[int]:
+    """ Gets sorted journal segments numbers """
+    return sorted(
+        int(name[:-len(Journal.SEGMENT_SUFFIX)])
+        for name in os.listdir(directory)
+        if name.endswith(Journal.SEGMENT_SUFFIX)
+    )
@@ -5,21 +5,42 @@
 """
 
 from abc import abstractmethod, ABCMeta
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 from .entity import StatefulInterface
 from .state import StateInterface
 
 
-@dataclass()
 class Event:
     """ Transition event """
 
-    __context: StatefulInterface
-    __state_from: StateInterface
-    __state_to: StateInterface
-    __signal: str
-    __params: Dict[str, Any]
+    __slots__ = (
+        '__context',
+        '__state_from',
+        '__state_to',
+        '__signal',
+        '__params'
+    )
+
+    def __init__(
+            self,
+            context: StatefulInterface,
+            state_from: StateInterface,
+            state_to: StateInterface,
+            signal: Optional[str],
+            params: Dict[str, Any]
+    ):
+        self.__context = context
+        self.__state_from = state_from
+        self.__state_to = state_to
+        self.__signal = signal
+        self.__params = params
+
+    def __repr__(self) -> str:
+        return 'Event({0!r}, {1!r}, {2!r})'.format(
+            self.__state_from,
+            self.__state_to,
+            self.__signal
+        )
 
     @property
     def context(self) -> StatefulInterface:
@@ -54,6 +75,14 @@ class ListenerInterface(metaclass=ABCMeta):
     def listen(self, event: Event):
         """ Processes transition event """
 
+    def listen_batch(self, events: Iterable[Event]):
+        """ Processes deferred transition events in order
+
+            Listeners may override it to handle events in bulk
+        """
+        for event in events:
+            self.listen(event)
+
 
 class ListenerManager:
     """ Listener manager """
@@ -69,9 +98,13 @@ class ListenerManager:
 
         return self.__listeners[name]
 
-    def add_listener(self, listener: ListenerInterface):
-        """ Adds listener """
-        self.__listeners[type(listener).__name__] = listener
+    def add_listener(
+            self,
+            listener: ListenerInterface,
+            name: Optional[str] = None
+    ):
+        """ Adds listener by name, listener class name is used by default """
+        self.__listeners[name or type(listener).__name__] = listener
 
 
 class ListenerNotFoundException(Exception):
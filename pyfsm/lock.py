@@ -0,0 +1,29 @@
+"""
+    PyFSM.lock
+
+    Contexts locking module
+"""
+
+from threading import RLock
+from .entity import StatefulInterface
+
+
+class StripedLock:
+    """ Reentrant locks striped by context identity
+
+        Contexts sharing a stripe are serialized together,
+        other contexts proceed in parallel
+    """
+
+    def __init__(self, stripes: int = 64):
+        if stripes < 1:
+            message = "Stripes count must be positive, {0} given".format(
+                stripes
+            )
+            raise ValueError(message)
+
+        self.__locks = tuple(RLock() for _ in range(stripes))
+
+    def get_lock(self, context: StatefulInterface) -> RLock:
+        """ Gets lock of context stripe """
+        return self.__locks[(id(context) >> 4) % len(self.__locks)]
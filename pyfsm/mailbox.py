@@ -0,0 +1,125 @@
+"""
+    PyFSM.mailbox
+
+    Run-to-completion signals queue module
+"""
+
+from collections import deque
+from threading import Lock
+from typing import Any, Dict, List, Optional
+from .entity import StatefulInterface
+from .fsm import FSMInterface
+
+
+class Mailbox:
+    """ Signals queue of state machine
+
+        Posted signals are sent one by one in posting order, signal
+        posted while other one is processed, e.g. by listener, waits
+        for it instead of nested sending. Only one thread sends signals
+        at a time, signals posted by others are sent by it. Pending
+        duplicate signal for context may be coalesced with the queued
+        one, which gets the latest params
+    """
+
+    def __init__(
+            self,
+            fsm: FSMInterface,
+            max_depth: int = 10000,
+            coalesce: bool = False
+    ):
+        if max_depth < 1:
+            message = "Mailbox depth must be positive, {0} given".format(
+                max_depth
+            )
+            raise ValueError(message)
+
+        self.__fsm = fsm
+        self.__options = max_depth, coalesce
+        self.__queue = deque()
+        self.__pending = {}
+        self.__lock = Lock()
+        self.__running = False
+
+    def __len__(self) -> int:
+        return len(self.__queue)
+
+    def post(
+            self,
+            context: StatefulInterface,
+            signal: str,
+            params: Optional[Dict[str, Any]] = ()
+    ):
+        """ Queues signal and sends queued signals if nobody does it """
+        with self.__lock:
+            self.__put(context, signal, params)
+
+            if self.__running:
+                return
+
+            self.__running = True
+
+        self.__run()
+
+    def drain(self):
+        """ Sends queued signals if nobody does it """
+        with self.__lock:
+            if self.__running or not self.__queue:
+                return
+
+            self.__running = True
+
+        self.__run()
+
+    def __put(
+            self,
+            context: StatefulInterface,
+            signal: str,
+            params: Optional[Dict[str, Any]]
+    ):
+        """ Queues signal or updates params of pending duplicate """
+        max_depth, coalesce = self.__options
+        key = id(context), signal
+
+        if coalesce and key in self.__pending:
+            self.__pending[key][2] = params
+            return
+
+        if len(self.__queue) >= max_depth:
+            message = "Mailbox depth {0} is exceeded".format(max_depth)
+            raise MailboxOverflowException(message)
+
+        entry = [context, signal, params]
+        self.__queue.append(entry)
+
+        if coalesce:
+            self.__pending[key] = entry
+
+    def __run(self):
+        """ Sends queued signals until queue is empty """
+        try:
+            entry = self.__take()
+
+            while entry is not None:
+                self.__fsm.signal(*entry)
+                entry = self.__take()
+        except BaseException:
+            with self.__lock:
+                self.__running = False
+            raise
+
+    def __take(self) -> Optional[List[Any]]:
+        """ Takes next queued signal or stops running if there is none """
+        with self.__lock:
+            if not self.__queue:
+                self.__running = False
+                return None
+
+            entry = self.__queue.popleft()
+            self.__pending.pop((id(entry[0]), entry[1]), None)
+
+            return entry
+
+
+class MailboxOverflowException(Exception):
+    """ Error if signal is posted to full mailbox """
@@ -0,0 +1,418 @@
+"""
+    PyFSM.metrics
+
+    Instrumentation module
+"""
+
+from bisect import bisect_left
+import os
+from threading import Lock
+from time import perf_counter
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple
+)
+from .entity import StatefulInterface
+from .fsm import FSMInterface, Outcome
+from .replay import Checkpoint, SignalRecord
+from .guard import GuardInterface, GuardManager, NullGuard, ReverseGuard
+from .listener import Event, ListenerInterface, ListenerManager
+from .state import StateInterface
+from .storage import AttributeStorage, StateStorageInterface
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """ Latency histogram with cumulative buckets in seconds """
+
+    BUCKETS: Tuple[float, ...] = (
+        1e-06, 5e-06, 1e-05, 5e-05, 1e-04, 5e-04,
+        1e-03, 5e-03, 1e-02, 5e-02, 1e-01, 1.0
+    )
+
+    def __init__(self):
+        self.__counts = [0] * (len(self.BUCKETS) + 1)
+        self.__sum = 0.0
+
+    def observe(self, seconds: float):
+        """ Adds observed duration """
+        self.__counts[bisect_left(self.BUCKETS, seconds)] += 1
+        self.__sum += seconds
+
+    def export(self, name: str, labels: Labels) -> Iterator[str]:
+        """ Gets histogram lines in Prometheus text format """
+        total = 0
+        bounds = [repr(bound) for bound in self.BUCKETS] + ['+Inf']
+
+        for bound, count in zip(bounds, self.__counts):
+            total += count
+            yield '{0}_bucket{1} {2}'.format(
+                name,
+                format_labels(labels + (('le', bound),)),
+                total
+            )
+
+        labels = format_labels(labels)
+
+        yield '{0}_sum{1} {2!r}'.format(name, labels, self.__sum)
+        yield '{0}_count{1} {2}'.format(name, labels, total)
+
+
+class Metrics:
+    """ Metrics registry
+
+        Collects counters and latency histograms by name and labels
+        and exports them in Prometheus text format
+    """
+
+    def __init__(self):
+        self.__counters = {}
+        self.__histograms = {}
+        self.__lock = Lock()
+
+    def increment(self, name: str, labels: Labels = ()):
+        """ Increments counter """
+        with self.__lock:
+            key = name, labels
+            self.__counters[key] = self.__counters.get(key, 0) + 1
+
+    def observe(self, name: str, labels: Labels, seconds: float):
+        """ Adds duration to histogram """
+        with self.__lock:
+            key = name, labels
+
+            if key not in self.__histograms:
+                self.__histograms[key] = Histogram()
+
+            self.__histograms[key].observe(seconds)
+
+    def export(self) -> str:
+        """ Gets metrics in Prometheus text format """
+        with self.__lock:
+            lines = []
+
+            for name, metrics in self.__group(self.__counters):
+                lines.append('# TYPE {0} counter'.format(name))
+                lines.extend(
+                    '{0}{1} {2}'.format(name, format_labels(labels), value)
+                    for labels, value in metrics
+                )
+
+            for name, metrics in self.__group(self.__histograms):
+                lines.append('# TYPE {0} histogram'.format(name))
+                for labels, histogram in metrics:
+                    lines.extend(histogram.export(name, labels))
+
+            return ''.join(line + '\n' for line in lines)
+
+    def write(self, path: str):
+        """ Writes exported metrics to file atomically """
+        with open(path + '.tmp', 'w', encoding='utf-8') as file:
+            file.write(self.export())
+
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def __group(
+            cls,
+            metrics: Dict[Tuple[str, Labels], Any]
+    ) -> Iterable[Tuple[str, List[Tuple[Labels, Any]]]]:
+        """ Groups metrics by name """
+        groups = {}
+
+        for (name, labels), value in sorted(metrics.items()):
+            groups.setdefault(name, []).append((labels, value))
+
+        return groups.items()
+
+
+class MeasuredGuard(GuardInterface):
+    """ Guard measuring condition checking time """
+
+    def __init__(self, guard: GuardInterface, name: str, metrics: Metrics):
+        self.__guard = guard
+        self.__labels = (('guard', name),)
+        self.__metrics = metrics
+
+    def is_satisfied(self, target: StatefulInterface) -> bool:
+        """ Checks guard condition """
+        start = perf_counter()
+
+        try:
+            return self.__guard.is_satisfied(target)
+        finally:
+            self.__metrics.observe(
+                'pyfsm_guard_seconds',
+                self.__labels,
+                perf_counter() - start
+            )
+
+
+class MeasuredListener(ListenerInterface):
+    """ Listener measuring event processing time
+
+        Deferred events batch is passed to original listener as is
+        and measured as whole
+    """
+
+    def __init__(
+            self,
+            listener: ListenerInterface,
+            name: str,
+            metrics: Metrics
+    ):
+        self.__listener = listener
+        self.__labels = (('listener', name),)
+        self.__metrics = metrics
+
+    def listen(self, event: Event):
+        """ Processes transition event """
+        start = perf_counter()
+
+        try:
+            self.__listener.listen(event)
+        finally:
+            self.__observe('pyfsm_listener_seconds', start)
+
+    def listen_batch(self, events: Iterable[Event]):
+        """ Processes deferred transition events in order """
+        start = perf_counter()
+
+        try:
+            self.__listener.listen_batch(events)
+        finally:
+            self.__observe('pyfsm_listener_batch_seconds', start)
+
+    def __observe(self, metric: str, start: float):
+        """ Observes processing time since start """
+        self.__metrics.observe(
+            metric,
+            self.__labels,
+            perf_counter() - start
+        )
+
+
+class MeasuredGuardManager(GuardManager):
+    """ Guard manager measuring guards by registered names
+
+        Reverse guard wraps measured original one,
+        so both share one condition check per call
+    """
+
+    def __init__(self, guard_manager: GuardManager, metrics: Metrics):
+        super().__init__()
+        self.__guard_manager = guard_manager
+        self.__metrics = metrics
+        self.__guards = {}
+
+    def get_guard(self, name: str) -> GuardInterface:
+        """ Gets measured guard by name """
+        if name not in self.__guards:
+            self.__guards[name] = self.__measure(name)
+
+        return self.__guards[name]
+
+    def has_guard(self, name: str) -> bool:
+        """ Checks guard is added by name """
+        return self.__guard_manager.has_guard(name)
+
+    def add_guard(self, guard: GuardInterface):
+        """ Adds guard """
+        self.__guard_manager.add_guard(guard)
+        self.__guards.clear()
+
+    def __measure(self, name: str) -> GuardInterface:
+        """ Wraps named guard """
+        if name.startswith('!'):
+            guard = self.get_guard(name[1:])
+
+            return guard if guard is NullGuard else ReverseGuard(guard)
+
+        guard = self.__guard_manager.get_guard(name)
+
+        if guard is NullGuard or isinstance(guard, NullGuard):
+            return guard
+
+        return MeasuredGuard(guard, name, self.__metrics)
+
+
+class MeasuredListenerManager(ListenerManager):
+    """ Listener manager measuring listeners by registered names """
+
+    def __init__(self, listener_manager: ListenerManager, metrics: Metrics):
+        super().__init__()
+        self.__listener_manager = listener_manager
+        self.__metrics = metrics
+
+    def get_listener(self, name: str) -> ListenerInterface:
+        """ Gets measured listener by name """
+        return MeasuredListener(
+            self.__listener_manager.get_listener(name),
+            name,
+            self.__metrics
+        )
+
+    def add_listener(
+            self,
+            listener: ListenerInterface,
+            name: Optional[str] = None
+    ):
+        """ Adds listener by name, listener class name is used by default """
+        self.__listener_manager.add_listener(listener, name)
+
+
+class MeasuredStorage(StateStorageInterface):
+    """ Storage counting performed transitions """
+
+    def __init__(
+            self,
+            metrics: Metrics,
+            storage: Optional[StateStorageInterface] = None
+    ):
+        self.__metrics = metrics
+        self.__storage = storage or AttributeStorage()
+
+    def store(self, event: Event):
+        """ Counts transition and sets final state to context """
+        self.__storage.store(event)
+        self.__metrics.increment(
+            'pyfsm_transitions_total',
+            (
+                ('fsm', type(event.context).__name__),
+                ('from', event.state_from.name),
+                ('to', event.state_to.name),
+                ('signal', event.signal or '')
+            )
+        )
+
+
+class MeasuredFSM(FSMInterface):
+    """ State machine measuring refresh and signal time """
+
+    def __init__(self, fsm: FSMInterface, name: str, metrics: Metrics):
+        self.__fsm = fsm
+        self.__name = name
+        self.__metrics = metrics
+
+    def refresh(self, context: StatefulInterface) -> bool:
+        """ Sets context to actually state, checks it is transitioned """
+        start = perf_counter()
+
+        try:
+            return self.__fsm.refresh(context)
+        finally:
+            self.__observe('pyfsm_refresh_seconds', None, start)
+
+    def signal(
+            self,
+            context: StatefulInterface,
+            signal: str,
+            params: Optional[Dict[str, Any]] = (),
+            expected_state: Optional[StateInterface] = None
+    ) -> bool:
+        """ Sends signal, checks context is transitioned """
+        start = perf_counter()
+
+        try:
+            return self.__fsm.signal(context, signal, params, expected_state)
+        finally:
+            self.__observe('pyfsm_signal_seconds', signal, start)
+
+    def is_signal(self, context: StatefulInterface, signal: str) -> bool:
+        """ Checks is signal transition possible """
+        return self.__fsm.is_signal(context, signal)
+
+    def available_signals(self, context: StatefulInterface) -> List[str]:
+        """ Gets signals possible for context """
+        return self.__fsm.available_signals(context)
+
+    def is_final(self, context: StatefulInterface) -> bool:
+        """ Checks context is in final state """
+        return self.__fsm.is_final(context)
+
+    @property
+    def final_states(self) -> FrozenSet[str]:
+        """ Gets final states names """
+        return self.__fsm.final_states
+
+    def refresh_many(
+            self,
+            contexts: Iterable[StatefulInterface]
+    ) -> List[Outcome]:
+        """ Sets contexts to actually states """
+        start = perf_counter()
+
+        try:
+            return self.__fsm.refresh_many(contexts)
+        finally:
+            self.__observe('pyfsm_refresh_many_seconds', None, start)
+
+    def signal_many(
+            self,
+            contexts: Iterable[StatefulInterface],
+            signal: str,
+            params: Optional[Dict[str, Any]] = ()
+    ) -> List[Outcome]:
+        """ Sends signal to contexts """
+        start = perf_counter()
+
+        try:
+            return self.__fsm.signal_many(contexts, signal, params)
+        finally:
+            self.__observe('pyfsm_signal_many_seconds', signal, start)
+
+    def replay(
+            self,
+            context: StatefulInterface,
+            signals: Iterable[SignalRecord],
+            silent: bool = False,
+            checkpoint: Optional[Checkpoint] = None
+    ) -> int:
+        """ Applies signals history to context """
+        start = perf_counter()
+
+        try:
+            return self.__fsm.replay(context, signals, silent, checkpoint)
+        finally:
+            self.__observe('pyfsm_replay_seconds', None, start)
+
+    def fold(
+            self,
+            state: StateInterface,
+            signals: Iterable[SignalRecord]
+    ) -> StateInterface:
+        """ Gets state signals history leads to """
+        return self.__fsm.fold(state, signals)
+
+    def __observe(self, metric: str, signal: Optional[str], start: float):
+        """ Adds operation duration """
+        labels = (('fsm', self.__name),)
+
+        if signal is not None:
+            labels += (('signal', signal),)
+
+        self.__metrics.observe(metric, labels, perf_counter() - start)
+
+
+def format_labels(labels: Labels) -> str:
+    """ Formats labels in Prometheus text format """
+    if not labels:
+        return ''
+
+    return '{' + ','.join(
+        '{0}="{1}"'.format(
+            name,
+            value.replace('\\', '\\\\')
+            .replace('"', '\\"')
+            .replace('\n', '\\n')
+        )
+        for name, value in labels
+    ) + '}'
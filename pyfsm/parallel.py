@@ -0,0 +1,307 @@
+"""
+    PyFSM.parallel
+
+    Parallel bulk transitions module
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from os import cpu_count
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple
+)
+from .entity import StatefulInterface
+from .fsm import FSMFactory, Outcome
+from .guard import GuardManager
+from .listener import Event, ListenerInterface, ListenerManager
+from .state import StateFactory, StateInterface
+
+
+EventRecord = Tuple[str, str, str, str, Optional[str], Dict[str, Any]]
+
+
+@dataclass()
+class ParallelResult:
+    """ Parallel transitions result for context
+
+        Events are records of listener calls in order: listener name,
+        context state at call, initial state, final state, signal, params
+    """
+
+    __status: str
+    __state: Optional[str]
+    __events: List[EventRecord]
+    __error: Optional[Exception] = None
+
+    @property
+    def status(self) -> str:
+        """ Gets outcome status """
+        return self.__status
+
+    @property
+    def state(self) -> Optional[str]:
+        """ Gets reached state name """
+        return self.__state
+
+    @property
+    def events(self) -> List[EventRecord]:
+        """ Gets listener calls records """
+        return self.__events
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """ Gets error raised while processing context """
+        return self.__error
+
+
+class EventRecorder(ListenerInterface):
+    """ Listener recording events instead of processing """
+
+    def __init__(self, name: str, records: Dict[int, List[EventRecord]]):
+        self.__name = name
+        self.__records = records
+
+    def listen(self, event: Event):
+        """ Records transition event """
+        self.__records.setdefault(id(event.context), []).append((
+            self.__name,
+            event.context.state.name,
+            event.state_from.name,
+            event.state_to.name,
+            event.signal,
+            event.params
+        ))
+
+
+class FSMWorker:
+    """ Worker process side of parallel runner """
+
+    __factory: Optional[FSMFactory] = None
+    __records: Dict[int, List[EventRecord]] = {}
+
+    @classmethod
+    def initialize(
+            cls,
+            config: Dict[str, Dict[str, Any]],
+            guard_types: Sequence[type],
+            listener_types: Sequence[type]
+    ):
+        """ Compiles machines definition once per process """
+        guard_manager = GuardManager()
+        for guard_type in guard_types:
+            guard_manager.add_guard(guard_type())
+
+        listener_manager = ListenerManager()
+        for listener_type in listener_types:
+            name = listener_type.__name__
+            listener_manager.add_listener(
+                EventRecorder(name, cls.__records),
+                name
+            )
+
+        cls.__factory = FSMFactory(config, guard_manager, listener_manager)
+
+    @classmethod
+    def run(
+            cls,
+            contexts: List[StatefulInterface],
+            signal: Optional[str],
+            params: Optional[Dict[str, Any]]
+    ) -> List[ParallelResult]:
+        """ Performs transitions for contexts chunk """
+        groups = {}
+        for position, context in enumerate(contexts):
+            groups.setdefault(type(context).__name__, []).append(position)
+
+        results = [None] * len(contexts)
+        for positions in groups.values():
+            chunk = [contexts[position] for position in positions]
+            for position, outcome in zip(
+                    positions,
+                    cls.__run_group(chunk, signal, params)
+            ):
+                results[position] = cls.__get_result(outcome)
+
+        return results
+
+    @classmethod
+    def __run_group(
+            cls,
+            contexts: List[StatefulInterface],
+            signal: Optional[str],
+            params: Optional[Dict[str, Any]]
+    ) -> List[Outcome]:
+        """ Performs transitions for contexts of one machine """
+        fsm = cls.__factory.get_fsm(contexts[0])
+
+        if signal is None:
+            return fsm.refresh_many(contexts)
+
+        return fsm.signal_many(contexts, signal, params)
+
+    @classmethod
+    def __get_result(cls, outcome: Outcome) -> ParallelResult:
+        """ Converts outcome to result """
+        return ParallelResult(
+            outcome.status,
+            outcome.context.state.name,
+            cls.__records.pop(id(outcome.context), []),
+            outcome.error
+        )
+
+
+class ParallelFSMRunner:
+    """ Runs bulk transitions in worker processes
+
+        Contexts, params, guards and listeners types must be picklable,
+        guards and listeners types must be constructed without arguments.
+        Listeners are not called by workers, they are recorded
+        to be replayed by apply
+    """
+
+    def __init__(
+            self,
+            config: Dict[str, Dict[str, Any]],
+            guard_types: Iterable[type],
+            listener_types: Iterable[type],
+            workers: Optional[int] = None,
+            chunk_size: int = 1000
+    ):
+        self.__config = config
+        self.__definition = (config, tuple(guard_types), tuple(listener_types))
+        self.__workers = workers or cpu_count() or 1
+        self.__chunk_size = chunk_size
+        self.__executor = None
+        self.__states = {}
+
+    def __enter__(self) -> 'ParallelFSMRunner':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def refresh(
+            self,
+            contexts: Iterable[StatefulInterface]
+    ) -> Iterator[ParallelResult]:
+        """ Sets contexts copies to actually states in workers """
+        return self.__run(contexts, None, ())
+
+    def signal(
+            self,
+            contexts: Iterable[StatefulInterface],
+            signal: str,
+            params: Optional[Dict[str, Any]] = ()
+    ) -> Iterator[ParallelResult]:
+        """ Sends signal to contexts copies in workers """
+        return self.__run(contexts, signal, params)
+
+    def apply(
+            self,
+            contexts: Iterable[StatefulInterface],
+            results: Iterable[ParallelResult],
+            listener_manager: Optional[ListenerManager] = None
+    ):
+        """ Sets reached states to contexts, replaying recorded events """
+        for context, result in zip(contexts, results):
+            name = type(context).__name__
+
+            if listener_manager is not None:
+                self.__replay(context, result.events, listener_manager)
+
+            if result.state is not None:
+                context.state = self.__get_state(name, result.state)
+
+    def close(self):
+        """ Stops worker processes """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __run(
+            self,
+            contexts: Iterable[StatefulInterface],
+            signal: Optional[str],
+            params: Optional[Dict[str, Any]]
+    ) -> Iterator[ParallelResult]:
+        """ Streams contexts chunks through workers
+
+            At most two chunks per worker are in flight
+        """
+        executor = self.__get_executor()
+        pending = deque()
+
+        for chunk in self.__get_chunks(contexts):
+            pending.append(
+                executor.submit(FSMWorker.run, chunk, signal, params)
+            )
+
+            if len(pending) >= 2 * self.__workers:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        """ Gets worker processes pool shipped with machines definition """
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(
+                self.__workers,
+                initializer=FSMWorker.initialize,
+                initargs=self.__definition
+            )
+
+        return self.__executor
+
+    def __get_chunks(
+            self,
+            contexts: Iterable[StatefulInterface]
+    ) -> Iterator[List[StatefulInterface]]:
+        """ Splits contexts to chunks """
+        contexts = iter(contexts)
+        chunk = list(islice(contexts, self.__chunk_size))
+
+        while chunk:
+            yield chunk
+            chunk = list(islice(contexts, self.__chunk_size))
+
+    def __replay(
+            self,
+            context: StatefulInterface,
+            events: List[EventRecord],
+            listener_manager: ListenerManager
+    ):
+        """ Calls listeners for recorded events """
+        name = type(context).__name__
+
+        for listener, state, state_from, state_to, signal, params in events:
+            context.state = self.__get_state(name, state)
+            listener_manager.get_listener(listener).listen(
+                Event(
+                    context,
+                    self.__get_state(name, state_from),
+                    self.__get_state(name, state_to),
+                    signal,
+                    params
+                )
+            )
+
+    def __get_state(self, machine: str, name: str) -> StateInterface:
+        """ Gets state of machine by name """
+        key = machine, name
+
+        if key not in self.__states:
+            self.__states[key] = StateFactory(
+                self.__config[machine][FSMFactory.KEY_STATES]
+            ).get_state(name)
+
+        return self.__states[key]
@@ -0,0 +1,62 @@
+"""
+    PyFSM.replay
+
+    Signals history replay module
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+from .entity import StatefulInterface
+from .state import StateInterface
+
+
+SignalRecord = Tuple[str, Optional[Dict[str, Any]]]
+
+
+class Checkpoint:
+    """ Replay checkpoint
+
+        Callback gets context and count of consumed signals every
+        given count of signals. Replay resumed from checkpoint
+        starts counting from its position
+    """
+
+    def __init__(
+            self,
+            callback: Callable[[StatefulInterface, int], Any],
+            every: int = 1000,
+            start: int = 0
+    ):
+        if every < 1:
+            message = "Checkpoint interval must be positive, {0} given"
+            raise ValueError(message.format(every))
+
+        self.__callback = callback
+        self.__every = every
+        self.__start = start
+
+    @property
+    def start(self) -> int:
+        """ Gets position replay is started from """
+        return self.__start
+
+    def notify(self, context: StatefulInterface, position: int):
+        """ Calls callback if checkpoint is reached """
+        if not position % self.__every:
+            self.__callback(context, position)
+
+
+class FoldContext(StatefulInterface):
+    """ Bare context folding signals history """
+
+    def __init__(self, state: StateInterface):
+        self.__state = state
+
+    @property
+    def state(self) -> StateInterface:
+        """ Gets state """
+        return self.__state
+
+    @state.setter
+    def state(self, state: StateInterface):
+        """ Sets state """
+        self.__state = state
@@ -0,0 +1,241 @@
+"""
+    PyFSM.runtime
+
+    Sharded entities runtime module
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+from queue import Queue
+from threading import Lock, Thread
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+from .entity import IdentifiableInterface
+from .fsm import FSMInterface
+
+
+Command = Tuple[Any, str, Optional[Dict[str, Any]], Future, float]
+
+
+@dataclass()
+class ShardStats:
+    """ Shard queue and latency statistics
+
+        Latency is time from signal queuing to its processing end
+    """
+
+    __pending: int
+    __processed: int
+    __errors: int
+    __latency_total: float
+    __latency_max: float
+
+    @property
+    def pending(self) -> int:
+        """ Gets queued signals count """
+        return self.__pending
+
+    @property
+    def processed(self) -> int:
+        """ Gets processed signals count """
+        return self.__processed
+
+    @property
+    def errors(self) -> int:
+        """ Gets failed signals count """
+        return self.__errors
+
+    @property
+    def latency_mean(self) -> float:
+        """ Gets mean signal latency in seconds """
+        if not self.__processed:
+            return 0.0
+
+        return self.__latency_total / self.__processed
+
+    @property
+    def latency_max(self) -> float:
+        """ Gets max signal latency in seconds """
+        return self.__latency_max
+
+
+class Shard:
+    """ Entities shard processing their signals in own thread """
+
+    def __init__(self, fsm: FSMInterface, max_pending: int):
+        self.__fsm = fsm
+        self.__entities = {}
+        self.__queue = Queue(max_pending)
+        self.__counters = [0, 0, 0.0, 0.0]
+        self.__lock = Lock()
+        self.__worker = Thread(target=self.__work, daemon=True)
+        self.__worker.start()
+
+    def __len__(self) -> int:
+        return len(self.__entities)
+
+    @property
+    def stats(self) -> ShardStats:
+        """ Gets shard statistics """
+        with self.__lock:
+            return ShardStats(self.__queue.qsize(), *self.__counters)
+
+    def add(self, entity: IdentifiableInterface):
+        """ Adds entity to shard """
+        self.__entities[entity.id] = entity
+
+    def remove(self, entity_id: Any) -> Optional[IdentifiableInterface]:
+        """ Removes entity from shard """
+        return self.__entities.pop(entity_id, None)
+
+    def get(self, entity_id: Any) -> Optional[IdentifiableInterface]:
+        """ Gets entity of shard """
+        return self.__entities.get(entity_id)
+
+    def put(
+            self,
+            entity_id: Any,
+            signal: str,
+            params: Optional[Dict[str, Any]]
+    ) -> Future:
+        """ Queues entity signal, blocks while queue is full """
+        future = Future()
+        self.__queue.put((entity_id, signal, params, future, perf_counter()))
+
+        return future
+
+    def flush(self):
+        """ Waits queued signals are processed """
+        self.__queue.join()
+
+    def close(self):
+        """ Processes queued signals and stops worker """
+        self.__queue.put(None)
+        self.__worker.join()
+
+    def __work(self):
+        """ Processes queue until stopped """
+        command = self.__queue.get()
+
+        while command is not None:
+            self.__process(*command)
+            self.__queue.task_done()
+            command = self.__queue.get()
+
+        self.__queue.task_done()
+
+    def __process(
+            self,
+            entity_id: Any,
+            signal: str,
+            params: Optional[Dict[str, Any]],
+            future: Future,
+            queued: float
+    ):
+        """ Sends signal to entity and resolves future by its state """
+        try:
+            entity = self.__get_entity(entity_id)
+            self.__fsm.signal(entity, signal, params)
+        except Exception as error:  # pylint: disable=broad-except
+            self.__count(queued, 1)
+            future.set_exception(error)
+        else:
+            self.__count(queued, 0)
+            future.set_result(entity.state)
+
+    def __get_entity(self, entity_id: Any) -> IdentifiableInterface:
+        """ Gets shard entity by identifier """
+        if entity_id not in self.__entities:
+            message = "Entity '{0}' is not found".format(entity_id)
+            raise EntityNotFoundException(message)
+
+        return self.__entities[entity_id]
+
+    def __count(self, queued: float, errors: int):
+        """ Adds processed signal to counters """
+        latency = perf_counter() - queued
+
+        with self.__lock:
+            self.__counters[0] += 1
+            self.__counters[1] += errors
+            self.__counters[2] += latency
+            self.__counters[3] = max(self.__counters[3], latency)
+
+
+class ShardedRuntime:
+    """ Runtime owning entities in shards by identifier hash
+
+        Each shard has own queue and worker thread, so signals of
+        different shards entities are processed concurrently, and
+        signals of one entity are processed one by one in order.
+        Machine needs no locks as entity is never shared by shards
+    """
+
+    def __init__(
+            self,
+            fsm: FSMInterface,
+            shards: int = 4,
+            max_pending: int = 10000
+    ):
+        if shards < 1:
+            message = "Shards count must be positive, {0} given".format(
+                shards
+            )
+            raise ValueError(message)
+
+        self.__shards = tuple(Shard(fsm, max_pending) for _ in range(shards))
+
+    def __enter__(self) -> 'ShardedRuntime':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.__shards)
+
+    def add(self, entity: IdentifiableInterface):
+        """ Adds entity to its shard """
+        self.__get_shard(entity.id).add(entity)
+
+    def remove(self, entity_id: Any) -> Optional[IdentifiableInterface]:
+        """ Removes entity by identifier """
+        return self.__get_shard(entity_id).remove(entity_id)
+
+    def get(self, entity_id: Any) -> Optional[IdentifiableInterface]:
+        """ Gets entity by identifier """
+        return self.__get_shard(entity_id).get(entity_id)
+
+    def signal(
+            self,
+            entity_id: Any,
+            signal: str,
+            params: Optional[Dict[str, Any]] = ()
+    ) -> Future:
+        """ Queues signal to entity
+
+            Future gets entity state after signal or processing error
+        """
+        return self.__get_shard(entity_id).put(entity_id, signal, params)
+
+    def stats(self) -> List[ShardStats]:
+        """ Gets statistics by shards """
+        return [shard.stats for shard in self.__shards]
+
+    def flush(self):
+        """ Waits queued signals are processed """
+        for shard in self.__shards:
+            shard.flush()
+
+    def close(self):
+        """ Processes queued signals and stops workers """
+        for shard in self.__shards:
+            shard.close()
+
+    def __get_shard(self, entity_id: Any) -> Shard:
+        """ Gets shard of entity identifier """
+        return self.__shards[hash(entity_id) % len(self.__shards)]
+
+
+class EntityNotFoundException(Exception):
+    """ Error if entity is not added to runtime """
@@ -6,14 +6,18 @@
 """
 
 from abc import abstractmethod, ABCMeta
-from dataclasses import dataclass
-from typing import Tuple, Dict
+from typing import Any, Dict, Optional, Set, Tuple
 
 
 class StateInterface(metaclass=ABCMeta):
     """ State interface """
 
+    __slots__ = ()
+
     TYPE_REGULAR: str = 'regular'
+    TYPE_COMPOSITE: str = 'composite'
+    TYPE_INITIAL: str = 'initial'
+    TYPE_FINAL: str = 'final'
 
     @abstractmethod
     def name(self) -> str:
@@ -23,26 +27,53 @@ class StateInterface(metaclass=ABCMeta):
     def type(self) -> str:
         """ Gets state type """
 
+    @property
+    @abstractmethod
+    def parent(self) -> Optional['StateInterface']:
+        """ Gets composite parent state """
+
     @abstractmethod
     def __str__(self) -> str:
         """ Converts state to string """
 
 
-@dataclass
 class State(StateInterface):
-    """ State """
+    """ State
 
-    __name: str
-    __type: str = StateInterface.TYPE_REGULAR
+        Read only, equal to any state with the same name
+    """
 
-    def __eq__(self, other: StateInterface) -> bool:
-        return self.__name == other.name
+    __slots__ = ('__name', '__type', '__parent', '__hash')
 
-    def __ne__(self, other: StateInterface) -> bool:
-        return self.__name != other.name
+    def __init__(
+            self,
+            name: str,
+            state_type: str = StateInterface.TYPE_REGULAR,
+            parent: Optional[StateInterface] = None
+    ):
+        self.__name = name
+        self.__type = state_type
+        self.__parent = parent
+        self.__hash = hash(name)
 
-    def __hash__(self):
-        return self.name
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
+        if type(other) is State:  # pylint: disable=unidiomatic-typecheck
+            # pylint: disable-next=protected-access
+            return self.__name == other.__name
+
+        if isinstance(other, StateInterface):
+            return self.__name == other.name
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __repr__(self) -> str:
+        return 'State({0!r}, {1!r})'.format(self.__name, self.__type)
 
     def __str__(self) -> str:
         """ Converts state to string """
@@ -58,14 +89,27 @@ class State(StateInterface):
         """ Gets state type """
         return self.__type
 
+    @property
+    def parent(self) -> Optional[StateInterface]:
+        """ Gets composite parent state """
+        return self.__parent
+
 
 class StateFactory:
-    """ States factory """
+    """ States factory
+
+        State may have composite parent state, final state
+        has no outgoing transitions
+    """
 
     KEY_TYPE: str = 'type'
+    KEY_PARENT: str = 'parent'
 
     __available_types: Tuple = (
-        State.TYPE_REGULAR
+        State.TYPE_REGULAR,
+        State.TYPE_COMPOSITE,
+        State.TYPE_INITIAL,
+        State.TYPE_FINAL
     )
 
     def __init__(self, config: Dict[str, Dict[str, str]]):
@@ -73,6 +117,10 @@ class StateFactory:
 
     def get_state(self, name: str) -> State:
         """ Gets state """
+        return self.__get_state(name, frozenset())
+
+    def __get_state(self, name: str, children: Set[str]) -> State:
+        """ Gets state with parents, children are checked for cycle """
         if name not in self.__config:
             message = "State '{0}' is not found in config".format(name)
             raise IncorrectStateConfigException(message)
@@ -89,7 +137,37 @@ class StateFactory:
             )
             raise IncorrectStateTypeException(message)
 
-        return State(name, state_type)
+        return State(
+            name,
+            state_type,
+            self.__get_parent(name, state_config, children | {name})
+        )
+
+    def __get_parent(
+            self,
+            name: str,
+            config: Dict[str, str],
+            children: Set[str]
+    ) -> Optional[State]:
+        """ Gets composite parent state """
+        if self.KEY_PARENT not in config:
+            return None
+
+        if config[self.KEY_PARENT] in children:
+            message = "States parents cycle through state '{0}'".format(
+                config[self.KEY_PARENT]
+            )
+            raise IncorrectStateConfigException(message)
+
+        parent = self.__get_state(config[self.KEY_PARENT], children)
+
+        if parent.type != State.TYPE_COMPOSITE:
+            message = "Parent state '{0}' of state '{1}' is not composite"
+            raise IncorrectStateTypeException(
+                message.format(parent.name, name)
+            )
+
+        return parent
 
 
 class StateManager:
@@ -0,0 +1,243 @@
+"""
+    PyFSM.storage
+
+    States storage module
+"""
+
+from abc import abstractmethod, ABCMeta
+from contextlib import contextmanager
+from threading import local
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .entity import StatefulInterface, VersionedInterface
+from .listener import Event
+from .state import StateInterface
+from .transition import Transition
+
+
+class StateStorageInterface(metaclass=ABCMeta):
+    """ State storage interface """
+
+    @abstractmethod
+    def store(self, event: Event):
+        """ Sets transition final state to context """
+
+
+class AttributeStorage(StateStorageInterface):
+    """ Context attribute storage """
+
+    def store(self, event: Event):
+        """ Sets transition final state to context """
+        event.context.state = event.state_to
+
+
+class SQLStateStorage(StateStorageInterface):
+    """ Optimistic concurrency SQL storage
+
+        Row is updated only if it still has state and version
+        the context was loaded with, context version is increased.
+        Inside batch writes of its thread are collected per context
+        and flushed in one transaction by bulk statements of up to
+        batch size rows, writes of other threads are not collected.
+        Bulk statement updates only rows matching their own conditions,
+        so its rowcount is count of rows not changed concurrently
+    """
+
+    BATCH_SIZE: int = 100
+
+    def __init__(
+            self,
+            connection: Any,
+            table: str,
+            columns: Tuple[str, str, str] = ('id', 'state', 'version'),
+            placeholder: str = '?'
+    ):
+        id_column, state_column, version_column = columns
+        self.__connection = connection
+        self.__query = (
+            'UPDATE {0} SET {2} = CASE {1}{{0}} END, {3} = {3} + 1 '
+            'WHERE {{1}}'
+        ).format(table, id_column, state_column, version_column)
+        self.__parts = (
+            ' WHEN {0} THEN {0}'.format(placeholder),
+            '({0} = {3} AND {1} = {3} AND {2} = {3})'.format(
+                id_column,
+                state_column,
+                version_column,
+                placeholder
+            )
+        )
+        self.__queries = {}
+        self.__batch = local()
+
+    def store(self, event: Event):
+        """ Sets transition final state to context """
+        context = event.context
+
+        pending = getattr(self.__batch, 'pending', None)
+
+        if pending is None:
+            self.__write([self.__get_row(context, event.state_to)])
+            context.state = event.state_to
+            context.version += 1
+            return
+
+        pending.setdefault(
+            id(context),
+            [context, context.state, context.version]
+        )
+        context.state = event.state_to
+
+    @contextmanager
+    def batch(self) -> Iterator['SQLStateStorage']:
+        """ Collects writes of current thread and flushes them on exit """
+        self.__batch.pending = {}
+
+        try:
+            yield self
+            self.flush()
+        except Exception:
+            self.__restore(self.__batch.pending.values())
+            raise
+        finally:
+            self.__batch.pending = None
+
+    def flush(self):
+        """ Writes collected states by bulk statements """
+        if not getattr(self.__batch, 'pending', None):
+            return
+
+        pending = list(self.__batch.pending.values())
+        self.__batch.pending = {}
+
+        try:
+            self.__write([
+                self.__get_row(context, context.state, state, version)
+                for context, state, version in pending
+            ])
+        except Exception:
+            self.__restore(pending)
+            raise
+
+        for context, _, version in pending:
+            context.version = version + 1
+
+    @classmethod
+    def __restore(cls, pending: Iterable[List[Any]]):
+        """ Restores contexts states not written """
+        for context, state, version in pending:
+            context.state = state
+            context.version = version
+
+    def __write(self, rows: List[Tuple[Any, ...]]):
+        """ Executes conditional update for rows
+
+            Transaction is rolled back on conflict or any error
+        """
+        if not rows:
+            return
+
+        try:
+            updated = self.__execute(rows)
+
+            if updated != len(rows):
+                message = "{0} of {1} states are changed concurrently".format(
+                    len(rows) - updated,
+                    len(rows)
+                )
+                raise StaleStateException(message)
+
+            self.__connection.commit()
+        except Exception:
+            self.__connection.rollback()
+            raise
+
+    def __execute(self, rows: List[Tuple[Any, ...]]) -> int:
+        """ Executes conditional update, gets updated rows count """
+        cursor = self.__connection.cursor()
+        updated = 0
+
+        try:
+            for start in range(0, len(rows), self.BATCH_SIZE):
+                chunk = rows[start:start + self.BATCH_SIZE]
+                cursor.execute(
+                    self.__get_query(len(chunk)),
+                    self.__get_params(chunk)
+                )
+                updated += cursor.rowcount
+        finally:
+            cursor.close()
+
+        return updated
+
+    def __get_query(self, count: int) -> str:
+        """ Gets conditional update statement of rows count """
+        if count not in self.__queries:
+            when, condition = self.__parts
+            self.__queries[count] = self.__query.format(
+                when * count,
+                ' OR '.join([condition] * count)
+            )
+
+        return self.__queries[count]
+
+    @classmethod
+    def __get_params(cls, rows: List[Tuple[Any, ...]]) -> List[Any]:
+        """ Gets bulk statement parameters, new states go first """
+        params = [value for row in rows for value in row[:2]]
+
+        for identifier, _, state, version in rows:
+            params += identifier, state, version
+
+        return params
+
+    @classmethod
+    def __get_row(
+            cls,
+            context: VersionedInterface,
+            state_to: StateInterface,
+            state_from: Optional[StateInterface] = None,
+            version: Optional[int] = None
+    ) -> Tuple[Any, ...]:
+        """ Gets identifier, final state, loaded state and version """
+        return (
+            context.id,
+            state_to.name,
+            (context.state if state_from is None else state_from).name,
+            context.version if version is None else version
+        )
+
+
+def get_event(
+        context: StatefulInterface,
+        transition: Transition,
+        params: Optional[Dict[str, Any]],
+        storage: Optional[StateStorageInterface]
+) -> Optional[Event]:
+    """ Gets transition event
+
+        Without listeners and storage event is not needed,
+        so final state is set to context at once
+    """
+    if not transition.has_listeners and storage is None:
+        context.state = transition.state_to
+        return None
+
+    return Event(
+        context,
+        context.state,
+        transition.state_to,
+        transition.signal,
+        params
+    )
+
+
+def store(event: Event, storage: Optional[StateStorageInterface]):
+    """ Sets transition final state to context by storage if any """
+    if storage is None:
+        event.context.state = event.state_to
+    else:
+        storage.store(event)
+
+
+class StaleStateException(Exception):
+    """ Error if stored state is changed concurrently """
@@ -0,0 +1,244 @@
+"""
+    PyFSM.timer
+
+    Timed transitions scheduler module
+"""
+
+from heapq import heappop, heappush
+from itertools import count
+from threading import Lock
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple
+)
+from .entity import StatefulInterface
+from .fsm import FSMInterface, Outcome
+from .replay import Checkpoint, SignalRecord
+from .state import State, StateInterface
+from .transition import TransitionTable
+
+
+Expired = Tuple[StatefulInterface, str, str]
+
+
+class TimedFSM(FSMInterface):
+    """ State machine sending signals of timed transitions
+
+        Timers of state are armed again on each transition to it through
+        machine, including self transitions, or when context is tracked
+        in other state, and are dropped when context leaves it.
+        Timers are kept in deadlines heap and dropped ones are skipped
+        when expired, so tick takes time of expired timers only.
+        Context stays tracked until it comes to state without timers
+        or is cancelled
+    """
+
+    def __init__(
+            self,
+            fsm: FSMInterface,
+            transition_table: TransitionTable,
+            clock: Callable[[], float] = monotonic
+    ):
+        self.__fsm = fsm
+        self.__clock = clock
+        self.__timeouts = self.__get_timeouts(transition_table)
+        self.__heap = []
+        self.__armed = {}
+        self.__sequence = count()
+        self.__lock = Lock()
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """ Gets earliest deadline, it may be of dropped timer """
+        with self.__lock:
+            return self.__heap[0][0] if self.__heap else None
+
+    @property
+    def final_states(self) -> FrozenSet[str]:
+        """ Gets final states names """
+        return self.__fsm.final_states
+
+    def track(self, context: StatefulInterface):
+        """ Arms timers of context state if they are not armed yet """
+        with self.__lock:
+            self.__arm(context)
+
+    def cancel(self, context: StatefulInterface):
+        """ Drops context timers """
+        with self.__lock:
+            self.__armed.pop(id(context), None)
+
+    def tick(self) -> int:
+        """ Sends signals of expired timers, gets sent signals count """
+        now = self.__clock()
+        sent = 0
+        timer = self.__pop(now)
+
+        while timer is not None:
+            context, state, signal = timer
+
+            if context.state.name == state:
+                self.signal(context, signal)
+                sent += 1
+            else:
+                self.track(context)
+
+            timer = self.__pop(now)
+
+        return sent
+
+    def refresh(self, context: StatefulInterface) -> bool:
+        """ Sets context to actually state, checks it is transitioned """
+        transitioned = self.__fsm.refresh(context)
+
+        with self.__lock:
+            self.__arm(context, transitioned)
+
+        return transitioned
+
+    def signal(
+            self,
+            context: StatefulInterface,
+            signal: str,
+            params: Optional[Dict[str, Any]] = (),
+            expected_state: Optional[StateInterface] = None
+    ) -> bool:
+        """ Sends signal, checks context is transitioned """
+        transitioned = self.__fsm.signal(
+            context,
+            signal,
+            params,
+            expected_state
+        )
+
+        with self.__lock:
+            self.__arm(context, transitioned)
+
+        return transitioned
+
+    def is_signal(self, context: StatefulInterface, signal: str) -> bool:
+        """ Checks is signal transition possible """
+        return self.__fsm.is_signal(context, signal)
+
+    def is_final(self, context: StatefulInterface) -> bool:
+        """ Checks context is in final state """
+        return self.__fsm.is_final(context)
+
+    def available_signals(self, context: StatefulInterface) -> List[str]:
+        """ Gets signals possible for context """
+        return self.__fsm.available_signals(context)
+
+    def refresh_many(
+            self,
+            contexts: Iterable[StatefulInterface]
+    ) -> List[Outcome]:
+        """ Sets contexts to actually states """
+        return self.__track_many(self.__fsm.refresh_many(contexts))
+
+    def signal_many(
+            self,
+            contexts: Iterable[StatefulInterface],
+            signal: str,
+            params: Optional[Dict[str, Any]] = ()
+    ) -> List[Outcome]:
+        """ Sends signal to contexts """
+        return self.__track_many(
+            self.__fsm.signal_many(contexts, signal, params)
+        )
+
+    def replay(
+            self,
+            context: StatefulInterface,
+            signals: Iterable[SignalRecord],
+            silent: bool = False,
+            checkpoint: Optional[Checkpoint] = None
+    ) -> int:
+        """ Applies signals history to context """
+        position = self.__fsm.replay(context, signals, silent, checkpoint)
+        self.track(context)
+
+        return position
+
+    def fold(
+            self,
+            state: StateInterface,
+            signals: Iterable[SignalRecord]
+    ) -> StateInterface:
+        """ Gets state signals history leads to """
+        return self.__fsm.fold(state, signals)
+
+    def __track_many(self, outcomes: List[Outcome]) -> List[Outcome]:
+        """ Arms timers of contexts states """
+        with self.__lock:
+            for outcome in outcomes:
+                self.__arm(
+                    outcome.context,
+                    outcome.status == Outcome.STATUS_TRANSITIONED
+                )
+
+        return outcomes
+
+    def __arm(self, context: StatefulInterface, transitioned: bool = False):
+        """ Arms timers of context state, drops timers of previous one
+
+            Armed timers of the same state are kept unless context
+            is transitioned
+        """
+        name = context.state.name
+        armed = self.__armed.get(id(context))
+
+        if not transitioned and armed is not None and armed[1] == name:
+            return
+
+        timeouts = self.__timeouts.get(name)
+
+        if not timeouts:
+            self.__armed.pop(id(context), None)
+            return
+
+        generation = next(self.__sequence)
+        self.__armed[id(context)] = context, name, generation
+        now = self.__clock()
+
+        for timeout, signal in timeouts:
+            timer = now + timeout, next(self.__sequence), generation, \
+                context, signal
+            heappush(self.__heap, timer)
+
+    def __pop(self, now: float) -> Optional[Expired]:
+        """ Pops expired timer which is not dropped """
+        with self.__lock:
+            while self.__heap and self.__heap[0][0] <= now:
+                _, _, generation, context, signal = heappop(self.__heap)
+                armed = self.__armed.get(id(context))
+
+                if armed is not None and armed[2] == generation:
+                    return context, armed[1], signal
+
+        return None
+
+    @classmethod
+    def __get_timeouts(
+            cls,
+            transition_table: TransitionTable
+    ) -> Dict[str, Tuple[Tuple[float, str], ...]]:
+        """ Gets timeouts and signals of timed transitions by states """
+        timeouts = {}
+
+        for name in transition_table.get_states():
+            candidates = transition_table.get_signals_candidates(State(name))
+            timeouts[name] = tuple(
+                (transition.timeout, signal)
+                for signal, transitions in candidates.items()
+                for transition in transitions
+                if transition.timeout is not None
+            )
+
+        return timeouts
@@ -5,25 +5,59 @@
 
 """
 
-from dataclasses import dataclass
-from functools import reduce
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from .entity import StatefulInterface
 from .state import StateInterface, StateManager
-from .guard import GuardInterface, GuardManager
+from .guard import GuardChain, GuardInterface, GuardManager
 from .listener import ListenerInterface, ListenerManager
 
 
-@dataclass
-class Transition:
-    """ Transition """
+class Transition:  # pylint: disable=too-many-instance-attributes
+    """ Transition
 
-    __state_from: StateInterface
-    __state_to: StateInterface
-    __signal: str or None = None
-    __guards: List[GuardInterface] = ()
-    __before: List[ListenerInterface] = ()
-    __after: List[ListenerInterface] = ()
+        Signal of timed transition is sent by timers scheduler
+        after context has been in original state for timeout seconds
+    """
+
+    __slots__ = (
+        '__state_from',
+        '__state_to',
+        '__signal',
+        '__guards',
+        '__before',
+        '__after',
+        '__timeout',
+        '__guard_chain',
+        '__has_listeners'
+    )
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            state_from: StateInterface,
+            state_to: StateInterface,
+            signal: str or None = None,
+            guards: List[GuardInterface] = (),
+            before: List[ListenerInterface] = (),
+            after: List[ListenerInterface] = (),
+            timeout: Optional[float] = None
+    ):
+        self.__state_from = state_from
+        self.__state_to = state_to
+        self.__signal = signal
+        self.__guards = guards
+        self.__before = before
+        self.__after = after
+        self.__timeout = timeout
+        self.__guard_chain = GuardChain(guards)
+        self.__has_listeners = bool(before or after)
+
+    def __repr__(self) -> str:
+        return 'Transition({0!r}, {1!r}, {2!r})'.format(
+            self.__state_from,
+            self.__state_to,
+            self.__signal
+        )
 
     @property
     def state_from(self) -> StateInterface:
@@ -55,6 +89,29 @@ class Transition:
         """ Gets after transition listeners list """
         return self.__after
 
+    @property
+    def timeout(self) -> Optional[float]:
+        """ Gets seconds in original state before signal is sent """
+        return self.__timeout
+
+    @property
+    def has_listeners(self) -> bool:
+        """ Checks transition has before or after listeners """
+        return self.__has_listeners
+
+    @property
+    def is_guarded(self) -> bool:
+        """ Checks transition has effective guards """
+        return bool(self.__guard_chain)
+
+    def is_satisfied(
+            self,
+            context: StatefulInterface,
+            results: Optional[Dict[int, bool]] = None
+    ) -> bool:
+        """ Checks guards conditions, reusing results shared by call """
+        return self.__guard_chain(context, results)
+
 
 class TransitionFactory:
     """ Transitions factory """
@@ -65,6 +122,7 @@ class TransitionFactory:
     KEY_GUARD: str = 'guards'
     KEY_BEFORE: str = 'before'
     KEY_AFTER: str = 'after'
+    KEY_TIMEOUT: str = 'timeout'
 
     def __init__(
             self,
@@ -92,9 +150,29 @@ class TransitionFactory:
             config.get(self.KEY_SIGNAL, None),
             self.__get_guards(config.get(self.KEY_GUARD, [])),
             self.__get_listeners(config.get(self.KEY_BEFORE, [])),
-            self.__get_listeners(config.get(self.KEY_AFTER, []))
+            self.__get_listeners(config.get(self.KEY_AFTER, [])),
+            self.__get_timeout(config)
         )
 
+    def __get_timeout(self, config: Dict[str, Any]) -> Optional[float]:
+        """ Gets timeout of transition with signal """
+        timeout = config.get(self.KEY_TIMEOUT, None)
+
+        if timeout is None:
+            return None
+
+        if config.get(self.KEY_SIGNAL, None) is None:
+            message = "Timed transition without signal in config {0}".format(
+                config
+            )
+            raise InvalidTransitionConfig(message)
+
+        if timeout <= 0:
+            message = "Timeout must be positive in config {0}".format(config)
+            raise InvalidTransitionConfig(message)
+
+        return timeout
+
     def __get_guards(self, config: List[str]) -> List[GuardInterface]:
         """ Gets guards """
         return [self.__guard_manager.get_guard(name) for name in config]
@@ -108,19 +186,35 @@ class TransitionFactory:
 
 
 class TransitionTable:
-    """ Transitions table """
+    """ Transitions table
+
+        Signal transitions of composite states are inherited by their
+        children, inherited candidates follow own ones in flat index.
+        Final states have neither own nor inherited transitions
+    """
 
     def __init__(
             self,
             transition_factory: TransitionFactory,
-            transition_config: List[Dict[str, str]]
+            transition_config: List[Dict[str, str]],
+            states: Iterable[StateInterface] = ()
     ):
         self.__transitions = []
+        self.__own = {}
+        self.__index = self.__own
+        self.__parents = {}
+        self.__types = {}
+        self.__paths = {}
         self.__position = 0
 
         for transition in transition_config:
             self.add_transition(transition_factory.get_transition(transition))
 
+        self.add_states(states)
+
+        for name in list(self.__index):
+            self.__get_path(name)
+
     def __iter__(self) -> Iterator[Transition]:
         return self
 
@@ -138,21 +232,186 @@ class TransitionTable:
             signal: Optional[str] = None
     ) -> Iterator[Transition]:
         """ Finds possible transitions """
-        return filter(
-            lambda transition:
-            transition.state_from == context.state and
-            transition.signal == signal and
-            reduce(
-                lambda result, guard: result and guard.is_satisfied(context),
-                transition.guards,
-                True
-            ),
-            self.__transitions
+        return self.filter_transitions(
+            context,
+            self.get_candidates(context.state, signal)
+        )
+
+    @classmethod
+    def filter_transitions(
+            cls,
+            context: StatefulInterface,
+            transitions: Iterable[Transition]
+    ) -> Iterator[Transition]:
+        """ Filters transitions satisfied by context
+
+            Guards results are shared between the transitions
+        """
+        results = {}
+
+        return (
+            transition for transition in transitions
+            if transition.is_satisfied(context, results)
         )
 
+    def get_candidates(
+            self,
+            state: StateInterface,
+            signal: Optional[str] = None
+    ) -> List[Transition]:
+        """ Gets transitions from state by signal regardless of guards """
+        return self.__index.get(state.name, {}).get(signal, ())
+
+    def get_signals_candidates(
+            self,
+            state: StateInterface
+    ) -> Dict[Optional[str], List[Transition]]:
+        """ Gets transitions from state grouped by signal """
+        return self.__index.get(state.name, {})
+
+    def get_automatic_path(
+            self,
+            state: StateInterface
+    ) -> Tuple[Transition, ...]:
+        """ Gets chain of automatic transitions always taken from state """
+        try:
+            return self.__paths[state.name]
+        except KeyError:
+            return self.__get_path(state.name)
+
+    def get_states(self, state_type: Optional[str] = None) -> List[str]:
+        """ Gets names of states in transitions and hierarchy
+
+            With type, gets names of added states of the type
+        """
+        if state_type is not None:
+            return [
+                name for name, other in self.__types.items()
+                if other == state_type
+            ]
+
+        names = {}
+
+        for transition in self.__transitions:
+            names[transition.state_from.name] = None
+            names[transition.state_to.name] = None
+
+        for name, parent in self.__parents.items():
+            names[name] = None
+            names[parent] = None
+
+        return list(names)
+
+    def get_parent(self, name: str) -> Optional[str]:
+        """ Gets name of composite state containing state """
+        return self.__parents.get(name)
+
+    def add_states(self, states: Iterable[StateInterface]):
+        """ Adds states hierarchy and types to table """
+        self.__types.update({state.name: state.type for state in states})
+        self.__parents.update({
+            state.name: state.parent.name for state in states
+            if state.parent is not None
+        })
+        self.__paths.clear()
+
+        for name in self.__own:
+            self.__check_final(name)
+
+        if self.__parents:
+            self.__flatten()
+
     def add_transition(self, transition: Transition):
         """ Adds transition to table """
+        self.__check_final(transition.state_from.name)
         self.__transitions.append(transition)
+        self.__own.setdefault(
+            transition.state_from.name,
+            {}
+        ).setdefault(transition.signal, []).append(transition)
+        self.__paths.clear()
+
+        if self.__parents:
+            self.__flatten()
+
+    def __flatten(self):
+        """ Builds index with signal transitions inherited from parents """
+        self.__index = {}
+
+        for name in list(self.__own) + list(self.__parents):
+            if name not in self.__index:
+                self.__index[name] = self.__inherit(name)
+
+    def __inherit(self, name: str) -> Dict[Optional[str], List[Transition]]:
+        """ Gets state candidates followed by inherited ones """
+        candidates = {
+            signal: list(transitions)
+            for signal, transitions in self.__own.get(name, {}).items()
+        }
+        parent = None \
+            if self.__types.get(name) == StateInterface.TYPE_FINAL \
+            else self.__parents.get(name)
+
+        while parent is not None:
+            for signal, transitions in self.__own.get(parent, {}).items():
+                if signal is not None:
+                    candidates.setdefault(signal, []).extend(transitions)
+
+            parent = self.__parents.get(parent)
+
+        return candidates
+
+    def __check_final(self, name: str):
+        """ Checks state is not final one """
+        if self.__types.get(name) == StateInterface.TYPE_FINAL:
+            message = "Final state '{0}' has outgoing transitions".format(
+                name
+            )
+            raise InvalidTransitionConfig(message)
+
+    def __get_path(self, name: str) -> Tuple[Transition, ...]:
+        """ Compiles automatic transitions chain from state """
+        chain = []
+        visited = set()
+        current = name
+
+        while current not in self.__paths:
+            if current in visited:
+                message = "Automatic transitions cycle from state '{0}'"
+                message = message.format(current)
+                raise InvalidTransitionConfig(message)
+
+            visited.add(current)
+            transition = self.__get_unguarded_transition(current)
+
+            if transition is None:
+                self.__paths[current] = ()
+            else:
+                chain.append(transition)
+                current = transition.state_to.name
+
+        self.__store_path(chain, self.__paths[current])
+
+        return self.__paths[name]
+
+    def __store_path(
+            self,
+            chain: List[Transition],
+            path: Tuple[Transition, ...]
+    ):
+        """ Stores paths for each state of chain """
+        for transition in reversed(chain):
+            path = (transition,) + path
+            self.__paths[transition.state_from.name] = path
+
+    def __get_unguarded_transition(self, name: str) -> Optional[Transition]:
+        """ Gets automatic transition from state taken regardless context """
+        candidates = self.__index.get(name, {}).get(None, ())
+
+        if candidates and not candidates[0].is_guarded:
+            return candidates[0]
+
+        return None
 
 
 class InvalidTransitionConfig(Exception):
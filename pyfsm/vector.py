@@ -0,0 +1,222 @@
+"""
+    PyFSM.vector
+
+    Vectorized state engine module, requires NumPy
+"""
+
+from abc import abstractmethod, ABCMeta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .artifact import LazyGuard
+from .guard import GuardInterface, NullGuard, unwrap_guards
+from .state import State
+from .transition import InvalidTransitionConfig, Transition, TransitionTable
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+Columns = Dict[str, Any]
+
+
+class VectorGuardInterface(metaclass=ABCMeta):
+    """ Vectorized guard interface """
+
+    @abstractmethod
+    def is_satisfied_vector(self, columns: Columns) -> Any:
+        """ Checks guard condition for each entity
+
+            Gets boolean array over columnar entities attributes
+        """
+
+
+class VectorFSM:
+    """ Vectorized state machine for homogeneous entities population
+
+        States are compiled to integer identifiers, entities states are
+        held in integer array and whole array is moved by one step.
+        Unguarded transitions are taken from dense state by signal
+        targets matrix, guards must implement vectorized interface.
+        Composite states transitions are compiled into their children
+    """
+
+    NO_STATE: int = -1
+
+    def __init__(self, transition_table: TransitionTable):
+        if numpy is None:
+            raise ImportError("NumPy is required for vectorized engine")
+
+        self.__states = self.__get_names(transition_table.get_states())
+        self.__signals = self.__get_names(
+            [None] + [transition.signal for transition in transition_table]
+        )
+        self.__targets = numpy.full(
+            (len(self.__states), len(self.__signals)),
+            self.NO_STATE,
+            dtype=numpy.int32
+        )
+        self.__rules = [[] for _ in self.__signals]
+        self.__names = numpy.array(list(self.__states), dtype=object)
+        self.__finals = numpy.isin(
+            self.__names,
+            transition_table.get_states(State.TYPE_FINAL)
+        )
+
+        for name, state in self.__states.items():
+            for candidates in transition_table.get_signals_candidates(
+                    State(name)
+            ).values():
+                for transition in candidates:
+                    self.__compile(state, transition)
+
+    @property
+    def states(self) -> List[str]:
+        """ Gets states names by identifiers """
+        return list(self.__states)
+
+    def encode(self, names: Iterable[str]) -> Any:
+        """ Gets states identifiers array by names """
+        return numpy.fromiter(
+            (self.__get_state(name) for name in names),
+            dtype=numpy.int32
+        )
+
+    def is_final(self, states: Any) -> Any:
+        """ Gets boolean array of entities in final states """
+        return self.__finals[states]
+
+    def decode(self, states: Any) -> List[str]:
+        """ Gets states names by identifiers array """
+        return self.__names[states].tolist()
+
+    def refresh(self, states: Any, columns: Optional[Columns] = None) -> Any:
+        """ Moves states by automatic transitions to fixed point """
+        for _ in range(len(self.__states)):
+            moved = self.__step(states, 0, columns)
+
+            if numpy.array_equal(moved, states):
+                return moved
+
+            states = moved
+
+        message = "Automatic transitions do not converge in {0} steps".format(
+            len(self.__states)
+        )
+        raise InvalidTransitionConfig(message)
+
+    def signal(
+            self,
+            states: Any,
+            signal: str,
+            columns: Optional[Columns] = None
+    ) -> Any:
+        """ Sends signal to each entity, gets new states array """
+        states = self.refresh(states, columns)
+
+        if signal not in self.__signals:
+            return states
+
+        return self.refresh(
+            self.__step(states, self.__signals[signal], columns),
+            columns
+        )
+
+    def __step(
+            self,
+            states: Any,
+            signal: int,
+            columns: Optional[Columns]
+    ) -> Any:
+        """ Moves states by one transition of signal """
+        targets = self.__targets[:, signal][states]
+        decided = numpy.zeros(len(states), dtype=bool)
+
+        for state, guards, target in self.__rules[signal]:
+            candidates = (states == state) & ~decided
+
+            if candidates.any():
+                satisfied = candidates & self.__check(guards, columns)
+                targets[satisfied] = target
+                decided |= satisfied
+
+        return numpy.where(targets == self.NO_STATE, states, targets)
+
+    def __compile(self, state: int, transition: Transition):
+        """ Adds state transition to targets matrix or to guarded rules """
+        signal = self.__signals[transition.signal]
+
+        if self.__targets[state, signal] != self.NO_STATE:
+            return
+
+        guards = self.__get_guards(transition.guards)
+
+        if guards:
+            self.__rules[signal].append(
+                (state, guards, self.__states[transition.state_to.name])
+            )
+        else:
+            self.__targets[state, signal] = self.__states[
+                transition.state_to.name
+            ]
+
+    def __get_state(self, name: str) -> int:
+        """ Gets state identifier """
+        if name not in self.__states:
+            message = "State '{0}' is not found".format(name)
+            raise InvalidTransitionConfig(message)
+
+        return self.__states[name]
+
+    @classmethod
+    def __check(
+            cls,
+            guards: Tuple[Tuple[VectorGuardInterface, bool], ...],
+            columns: Optional[Columns]
+    ) -> Any:
+        """ Checks guards conjunction for each entity """
+        result = True
+
+        for guard, reverse in guards:
+            satisfied = numpy.asarray(
+                isinstance(guard, NullGuard)
+                or guard.is_satisfied_vector(columns or {}),
+                dtype=bool
+            )
+            result = result & (~satisfied if reverse else satisfied)
+
+        return result
+
+    @classmethod
+    def __get_guards(
+            cls,
+            guards: Iterable[GuardInterface]
+    ) -> Tuple[Tuple[VectorGuardInterface, bool], ...]:
+        """ Unwraps guards to vectorized ones and reverse flags
+
+            Lazy guards are resolved, reversed null guard is kept
+            as never satisfied one
+        """
+        unwrapped = tuple(
+            (guard.guard if isinstance(guard, LazyGuard) else guard, reverse)
+            for guard, reverse in unwrap_guards(guards)
+        )
+
+        for guard, _ in unwrapped:
+            if not isinstance(guard, (VectorGuardInterface, NullGuard)):
+                message = "Guard '{0}' is not vectorized".format(
+                    type(guard).__name__
+                )
+                raise InvalidTransitionConfig(message)
+
+        return unwrapped
+
+    @classmethod
+    def __get_names(cls, names: Iterable[Optional[str]]) -> Dict[Any, int]:
+        """ Gets identifiers of names in order of appearance """
+        identifiers = {}
+
+        for name in names:
+            identifiers.setdefault(name, len(identifiers))
+
+        return identifiers
@@ -7,4 +7,5 @@ setup(
     description='Python Final State Machine',
     author='Alexey Buyanov',
     author_email='alexbuyanow@gmail.com',
+    extras_require={'vector': ['numpy']},
 )
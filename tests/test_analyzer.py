@@ -0,0 +1,123 @@
+"""
+    PyFSM
+
+    Static machine analysis module tests
+
+"""
+
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    FSMFactory,
+    GuardInterface,
+    GuardManager,
+    ListenerManager,
+    MachineAnalyzer,
+    State
+)
+from pyfsm.guard import ReverseGuard
+from pyfsm.transition import Transition, TransitionFactory, TransitionTable
+
+
+class TestMachineAnalyzer(unittest.TestCase):
+    """ Machine analyzer tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__table = TransitionTable(mock.Mock(TransitionFactory), [])
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        del self.__table
+
+    def test_unreachable(self):
+        """ Tests unreachable and sink states reporting """
+        self.__add('start', 'middle', 'go')
+        self.__add('middle', 'end', 'go')
+        self.__add('orphan', 'end', 'go')
+
+        report = MachineAnalyzer(self.__table).analyze(['start'], ['lost'])
+
+        self.assertEqual(['lost', 'orphan'], report.unreachable)
+        self.assertEqual(['lost', 'end'], report.sinks)
+        self.assertEqual(
+            [
+                "State 'lost' is unreachable",
+                "State 'orphan' is unreachable",
+                "State 'lost' has no outgoing transitions",
+                "State 'end' has no outgoing transitions"
+            ],
+            report.messages
+        )
+
+    def test_conflicts(self):
+        """ Tests not exclusive transitions reporting """
+        guard = mock.Mock(GuardInterface)
+        other = mock.Mock(GuardInterface)
+        first = self.__add('start', 'first', 'go', [guard])
+        self.__add('start', 'second', 'go', [ReverseGuard(guard)])
+        third = self.__add('start', 'third', 'go', [other])
+        self.__add('start', 'fourth', 'stop')
+
+        report = MachineAnalyzer(self.__table).analyze(['start'])
+
+        self.assertEqual([(first, third)], report.conflicts[:1])
+        self.assertEqual(2, len(report.conflicts))
+
+    def test_cycles(self):
+        """ Tests guarded automatic cycles reporting """
+        guard = mock.Mock(GuardInterface)
+        self.__add('start', 'first', None, [guard])
+        self.__add('first', 'second', None)
+        self.__add('second', 'start', None, [guard])
+        self.__add('second', 'loop', 'go')
+        self.__add('loop', 'loop', None, [guard])
+        self.__add('loop', 'start', 'go')
+
+        report = MachineAnalyzer(self.__table).analyze(['start'])
+
+        self.assertEqual(
+            [['start', 'first', 'second'], ['loop']],
+            report.cycles
+        )
+        self.assertIn(
+            "Automatic transitions cycle through states "
+            "'start', 'first', 'second'",
+            report.messages
+        )
+
+    def test_factory_analyze(self):
+        """ Tests analysis of configured machine """
+        factory = FSMFactory(
+            {
+                'TestContext': {
+                    'states': {'from': {}, 'to': {}, 'lost': {}},
+                    'transitions': [{'from': 'from', 'to': 'to'}]
+                }
+            },
+            GuardManager(),
+            ListenerManager()
+        )
+
+        report = factory.analyze('TestContext', ['from'])
+
+        self.assertEqual(['lost'], report.unreachable)
+        self.assertEqual(['to', 'lost'], report.sinks)
+
+    def __add(
+            self,
+            state_from: str,
+            state_to: str,
+            signal: str = None,
+            guards=()
+    ) -> Transition:
+        """ Adds transition to table """
+        transition = Transition(
+            State(state_from),
+            State(state_to),
+            signal,
+            guards
+        )
+        self.__table.add_transition(transition)
+
+        return transition
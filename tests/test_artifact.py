@@ -0,0 +1,207 @@
+"""
+    PyFSM
+
+    Compiled machines artifact module tests
+
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    Event,
+    FSMFactory,
+    GuardInterface,
+    GuardManager,
+    InvalidArtifactException,
+    ListenerInterface,
+    ListenerManager,
+    MachineArtifact,
+    State
+)
+from pyfsm.guard import ReverseGuard
+from tests import TestContext
+
+
+class AllowGuard(GuardInterface):
+    """ Test guard """
+
+    def is_satisfied(self, target) -> bool:
+        """ Checks guard condition """
+        return True
+
+
+class RecordListener(ListenerInterface):
+    """ Test listener """
+
+    def __init__(self):
+        self.events = []
+
+    def listen(self, event: Event):
+        """ Processes transition event """
+        self.events.append(event)
+
+
+CONFIG = {
+    'TestContext': {
+        'states': {'from': {}, 'middle': {}, 'to': {}},
+        'transitions': [
+            {
+                'from': 'from',
+                'to': 'middle',
+                'signal': 'go',
+                'guards': ['!AllowGuard']
+            },
+            {
+                'from': 'from',
+                'to': 'to',
+                'signal': 'go',
+                'guards': ['AllowGuard'],
+                'after': ['RecordListener']
+            }
+        ]
+    }
+}
+
+
+class TestMachineArtifact(unittest.TestCase):
+    """ Compiled machines artifact tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__directory = tempfile.mkdtemp()
+        self.__path = os.path.join(self.__directory, 'machines.artifact')
+        self.__listener = RecordListener()
+        self.__guard_manager = GuardManager()
+        self.__guard_manager.add_guard(AllowGuard())
+        self.__listener_manager = ListenerManager()
+        self.__listener_manager.add_listener(self.__listener)
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        shutil.rmtree(self.__directory)
+        del self.__listener_manager
+        del self.__guard_manager
+        del self.__listener
+        del self.__path
+        del self.__directory
+
+    def test_load(self):
+        """ Tests machine loaded from artifact """
+        FSMFactory(CONFIG, GuardManager(), ListenerManager()) \
+            .export_artifact() \
+            .dump(self.__path)
+        artifact = MachineArtifact.load(self.__path)
+        context = TestContext()
+
+        factory = FSMFactory(
+            artifact,
+            self.__guard_manager,
+            self.__listener_manager
+        )
+        factory.get_fsm(context).signal(context, 'go')
+
+        self.assertTrue(artifact.matches(CONFIG))
+        self.assertEqual(State('to'), context.state)
+        self.assertEqual(1, len(self.__listener.events))
+        self.assertEqual(
+            ['middle', 'to'],
+            factory.analyze('TestContext', ['from']).sinks
+        )
+
+    def test_get_transition_table(self):
+        """ Tests reverse guard sharing original one """
+        artifact = FSMFactory(CONFIG, GuardManager(), ListenerManager()) \
+            .export_artifact()
+
+        reverse, guard = [
+            transition.guards[0]
+            for transition in artifact.get_transition_table(
+                'TestContext',
+                self.__guard_manager,
+                self.__listener_manager
+            )
+        ]
+
+        self.assertIsInstance(reverse, ReverseGuard)
+        self.assertIs(guard, reverse.guard)
+
+    def test_matches(self):
+        """ Tests changed config detection """
+        artifact = FSMFactory(CONFIG, GuardManager(), ListenerManager()) \
+            .export_artifact()
+        config = {'TestContext': dict(CONFIG['TestContext'], states={})}
+
+        self.assertFalse(artifact.matches(config))
+
+    def test_load_nested(self):
+        """ Tests states hierarchy kept in artifact """
+        config = {
+            'TestContext': {
+                'states': {
+                    'from': {'parent': 'active'},
+                    'active': {'type': State.TYPE_COMPOSITE},
+                    'to': {}
+                },
+                'transitions': [{'from': 'active', 'to': 'to', 'signal': 'go'}]
+            }
+        }
+        FSMFactory(config, GuardManager(), ListenerManager()) \
+            .export_artifact() \
+            .dump(self.__path)
+        context = TestContext()
+
+        FSMFactory(
+            MachineArtifact.load(self.__path),
+            self.__guard_manager,
+            self.__listener_manager
+        ).get_fsm(context).signal(context, 'go')
+
+        self.assertEqual(State('to'), context.state)
+
+    def test_export_artifact(self):
+        """ Tests artifact exporting by factory of artifact """
+        artifact = FSMFactory(CONFIG, GuardManager(), ListenerManager()) \
+            .export_artifact()
+
+        self.assertIs(
+            artifact,
+            FSMFactory(
+                artifact,
+                self.__guard_manager,
+                self.__listener_manager
+            ).export_artifact()
+        )
+
+    def test_load_invalid(self):
+        """ Tests unsupported artifact loading error """
+        with open(self.__path, 'wb') as file:
+            pickle.dump(('PyFSM', 0, '', {}), file)
+
+        with self.assertRaisesRegex(
+                InvalidArtifactException,
+                "is not artifact of version 3"
+        ):
+            MachineArtifact.load(self.__path)
+
+    def test_lazy_listener(self):
+        """ Tests listeners are resolved on first use """
+        listener_manager = mock.Mock(ListenerManager)
+        listener_manager.get_listener.return_value = self.__listener
+        artifact = FSMFactory(CONFIG, GuardManager(), ListenerManager()) \
+            .export_artifact()
+        context = TestContext()
+        fsm = FSMFactory(
+            artifact,
+            self.__guard_manager,
+            listener_manager
+        ).get_fsm(context)
+
+        listener_manager.get_listener.assert_not_called()
+        fsm.signal(context, 'go')
+        listener_manager.get_listener.assert_called_once_with(
+            'RecordListener'
+        )
@@ -0,0 +1,288 @@
+"""
+    PyFSM
+
+    Asynchronous state machine module tests
+
+"""
+
+import asyncio
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    AttributeStorage,
+    GuardInterface,
+    GuardManager,
+    ListenerInterface,
+    ListenerManager,
+    FSMFactory,
+    AsyncFSMInterface,
+    Event,
+    State,
+    StripedLock
+)
+from pyfsm.async_fsm import AsyncFSM
+from pyfsm.fsm import InvalidConfigException
+from pyfsm.guard import NullGuard
+from pyfsm.transition import Transition, TransitionFactory, TransitionTable
+from tests import TestContext
+
+
+class AsyncGuard(GuardInterface):
+    """ Coroutine guard waiting for sibling guard """
+
+    def __init__(self, started: asyncio.Event, awaited: asyncio.Event):
+        self.__started = started
+        self.__awaited = awaited
+
+    async def is_satisfied(  # pylint: disable=invalid-overridden-method
+            self,
+            target: TestContext
+    ) -> bool:
+        """ Checks guard condition """
+        self.__started.set()
+        await asyncio.wait_for(self.__awaited.wait(), 1)
+
+        return True
+
+
+class TrueGuard(GuardInterface):
+    """ Coroutine true condition guard """
+
+    async def is_satisfied(  # pylint: disable=invalid-overridden-method
+            self,
+            target: TestContext
+    ) -> bool:
+        """ Checks guard condition """
+        return True
+
+
+class CountingGuard(GuardInterface):
+    """ Coroutine false condition guard counting checks """
+
+    def __init__(self):
+        self.calls = 0
+
+    async def is_satisfied(  # pylint: disable=invalid-overridden-method
+            self,
+            target: TestContext
+    ) -> bool:
+        """ Checks guard condition """
+        self.calls += 1
+
+        return False
+
+
+class AsyncListener(ListenerInterface):
+    """ Coroutine listener """
+
+    def __init__(self):
+        self.events = []
+
+    async def listen(  # pylint: disable=invalid-overridden-method
+            self,
+            event: Event
+    ):
+        """ Processes transition event """
+        await asyncio.sleep(0)
+        self.events.append(event)
+
+
+class TestAsyncFSM(unittest.TestCase):
+    """ Asynchronous state machine tests """
+
+    def setUp(self):
+        """ Sets up test environment """
+        self.__context = TestContext()
+        self.__table = TransitionTable(mock.Mock(TransitionFactory), [])
+
+    def tearDown(self):
+        """ Unsets test environment """
+        del self.__table
+        del self.__context
+
+    def test_refresh(self):
+        """ Tests direct transitions on refresh """
+        self.__table.add_transition(Transition(State('from'), State('ready')))
+        self.__table.add_transition(Transition(State('ready'), State('to')))
+
+        asyncio.run(self.__get_fsm().refresh(self.__context))
+
+        self.assertEqual('to', self.__context.state.name)
+
+    def test_signal_with_concurrent_guards(self):
+        """ Tests guards of one transition are awaited concurrently """
+
+        async def run():
+            first, second = asyncio.Event(), asyncio.Event()
+            self.__table.add_transition(
+                Transition(
+                    State('from'),
+                    State('to'),
+                    'go',
+                    [AsyncGuard(first, second), AsyncGuard(second, first)]
+                )
+            )
+
+            await self.__get_fsm().signal(self.__context, 'go')
+
+        asyncio.run(run())
+
+        self.assertEqual('to', self.__context.state.name)
+
+    def test_signal_with_mixed_listeners(self):
+        """ Tests coroutine and regular listeners are called """
+        before = AsyncListener()
+        after = mock.Mock(ListenerInterface)
+        self.__table.add_transition(
+            Transition(State('from'), State('to'), 'go', (), [before], [after])
+        )
+
+        asyncio.run(self.__get_fsm().signal(self.__context, 'go', {'a': 1}))
+
+        self.assertEqual('to', self.__context.state.name)
+        self.assertEqual(1, len(before.events))
+        self.assertEqual({'a': 1}, before.events[0].params)
+        after.listen.assert_called_once_with(before.events[0])
+
+    def test_is_signal_with_guards(self):
+        """ Tests signal possibility with coroutine and reverse guards """
+        guard_manager = GuardManager()
+        guard_manager.add_guard(TrueGuard())
+        self.__table.add_transition(
+            Transition(
+                State('from'),
+                State('to'),
+                'go',
+                [guard_manager.get_guard('!TrueGuard')]
+            )
+        )
+        self.__table.add_transition(
+            Transition(
+                State('from'),
+                State('to'),
+                'stop',
+                [guard_manager.get_guard('TrueGuard')]
+            )
+        )
+
+        fsm = self.__get_fsm()
+
+        self.assertFalse(asyncio.run(fsm.is_signal(self.__context, 'go')))
+        self.assertTrue(asyncio.run(fsm.is_signal(self.__context, 'stop')))
+
+    def test_signal_with_reverse_siblings(self):
+        """ Tests guard shared by reverse sibling is checked once """
+        guard_manager = GuardManager()
+        guard = CountingGuard()
+        guard_manager.add_guard(guard)
+        names = (('CountingGuard', 'paid'), ('!CountingGuard', 'to'))
+        for name, state in names:
+            self.__table.add_transition(
+                Transition(
+                    State('from'),
+                    State(state),
+                    'go',
+                    [guard_manager.get_guard(name)]
+                )
+            )
+
+        asyncio.run(self.__get_fsm().signal(self.__context, 'go'))
+
+        self.assertEqual('to', self.__context.state.name)
+        self.assertEqual(1, guard.calls)
+
+    def test_signal_with_null_guard(self):
+        """ Tests null guard class is skipped """
+        self.__table.add_transition(
+            Transition(State('from'), State('to'), 'go', [NullGuard])
+        )
+
+        asyncio.run(self.__get_fsm().signal(self.__context, 'go'))
+
+        self.assertEqual('to', self.__context.state.name)
+
+    def test_is_signal_without_side_effects(self):
+        """ Tests signal possibility after simulated automatic transitions """
+        listener = mock.Mock(ListenerInterface)
+        self.__table.add_transition(
+            Transition(State('from'), State('ready'), None, (), [listener])
+        )
+        self.__table.add_transition(
+            Transition(State('ready'), State('to'), 'go')
+        )
+
+        fsm = self.__get_fsm()
+
+        self.assertTrue(asyncio.run(fsm.is_signal(self.__context, 'go')))
+        self.assertEqual('from', self.__context.state.name)
+        listener.listen.assert_not_called()
+
+    def __get_fsm(self) -> AsyncFSM:
+        """ Gets tested state machine """
+        return AsyncFSM(self.__table)
+
+
+class TestFSMFactoryAsync(unittest.TestCase):
+    """ State machine factory asynchronous machines tests """
+
+    CONFIG = {
+        'TestContext': {
+            'states': {'from': {}, 'to': {}},
+            'transitions': [{'from': 'from', 'to': 'to'}]
+        }
+    }
+
+    def test_get_async_fsm(self):
+        """ Tests asynchronous state machine creating """
+        factory = FSMFactory(
+            self.CONFIG,
+            mock.Mock(GuardManager),
+            mock.Mock(ListenerManager)
+        )
+        context = TestContext()
+        fsm = factory.get_async_fsm(context)
+
+        self.assertIsInstance(fsm, AsyncFSMInterface)
+        self.assertIs(fsm, factory.get_async_fsm(context))
+        self.assertIsNot(fsm, factory.get_fsm(context))
+
+        asyncio.run(fsm.refresh(context))
+        self.assertEqual('to', context.state.name)
+
+    def test_get_async_fsm_with_storage(self):
+        """ Tests asynchronous state machine storing states by storage """
+        storage = mock.Mock(wraps=AttributeStorage())
+        factory = FSMFactory(
+            self.CONFIG,
+            GuardManager(),
+            ListenerManager(),
+            storage=storage
+        )
+        context = TestContext()
+
+        asyncio.run(factory.get_async_fsm(context).refresh(context))
+
+        storage.store.assert_called_once()
+        self.assertEqual(
+            State('to'),
+            storage.store.call_args[0][0].state_to
+        )
+
+    def test_get_async_fsm_with_locks(self):
+        """ Tests asynchronous state machine with locks rejecting """
+        factory = FSMFactory(
+            self.CONFIG,
+            GuardManager(),
+            ListenerManager(),
+            StripedLock()
+        )
+
+        with self.assertRaisesRegex(
+                InvalidConfigException,
+                "Asynchronous FSM 'TestContext' does not support locks"
+        ):
+            factory.get_async_fsm(TestContext())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+    PyFSM
+
+    Deferred listeners dispatch module tests
+
+"""
+
+from threading import Event as Flag
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    DispatcherOverflowException,
+    Event,
+    ListenerDispatcher,
+    ListenerInterface,
+    State
+)
+from pyfsm.fsm import FSM
+from pyfsm.transition import Transition, TransitionFactory, TransitionTable
+from tests import TestContext
+
+
+class RecordListener(ListenerInterface):
+    """ Test listener recording batches """
+
+    def __init__(self):
+        self.batches = []
+
+    def listen(self, event: Event):
+        """ Processes transition event """
+        self.batches.append([event])
+
+    def listen_batch(self, events):
+        """ Processes deferred transition events """
+        self.batches.append(list(events))
+
+
+class DispatchingListener(ListenerInterface):
+    """ Test listener dispatching events to other listener """
+
+    def __init__(self, events, listener: ListenerInterface):
+        self.dispatcher = None
+        self.__events = events
+        self.__listener = listener
+
+    def listen(self, event: Event):
+        """ Processes transition event """
+        self.listen_batch([event])
+
+    def listen_batch(self, events):
+        """ Dispatches events to other listener """
+        for event in self.__events:
+            self.dispatcher.dispatch([self.__listener], event)
+
+
+class TestListenerDispatcher(unittest.TestCase):
+    """ Listeners dispatcher tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__listener = RecordListener()
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        del self.__listener
+
+    def test_dispatch_negative_workers(self):
+        """ Tests negative workers count error """
+        with self.assertRaisesRegex(
+                ValueError,
+                "Workers count must not be negative, -1 given"
+        ):
+            ListenerDispatcher(-1)
+
+    def test_flush(self):
+        """ Tests events batching on explicit flush """
+        dispatcher = ListenerDispatcher(0)
+        events = [self.__get_event() for _ in range(3)]
+
+        for event in events:
+            dispatcher.dispatch([self.__listener], event)
+
+        self.assertEqual([], self.__listener.batches)
+        dispatcher.flush()
+        self.assertEqual([events], self.__listener.batches)
+
+    def test_dispatch_full(self):
+        """ Tests full queue processing by dispatching """
+        dispatcher = ListenerDispatcher(0, max_pending=2)
+        events = [self.__get_event() for _ in range(3)]
+
+        for event in events:
+            dispatcher.dispatch([self.__listener], event)
+
+        self.assertEqual([events[:2]], self.__listener.batches)
+
+    def test_dispatch_full_from_listener(self):
+        """ Tests dispatching from listener to full queue being drained """
+        events = [self.__get_event() for _ in range(2)]
+        listener = DispatchingListener(events, self.__listener)
+        listener.dispatcher = ListenerDispatcher(0, max_pending=1)
+        listener.dispatcher.dispatch([listener], self.__get_event())
+
+        with self.assertRaisesRegex(
+                DispatcherOverflowException,
+                'Listeners queue of 1 events is full'
+        ):
+            listener.dispatcher.flush()
+
+        self.assertEqual([events[:1]], self.__listener.batches)
+
+    def test_dispatch_full_from_worker(self):
+        """ Tests dispatching from worker to full queue """
+        events = [self.__get_event() for _ in range(2)]
+        listener = DispatchingListener(events, self.__listener)
+
+        with ListenerDispatcher(1, max_pending=1) as dispatcher:
+            listener.dispatcher = dispatcher
+            dispatcher.dispatch([listener], self.__get_event())
+
+            with self.assertRaises(DispatcherOverflowException):
+                dispatcher.flush()
+
+        self.assertEqual([events[:1]], self.__listener.batches)
+
+    def test_workers(self):
+        """ Tests background processing in context order """
+        context = TestContext()
+        events = [self.__get_event(context) for _ in range(50)]
+
+        with ListenerDispatcher(4, batch_size=8) as dispatcher:
+            for event in events:
+                dispatcher.dispatch([self.__listener], event)
+
+        self.assertEqual(
+            events,
+            [event for batch in self.__listener.batches for event in batch]
+        )
+        self.assertTrue(
+            all(len(batch) <= 8 for batch in self.__listener.batches)
+        )
+
+    def test_flush_error(self):
+        """ Tests listener error reraising """
+        listener = mock.Mock(ListenerInterface)
+        listener.listen_batch.side_effect = ValueError('failed')
+
+        with ListenerDispatcher(1) as dispatcher:
+            dispatcher.dispatch([listener], self.__get_event())
+
+            with self.assertRaisesRegex(ValueError, 'failed'):
+                dispatcher.flush()
+
+    @classmethod
+    def __get_event(cls, context=None) -> Event:
+        """ Gets test event """
+        return Event(
+            context or TestContext(),
+            State('from'),
+            State('to'),
+            'go',
+            ()
+        )
+
+
+class TestFSMDispatch(unittest.TestCase):
+    """ State machine deferred dispatch tests """
+
+    def test_signal(self):
+        """ Tests after listeners deferring and inline before listeners """
+        released = Flag()
+        before = mock.Mock(ListenerInterface)
+        after = mock.Mock(ListenerInterface)
+        after.listen_batch.side_effect = lambda events: released.wait(5)
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        table.add_transition(
+            Transition(State('from'), State('to'), 'go', (), [before], [after])
+        )
+        context = TestContext()
+
+        with ListenerDispatcher(1) as dispatcher:
+            FSM('TestContext', table, dispatcher=dispatcher).signal(
+                context,
+                'go'
+            )
+
+            self.assertEqual(State('to'), context.state)
+            before.listen.assert_called_once()
+            released.set()
+
+        after.listen.assert_not_called()
+        after.listen_batch.assert_called_once()
@@ -5,19 +5,29 @@
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event as ThreadEvent, Thread
+import time
 from typing import Any, List
 import unittest2 as unittest
 import mock
 from pyfsm import (
+    Checkpoint,
+    GuardInterface,
     GuardManager,
+    ListenerInterface,
     ListenerManager,
     FSMFactory,
     FSMInterface,
     FSMNotFoundException,
-    State
+    InvalidTransitionConfig,
+    Outcome,
+    State,
+    StripedLock,
+    TransitionConflictException
 )
-from pyfsm.fsm import FSM
-from pyfsm.transition import Transition, TransitionTable
+from pyfsm.fsm import FSM, InvalidConfigException
+from pyfsm.transition import Transition, TransitionFactory, TransitionTable
 from tests import TestContext
 
 
@@ -30,6 +40,8 @@ class TestFSM(unittest.TestCase):
 
     def setUp(self):
         self.__transition_table = mock.Mock(TransitionTable)
+        self.__transition_table.get_automatic_path.return_value = ()
+        self.__transition_table.get_states.return_value = []
         self.__context = TestContext()
         self.__transition = Transition(
             State(self.__TEST_FROM),
@@ -58,6 +70,48 @@ class TestFSM(unittest.TestCase):
             [mock.call(self.__context, None)] * 2,
         )
 
+    def test_refresh_path(self):
+        """ Tests unguarded automatic transitions chain on refresh """
+        listener = mock.Mock(ListenerInterface)
+        self.__transition_table.get_automatic_path.side_effect = (
+            (
+                Transition(State('from'), State('mid'), None, (), [listener]),
+                Transition(State('mid'), State('to'), None, (), [listener])
+            ),
+            ()
+        )
+        self.__transition_table.find_transitions.return_value = iter([])
+
+        fsm = FSM(type(self.__context).__name__, self.__transition_table)
+        fsm.refresh(self.__context)
+
+        self.__assert_state('to')
+        self.assertEqual(
+            ['mid', 'to'],
+            [
+                call.args[0].state_to.name
+                for call in listener.listen.call_args_list
+            ]
+        )
+        self.__assert_find_transition_calling(
+            [mock.call(self.__context, None)],
+        )
+
+    def test_refresh_without_listeners(self):
+        """ Tests no event is created for transition without listeners """
+        self.__transition_table.find_transitions.side_effect = (
+            iter([self.__transition]),
+            iter([])
+        )
+
+        fsm = FSM(type(self.__context).__name__, self.__transition_table)
+
+        with mock.patch('pyfsm.fsm.Event') as event:
+            fsm.refresh(self.__context)
+
+        event.assert_not_called()
+        self.assertFalse(self.__transition.has_listeners)
+
     def test_refresh_no(self):
         """ Tests fails direct transition on refresh """
         self.__transition_table.find_transitions.return_value = iter([])
@@ -114,56 +168,392 @@ class TestFSM(unittest.TestCase):
             ],
         )
 
-    def test_is_signal(self):
-        """ Tests is signal transition possible """
-        self.__transition_table.find_transitions.side_effect = (
-            iter([]),
-            iter([self.__transition])
+    def __assert_state(self, state: str):
+        """ Checks state assertion """
+        self.assertEqual(state, self.__context.state.name)
+
+    def __assert_find_transition_calling(self, calls: List[Any]):
+        """ Checks 'find_transition' calls """
+        self.__transition_table.find_transitions.assert_has_calls(calls)
+        self.assertEqual(
+            len(calls),
+            self.__transition_table.find_transitions.call_count
         )
 
-        self.__assert_state(self.__TEST_FROM)
 
-        fsm = FSM(type(self.__context).__name__, self.__transition_table)
+class TestFSMBatch(unittest.TestCase):
+    """ State machine batch operations tests """
 
-        self.assertTrue(fsm.is_signal(self.__context, self.__TEST_SIGNAL))
-        self.__assert_find_transition_calling(
+    def setUp(self):
+        """ Sets up test environment """
+        self.__guard = mock.Mock(GuardInterface)
+        self.__guard.is_satisfied.side_effect = self.__is_allowed
+
+        self.__table = TransitionTable(mock.Mock(TransitionFactory), [])
+        self.__table.add_transition(Transition(State('from'), State('ready')))
+        self.__table.add_transition(
+            Transition(State('ready'), State('to'), 'go', [self.__guard])
+        )
+        self.__table.get_candidates = mock.Mock(
+            wraps=self.__table.get_candidates
+        )
+
+        self.__fsm = FSM('TestContext', self.__table)
+
+    def tearDown(self):
+        """ Unsets test environment """
+        del self.__fsm
+        del self.__table
+        del self.__guard
+
+    def test_refresh_many(self):
+        """ Tests automatic transitions for contexts """
+        contexts = [TestContext(), TestContext()]
+        contexts[1].state = State('to')
+
+        outcomes = self.__fsm.refresh_many(contexts)
+
+        self.assertEqual(
+            [Outcome.STATUS_TRANSITIONED, Outcome.STATUS_REJECTED],
+            [outcome.status for outcome in outcomes]
+        )
+        self.assertEqual(
+            ['ready', 'to'],
+            [context.state.name for context in contexts]
+        )
+
+    def test_signal_many(self):
+        """ Tests signal transitions for contexts """
+        contexts = [TestContext() for _ in range(3)]
+        for context, allowed in zip(contexts, (True, False, None)):
+            context.allowed = allowed
+
+        outcomes = self.__fsm.signal_many(contexts, 'go')
+
+        self.assertEqual(
             [
-                mock.call(self.__context, None),
-                mock.call(self.__context, self.__TEST_SIGNAL)
+                Outcome.STATUS_TRANSITIONED,
+                Outcome.STATUS_REJECTED,
+                Outcome.STATUS_ERROR
             ],
+            [outcome.status for outcome in outcomes]
+        )
+        self.assertEqual(
+            ['to', 'ready', 'ready'],
+            [context.state.name for context in contexts]
+        )
+        self.assertEqual(contexts, [outcome.context for outcome in outcomes])
+        self.assertIsInstance(outcomes[2].error, ValueError)
+
+    def test_signal_many_repeated(self):
+        """ Tests context repeated in batch is moved once per step """
+        context = TestContext()
+        context.allowed = True
+
+        outcomes = self.__fsm.signal_many([context, context], 'go')
+
+        self.assertEqual(
+            [Outcome.STATUS_TRANSITIONED, Outcome.STATUS_REJECTED],
+            [outcome.status for outcome in outcomes]
         )
+        self.assertEqual(State('to'), context.state)
+        self.assertEqual(1, self.__guard.is_satisfied.call_count)
+
+    def test_signal_many_final(self):
+        """ Tests contexts in final states skipping """
+        self.__table.add_states([State('to', State.TYPE_FINAL)])
+        fsm = FSM('TestContext', self.__table)
+        context = TestContext()
+        context.state = State('to')
+
+        outcomes = fsm.signal_many([context], 'go')
+
+        self.assertEqual(Outcome.STATUS_REJECTED, outcomes[0].status)
+        self.__table.get_candidates.assert_not_called()
+        self.assertTrue(fsm.is_final(context))
+        self.assertEqual(frozenset(['to']), fsm.final_states)
+
+    def test_signal_final(self):
+        """ Tests signal to context in final state """
+        self.__table.add_states([State('to', State.TYPE_FINAL)])
+        self.__table.find_transitions = mock.Mock()
+        fsm = FSM('TestContext', self.__table)
+        context = TestContext()
+        context.state = State('to')
+
+        fsm.signal(context, 'go')
+        fsm.refresh(context)
+
+        self.assertFalse(fsm.is_signal(context, 'go'))
+        self.assertEqual([], fsm.available_signals(context))
+        self.__table.find_transitions.assert_not_called()
+        self.__table.get_candidates.assert_not_called()
+
+    def test_signal_many_resolves_candidates_per_state(self):
+        """ Tests candidates are resolved once per state group """
+        contexts = [TestContext() for _ in range(10)]
+        for context in contexts:
+            context.allowed = True
+
+        self.__fsm.signal_many(contexts, 'go')
+
+        self.assertEqual(4, self.__table.get_candidates.call_count)
+        self.assertEqual(10, self.__guard.is_satisfied.call_count)
+
+    @classmethod
+    def __is_allowed(cls, context: TestContext) -> bool:
+        """ Checks test guard condition """
+        if context.allowed is None:
+            raise ValueError('Guard failure')
+
+        return context.allowed
+
+
+class TestFSMQuery(unittest.TestCase):
+    """ State machine side effect free queries tests """
+
+    def setUp(self):
+        """ Sets up test environment """
+        self.__context = TestContext()
+        self.__listener = mock.Mock(ListenerInterface)
+        self.__guard = mock.Mock(GuardInterface)
+        self.__guard.is_satisfied.return_value = False
+
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        for transition in (
+                Transition(
+                    State('from'),
+                    State('ready'),
+                    None,
+                    (),
+                    [self.__listener],
+                    [self.__listener]
+                ),
+                Transition(State('ready'), State('from')),
+                Transition(State('ready'), State('to'), 'go'),
+                Transition(
+                    State('ready'),
+                    State('to'),
+                    'stop',
+                    [self.__guard]
+                ),
+                Transition(State('ready'), State('from'), 'back'),
+                Transition(State('from'), State('to'), 'skip')
+        ):
+            table.add_transition(transition)
+
+        self.__fsm = FSM(type(self.__context).__name__, table)
+
+    def tearDown(self):
+        """ Unsets test environment """
+        del self.__fsm
+        del self.__guard
+        del self.__listener
+        del self.__context
+
+    def test_is_signal(self):
+        """ Tests is signal transition possible """
+        self.assertTrue(self.__fsm.is_signal(self.__context, 'go'))
+        self.__assert_untouched()
 
     def test_is_signal_no(self):
         """ Tests is signal transition impossible """
-        self.__transition_table.find_transitions.side_effect = (
-            iter([]),
-            iter([])
+        self.assertFalse(self.__fsm.is_signal(self.__context, 'stop'))
+        self.assertFalse(self.__fsm.is_signal(self.__context, 'skip'))
+        self.assertFalse(self.__fsm.is_signal(self.__context, 'absent'))
+        self.__assert_untouched()
+
+    def test_available_signals(self):
+        """ Tests possible signals getting """
+        self.assertEqual(
+            ['go', 'back'],
+            self.__fsm.available_signals(self.__context)
         )
+        self.__assert_untouched()
 
-        self.__assert_state(self.__TEST_FROM)
+    def __assert_untouched(self):
+        """ Checks context is not changed and listeners are not called """
+        self.assertEqual('from', self.__context.state.name)
+        self.__listener.listen.assert_not_called()
 
-        fsm = FSM(type(self.__context).__name__, self.__transition_table)
 
-        self.assertFalse(fsm.is_signal(self.__context, self.__TEST_SIGNAL))
-        self.__assert_find_transition_calling(
-            [
-                mock.call(self.__context, None),
-                mock.call(self.__context, self.__TEST_SIGNAL)
-            ],
+class TestFSMReplay(unittest.TestCase):
+    """ State machine signals history replay tests """
+
+    def setUp(self):
+        """ Sets up test environment """
+        self.__context = TestContext()
+        self.__listener = mock.Mock(ListenerInterface)
+
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        for transition in (
+                Transition(
+                    State('from'),
+                    State('ready'),
+                    'go',
+                    (),
+                    (),
+                    [self.__listener]
+                ),
+                Transition(State('ready'), State('active')),
+                Transition(State('active'), State('to'), 'close'),
+                Transition(State('to'), State('from'), 'reopen')
+        ):
+            table.add_transition(transition)
+
+        self.__fsm = FSM(type(self.__context).__name__, table)
+
+    def tearDown(self):
+        """ Unsets test environment """
+        del self.__fsm
+        del self.__listener
+        del self.__context
+
+    def test_replay(self):
+        """ Tests signals history applying with listeners """
+        count = self.__fsm.replay(
+            self.__context,
+            iter([('go', {'key': 'value'}), ('absent', ()), ('close', ())])
         )
 
-    def __assert_state(self, state: str):
-        """ Checks state assertion """
-        self.assertEqual(state, self.__context.state.name)
+        self.assertEqual(3, count)
+        self.assertEqual('to', self.__context.state.name)
+        self.assertEqual(
+            {'key': 'value'},
+            self.__listener.listen.call_args[0][0].params
+        )
 
-    def __assert_find_transition_calling(self, calls: List[Any]):
-        """ Checks 'find_transition' calls """
-        self.__transition_table.find_transitions.assert_has_calls(calls)
+    def test_replay_silent(self):
+        """ Tests signals history applying without listeners """
+        self.__fsm.replay(self.__context, [('go', ())], silent=True)
+
+        self.assertEqual('active', self.__context.state.name)
+        self.__listener.listen.assert_not_called()
+
+    def test_replay_checkpoint(self):
+        """ Tests checkpoints of resumed replay """
+        callback = mock.Mock()
+        signals = [('go', ()), ('close', ()), ('reopen', ())] * 2
+
+        count = self.__fsm.replay(
+            self.__context,
+            signals[1:],
+            True,
+            Checkpoint(callback, 2, 1)
+        )
+
+        self.assertEqual(6, count)
         self.assertEqual(
-            len(calls),
-            self.__transition_table.find_transitions.call_count
+            [mock.call(self.__context, 2), mock.call(self.__context, 4),
+             mock.call(self.__context, 6)],
+            callback.call_args_list
         )
 
+    def test_fold(self):
+        """ Tests state folding from long history """
+        signals = (
+            (signal, ()) for _ in range(10000)
+            for signal in ('go', 'close', 'reopen')
+        )
+
+        state = self.__fsm.fold(State('from'), signals)
+
+        self.assertEqual(State('from'), state)
+        self.__listener.listen.assert_not_called()
+
+
+class TestFSMConcurrency(unittest.TestCase):
+    """ State machine concurrent transitions tests """
+
+    def setUp(self):
+        """ Sets up test environment """
+        self.__context = TestContext()
+        self.__entered = ThreadEvent()
+        self.__released = ThreadEvent()
+        self.__listener = mock.Mock(ListenerInterface)
+        self.__listener.listen.side_effect = self.__listen
+
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        table.add_transition(
+            Transition(State('from'), State('to'), 'go', (), [self.__listener])
+        )
+        self.__fsm = FSM('TestContext', table, StripedLock())
+
+    def tearDown(self):
+        """ Unsets test environment """
+        self.__released.set()
+        del self.__fsm
+        del self.__listener
+        del self.__released
+        del self.__entered
+        del self.__context
+
+    def test_signal_serialized(self):
+        """ Tests concurrent signals for context are serialized """
+        threads = [
+            Thread(target=self.__fsm.signal, args=(self.__context, 'go'))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+
+        self.assertTrue(self.__entered.wait(1))
+        time.sleep(0.05)
+        self.__released.set()
+        for thread in threads:
+            thread.join(1)
+
+        self.assertEqual('to', self.__context.state.name)
+        self.assertEqual(1, self.__listener.listen.call_count)
+
+    def test_signal_expected_state(self):
+        """ Tests compare and set signal """
+        self.__released.set()
+
+        with self.assertRaisesRegex(
+                TransitionConflictException,
+                "Context is in state 'from' instead of 'to'"
+        ):
+            self.__fsm.signal(self.__context, 'go', (), State('to'))
+
+        self.__fsm.signal(self.__context, 'go', (), State('from'))
+
+        self.assertEqual('to', self.__context.state.name)
+
+    def test_signal_expected_state_locked(self):
+        """ Tests compare and set signal fails fast on locked context """
+        thread = Thread(target=self.__fsm.signal, args=(self.__context, 'go'))
+        thread.start()
+        self.assertTrue(self.__entered.wait(1))
+
+        with self.assertRaisesRegex(
+                TransitionConflictException,
+                "Context is locked by other transition"
+        ):
+            self.__fsm.signal(self.__context, 'go', (), State('from'))
+
+        self.__released.set()
+        thread.join(1)
+
+    def test_signal_many_locked(self):
+        """ Tests batch signal skips context moved concurrently """
+        thread = Thread(target=self.__fsm.signal, args=(self.__context, 'go'))
+        thread.start()
+        self.assertTrue(self.__entered.wait(1))
+
+        Thread(target=self.__released.set).start()
+        outcomes = self.__fsm.signal_many([self.__context], 'go')
+        thread.join(1)
+
+        self.assertEqual(Outcome.STATUS_REJECTED, outcomes[0].status)
+        self.assertEqual(1, self.__listener.listen.call_count)
+
+    def __listen(self, event):
+        """ Blocks transition until released """
+        self.assertIsNotNone(event)
+        self.__entered.set()
+        self.__released.wait(1)
+
 
 class TestFSMFactory(unittest.TestCase):
     """ State machine factory tests"""
@@ -206,6 +596,237 @@ class TestFSMFactory(unittest.TestCase):
 
         self.assertIsInstance(fsm, FSMInterface)
 
+    def test_get_fsm_cached(self):
+        """ Tests state machine is compiled once """
+        factory = FSMFactory(
+            self.__get_config(),
+            self.__guard_manager,
+            self.__listener_manager
+        )
+
+        with mock.patch('pyfsm.fsm.TransitionTable') as table:
+            fsm = factory.get_fsm(self.__context)
+
+            self.assertIs(fsm, factory.get_fsm(self.__context))
+            self.assertEqual(1, table.call_count)
+
+    def test_get_fsm_concurrently(self):
+        """ Tests concurrent first access compiles one state machine """
+        factory = FSMFactory(
+            self.__get_config(),
+            self.__guard_manager,
+            self.__listener_manager
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            machines = set(executor.map(
+                lambda context: id(factory.get_fsm(context)),
+                [TestContext() for _ in range(32)]
+            ))
+
+        self.assertEqual(1, len(machines))
+
+    def test_invalidate(self):
+        """ Tests compiled state machine invalidation """
+        factory = FSMFactory(
+            self.__get_config(),
+            self.__guard_manager,
+            self.__listener_manager
+        )
+        fsm = factory.get_fsm(self.__context)
+
+        factory.invalidate('TestContext')
+        self.assertIsNot(fsm, factory.get_fsm(self.__context))
+
+        fsm = factory.get_fsm(self.__context)
+        factory.invalidate()
+        self.assertIsNot(fsm, factory.get_fsm(self.__context))
+
+    def test_get_fsm_with_locks(self):
+        """ Tests state machine with contexts locking """
+        locks = mock.Mock(StripedLock)
+        locks.get_lock.return_value = mock.MagicMock()
+        factory = FSMFactory(
+            self.__get_config(),
+            self.__guard_manager,
+            self.__listener_manager,
+            locks
+        )
+
+        factory.get_fsm(self.__context).refresh(self.__context)
+
+        locks.get_lock.assert_called_once_with(self.__context)
+        self.assertEqual('to', self.__context.state.name)
+
+    def test_get_fsm_lazy(self):
+        """ Tests guards and listeners resolving on first transition """
+        config = self.__get_config()
+        config['TestContext']['transitions'][0].update(
+            guards=['TestGuard'],
+            after=['TestListener']
+        )
+        self.__guard_manager.get_guard.return_value.is_satisfied \
+            .return_value = True
+        factory = FSMFactory(
+            config,
+            self.__guard_manager,
+            self.__listener_manager
+        )
+
+        fsm = factory.get_fsm(self.__context)
+
+        self.__guard_manager.get_guard.assert_not_called()
+        self.__listener_manager.get_listener.assert_not_called()
+        fsm.refresh(self.__context)
+        self.__guard_manager.get_guard.assert_called_once_with('TestGuard')
+        self.__listener_manager.get_listener.assert_called_once_with(
+            'TestListener'
+        )
+
+    def test_warmup(self):
+        """ Tests eager state machines compiling """
+        config = self.__get_config()
+        config['TestContext']['transitions'][0]['guards'] = ['TestGuard']
+        factory = FSMFactory(
+            config,
+            self.__guard_manager,
+            self.__listener_manager
+        )
+
+        factory.warmup()
+
+        self.__guard_manager.get_guard.assert_called_once_with('TestGuard')
+        with mock.patch('pyfsm.fsm.TransitionTable') as table:
+            factory.get_fsm(self.__context)
+            table.assert_not_called()
+
+    def test_warmup_lazy(self):
+        """ Tests resolving of already compiled lazy state machine """
+        config = self.__get_config()
+        config['TestContext']['transitions'][0].update(
+            guards=['TestGuard'],
+            after=['TestListener']
+        )
+        factory = FSMFactory(
+            config,
+            self.__guard_manager,
+            self.__listener_manager
+        )
+        factory.get_fsm(self.__context)
+
+        factory.warmup(['TestContext'])
+
+        self.__guard_manager.get_guard.assert_called_once_with('TestGuard')
+        self.__listener_manager.get_listener.assert_called_once_with(
+            'TestListener'
+        )
+
+    def test_get_fsm_lazy_missing_guard(self):
+        """ Tests not added guards are null ones as in eager compiling """
+        config = self.__get_config()
+        config['TestContext']['transitions'][0]['guards'] = ['!Missing']
+        factory = FSMFactory(config, GuardManager(), ListenerManager())
+        lazy, eager = TestContext(), TestContext()
+
+        factory.get_fsm(lazy).refresh(lazy)
+        factory.invalidate()
+        factory.warmup()
+        factory.get_fsm(eager).refresh(eager)
+
+        self.assertEqual([State('to'), State('to')], [lazy.state, eager.state])
+
+    def test_get_fsm_lazy_missing_guard_cycle(self):
+        """ Tests cycle guarded by not added guard only on lazy compiling """
+        config = self.__get_config()
+        config['TestContext']['transitions'] = [
+            {'from': 'from', 'to': 'to', 'guards': ['Missing']},
+            {'from': 'to', 'to': 'from'}
+        ]
+        factory = FSMFactory(config, GuardManager(), ListenerManager())
+
+        with self.assertRaisesRegex(
+                InvalidTransitionConfig,
+                'Automatic transitions cycle'
+        ):
+            factory.get_fsm(self.__context)
+
+    def test_get_fsm_nested(self):
+        """ Tests transitions inherited from composite state """
+        listener = mock.Mock(ListenerInterface)
+        self.__listener_manager.get_listener.return_value = listener
+        factory = FSMFactory(
+            {
+                'TestContext': {
+                    'states': {
+                        'active': {'type': State.TYPE_COMPOSITE},
+                        'from': {'parent': 'active'},
+                        'to': {}
+                    },
+                    'transitions': [
+                        {
+                            'from': 'active',
+                            'to': 'to',
+                            'signal': 'cancel',
+                            'after': ['TestListener']
+                        }
+                    ]
+                }
+            },
+            self.__guard_manager,
+            self.__listener_manager
+        )
+
+        factory.get_fsm(self.__context).signal(self.__context, 'cancel')
+
+        self.assertEqual(State('to'), self.__context.state)
+        self.assertEqual(
+            State('from'),
+            listener.listen.call_args[0][0].state_from
+        )
+        self.assertEqual(
+            ['to'],
+            factory.analyze('TestContext', ['from']).sinks
+        )
+
+    def test_get_final_states(self):
+        """ Tests configured initial and final states """
+        factory = FSMFactory(
+            {
+                'TestContext': {
+                    'states': {
+                        'from': {'type': State.TYPE_INITIAL},
+                        'to': {'type': State.TYPE_FINAL},
+                        'lost': {}
+                    },
+                    'transitions': [{'from': 'from', 'to': 'to'}]
+                }
+            },
+            self.__guard_manager,
+            self.__listener_manager
+        )
+
+        report = factory.analyze('TestContext')
+
+        self.assertEqual(frozenset(['to']), factory.get_final_states(
+            'TestContext'
+        ))
+        self.assertEqual(['lost'], report.unreachable)
+        self.assertEqual(['lost'], report.sinks)
+
+    def test_analyze_without_initial(self):
+        """ Tests analysis without initial states """
+        factory = FSMFactory(
+            self.__get_config(),
+            self.__guard_manager,
+            self.__listener_manager
+        )
+
+        with self.assertRaisesRegex(
+                InvalidConfigException,
+                "There are no initial states of FSM 'TestContext'"
+        ):
+            factory.analyze('TestContext')
+
     def test_get_fsm_not_found(self):
         """ Tests getting of absent state machine """
         factory = FSMFactory({}, self.__guard_manager, self.__listener_manager)
@@ -216,6 +837,24 @@ class TestFSMFactory(unittest.TestCase):
         ):
             factory.get_fsm(self.__context)
 
+    @classmethod
+    def __get_config(cls):
+        """ Gets state machine config """
+        return {
+            'TestContext': {
+                'states': {
+                    'from': {},
+                    'to': {}
+                },
+                'transitions': [
+                    {
+                        'from': 'from',
+                        'to': 'to'
+                    }
+                ]
+            }
+        }
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,11 +5,12 @@
 
 """
 
+import asyncio
 import unittest2 as unittest
 from parameterized import parameterized
 import mock
 from pyfsm import StatefulInterface, GuardInterface, GuardManager
-from pyfsm.guard import ReverseGuard, NullGuard
+from pyfsm.guard import GuardChain, ReverseGuard, NullGuard
 
 
 class TestReverseGuard(unittest.TestCase):
@@ -30,6 +31,78 @@ class TestReverseGuard(unittest.TestCase):
         self.assertEqual(guard.is_satisfied(context_mock), result)
         reversed_mock.is_satisfied.assert_called_once_with(context_mock)
 
+    @parameterized.expand([
+        (True, False),
+        (False, True)
+    ])
+    def test_is_satisfied_coroutine(self, reversed_value, result):
+        """ Tests coroutine guard condition """
+        async def is_satisfied(target):
+            return reversed_value and target is not None
+
+        reversed_mock = mock.Mock(GuardInterface)
+        reversed_mock.is_satisfied.side_effect = is_satisfied
+
+        guard = ReverseGuard(reversed_mock)
+
+        self.assertEqual(
+            asyncio.run(guard.is_satisfied(mock.Mock(StatefulInterface))),
+            result
+        )
+
+
+class TestGuardChain(unittest.TestCase):
+    """ Compiled guards tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__context = mock.Mock(StatefulInterface)
+        self.__guards = [mock.Mock(GuardInterface), mock.Mock(GuardInterface)]
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        del self.__guards
+        del self.__context
+
+    @parameterized.expand([
+        (True, True, True),
+        (True, False, False),
+        (False, True, False)
+    ])
+    def test_call(self, first, second, result):
+        """ Tests guards conjunction """
+        self.__guards[0].is_satisfied.return_value = first
+        self.__guards[1].is_satisfied.return_value = second
+
+        chain = GuardChain(self.__guards + [NullGuard(), NullGuard])
+
+        self.assertEqual(result, chain(self.__context))
+        self.__guards[0].is_satisfied.assert_called_once_with(self.__context)
+        self.assertEqual(
+            int(first),
+            self.__guards[1].is_satisfied.call_count
+        )
+
+    def test_call_with_shared_results(self):
+        """ Tests guard result reusing by reverse guard """
+        self.__guards[0].is_satisfied.return_value = True
+        results = {}
+
+        self.assertTrue(GuardChain(self.__guards[:1])(self.__context, results))
+        self.assertFalse(
+            GuardChain([ReverseGuard(self.__guards[0])])(
+                self.__context,
+                results
+            )
+        )
+        self.assertTrue(
+            GuardChain([ReverseGuard(ReverseGuard(self.__guards[0]))])(
+                self.__context,
+                results
+            )
+        )
+        self.__guards[0].is_satisfied.assert_called_once_with(self.__context)
+
 
 class TestGuardManager(unittest.TestCase):
     """ Guard manager tests """
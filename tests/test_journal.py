@@ -0,0 +1,232 @@
+"""
+    PyFSM
+
+    Transitions journal module tests
+
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    IdentifiableInterface,
+    Journal,
+    JournalReader,
+    JournalRecord,
+    JournalStorage,
+    SQLStateStorage,
+    StaleStateException,
+    State,
+    StateInterface,
+    StateStorageInterface
+)
+from pyfsm.fsm import FSM
+from pyfsm.transition import Transition, TransitionFactory, TransitionTable
+from tests.test_storage import VersionedContext
+
+
+class IdentifiableContext(IdentifiableInterface):
+    """ Test identifiable context """
+
+    def __init__(self, identifier: int):
+        self.__id = identifier
+        self.__state = State('from')
+
+    @property
+    def id(self) -> int:
+        """ Gets identifier """
+        return self.__id
+
+    @property
+    def state(self) -> StateInterface:
+        """ Gets state """
+        return self.__state
+
+    @state.setter
+    def state(self, state: StateInterface):
+        """ Sets state """
+        self.__state = state
+
+
+class TestJournal(unittest.TestCase):
+    """ Transitions journal tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        shutil.rmtree(self.__path)
+        del self.__path
+
+    def test_replay(self):
+        """ Tests states restoring from journal """
+        with Journal(self.__path) as journal:
+            journal.append(JournalRecord(1, 'from', 'ready', 'go', ()))
+            journal.append(JournalRecord(2, 'from', 'ready', 'go', ()))
+            journal.append(JournalRecord(1, 'ready', 'to', None, ()))
+
+        self.assertEqual(
+            {1: 'to', 2: 'ready'},
+            JournalReader(self.__path).replay()
+        )
+
+    def test_replay_snapshot(self):
+        """ Tests restoring from snapshot and journal tail """
+        with Journal(self.__path) as journal:
+            journal.append(JournalRecord(1, 'from', 'ready', 'go', ()))
+            journal.snapshot({1: 'snapshot'})
+            journal.append(JournalRecord(2, 'from', 'ready', 'go', ()))
+
+        self.assertEqual(
+            {1: 'snapshot', 2: 'ready'},
+            JournalReader(self.__path).replay()
+        )
+
+    def test_replay_torn(self):
+        """ Tests reading stop at incomplete record """
+        with Journal(self.__path) as journal:
+            journal.append(JournalRecord(1, 'from', 'ready', 'go', ()))
+            journal.append(JournalRecord(1, 'ready', 'to', None, ()))
+            segment, offset = journal.position
+
+        path = os.path.join(self.__path, '{0:020d}.log'.format(segment))
+        os.truncate(path, offset - 1)
+
+        self.assertEqual({1: 'ready'}, JournalReader(self.__path).replay())
+
+    def test_replay_recovered(self):
+        """ Tests appending after incomplete record on reopening """
+        with Journal(self.__path) as journal:
+            journal.append(JournalRecord(1, 'from', 'ready', 'go', ()))
+            segment, _ = journal.position
+
+        path = os.path.join(self.__path, '{0:020d}.log'.format(segment))
+        with open(path, 'ab') as file:
+            file.write(b'\x00\x01')
+
+        with Journal(self.__path) as journal:
+            journal.append(JournalRecord(2, 'from', 'ready', 'go', ()))
+
+        self.assertEqual(
+            {1: 'ready', 2: 'ready'},
+            JournalReader(self.__path).replay()
+        )
+
+    def test_replay_aborted(self):
+        """ Tests aborted records skipping """
+        with Journal(self.__path) as journal:
+            position = journal.append(JournalRecord(1, 'from', 'to', 'go', ()))
+            journal.append(JournalRecord(2, 'from', 'to', 'go', ()))
+            journal.abort([position])
+
+        self.assertEqual({2: 'to'}, JournalReader(self.__path).replay())
+
+    def test_segments(self):
+        """ Tests segments rotation """
+        with Journal(self.__path, segment_size=1) as journal:
+            for number in range(3):
+                journal.append(JournalRecord(number, 'from', 'to', 'go', ()))
+
+            self.assertEqual(2, journal.position[0])
+
+        records = list(JournalReader(self.__path).records())
+
+        self.assertEqual([0, 1, 2], [record.context_id for record in records])
+
+    def test_sync_batch(self):
+        """ Tests group commit by batch size """
+        with mock.patch('os.fsync') as fsync:
+            journal = Journal(self.__path, sync_interval=60, sync_batch=2)
+            journal.append(JournalRecord(1, 'from', 'to', 'go', ()))
+            fsync.assert_not_called()
+            journal.append(JournalRecord(2, 'from', 'to', 'go', ()))
+            fsync.assert_called_once()
+            journal.close()
+
+
+class TestJournalStorage(unittest.TestCase):
+    """ Write ahead journaling storage tests """
+
+    def test_store(self):
+        """ Tests transitions journaling """
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        table.add_transition(Transition(State('from'), State('ready'), 'go'))
+        table.add_transition(Transition(State('ready'), State('to')))
+        context = IdentifiableContext(1)
+
+        with tempfile.TemporaryDirectory() as path:
+            with Journal(path) as journal:
+                storage = JournalStorage(journal)
+                fsm = FSM('IdentifiableContext', table, None, storage)
+                fsm.signal(context, 'go', {'key': 'value'})
+
+            records = list(JournalReader(path).records())
+
+        self.assertEqual('to', context.state.name)
+        self.assertEqual(
+            [
+                JournalRecord(1, 'from', 'ready', 'go', {'key': 'value'}),
+                JournalRecord(1, 'ready', 'to', None, ())
+            ],
+            records
+        )
+
+    def test_store_rejected(self):
+        """ Tests transition rejected by inner storage is not journaled """
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        table.add_transition(Transition(State('from'), State('to'), 'go'))
+        inner = mock.Mock(StateStorageInterface)
+        inner.store.side_effect = StaleStateException('Stale state')
+        context = IdentifiableContext(1)
+
+        with tempfile.TemporaryDirectory() as path:
+            with Journal(path) as journal:
+                fsm = FSM(
+                    'IdentifiableContext',
+                    table,
+                    None,
+                    JournalStorage(journal, inner)
+                )
+
+                with self.assertRaises(StaleStateException):
+                    fsm.signal(context, 'go')
+
+            states = JournalReader(path).replay()
+
+        self.assertEqual('from', context.state.name)
+        self.assertEqual({}, states)
+
+    def test_batch_stale(self):
+        """ Tests transitions of failed inner storage batch are aborted """
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        table.add_transition(Transition(State('from'), State('to'), 'go'))
+        connection = sqlite3.connect(':memory:')
+        connection.execute(
+            'CREATE TABLE entity (id INTEGER, state TEXT, version INTEGER)'
+        )
+        connection.execute("INSERT INTO entity VALUES (1, 'from', 2)")
+        connection.commit()
+        context = VersionedContext(1)
+
+        with tempfile.TemporaryDirectory() as path:
+            with Journal(path) as journal:
+                storage = JournalStorage(
+                    journal,
+                    SQLStateStorage(connection, 'entity')
+                )
+                fsm = FSM('VersionedContext', table, None, storage)
+
+                with self.assertRaises(StaleStateException):
+                    with storage.batch():
+                        fsm.signal(context, 'go')
+
+            states = JournalReader(path).replay()
+
+        connection.close()
+        self.assertEqual('from', context.state.name)
+        self.assertEqual({}, states)
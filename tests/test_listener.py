@@ -8,6 +8,7 @@
 import unittest2 as unittest
 import mock
 from pyfsm import (
+    Event,
     ListenerManager,
     ListenerInterface,
     ListenerNotFoundException
@@ -35,6 +36,13 @@ class TestListenerManager(unittest.TestCase):
             listener
         )
 
+    def test_add_listener_with_name(self):
+        """ Tests listener adding by name """
+        listener = mock.Mock(ListenerInterface)
+
+        self.__manager.add_listener(listener, 'named')
+        self.assertEqual(self.__manager.get_listener('named'), listener)
+
     def test_get_listener_not_found_exception(self):
         """ Tests error on absent listener getting """
         with self.assertRaisesRegex(
@@ -44,5 +52,21 @@ class TestListenerManager(unittest.TestCase):
             self.__manager.get_listener('tests')
 
 
+class TestListenerInterface(unittest.TestCase):
+    """ Listener interface tests """
+
+    def test_listen_batch(self):
+        """ Tests default batch processing by single events """
+        listener = mock.Mock(ListenerInterface)
+        events = [mock.Mock(Event), mock.Mock(Event)]
+
+        ListenerInterface.listen_batch(listener, events)
+
+        self.assertEqual(
+            [mock.call(event) for event in events],
+            listener.listen.call_args_list
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
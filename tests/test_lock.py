@@ -0,0 +1,48 @@
+"""
+    PyFSM
+
+    Contexts locking module tests
+
+"""
+
+import unittest2 as unittest
+from pyfsm import StripedLock
+from tests import TestContext
+
+
+class TestStripedLock(unittest.TestCase):
+    """ Striped lock tests """
+
+    def test_get_lock(self):
+        """ Tests context lock getting """
+        locks = StripedLock(8)
+        context = TestContext()
+
+        contexts = [TestContext() for _ in range(64)]
+
+        self.assertIs(locks.get_lock(context), locks.get_lock(context))
+        self.assertGreater(
+            len({id(locks.get_lock(context)) for context in contexts}),
+            1
+        )
+
+    def test_get_lock_single_stripe(self):
+        """ Tests all contexts share single stripe """
+        locks = StripedLock(1)
+
+        self.assertIs(
+            locks.get_lock(TestContext()),
+            locks.get_lock(TestContext())
+        )
+
+    def test_incorrect_stripes(self):
+        """ Tests error on non positive stripes count """
+        with self.assertRaisesRegex(
+                ValueError,
+                "Stripes count must be positive, 0 given"
+        ):
+            StripedLock(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+    PyFSM
+
+    Run-to-completion signals queue module tests
+
+"""
+
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    Event,
+    FSMFactory,
+    FSMInterface,
+    GuardManager,
+    ListenerInterface,
+    ListenerManager,
+    Mailbox,
+    MailboxOverflowException,
+    State
+)
+from tests import TestContext
+
+
+class PostingListener(ListenerInterface):
+    """ Test listener posting signal """
+
+    def __init__(self):
+        self.mailbox = None
+        self.states = []
+
+    def listen(self, event: Event):
+        """ Posts next signal """
+        if event.signal == 'go':
+            self.mailbox.post(event.context, 'next')
+
+        self.states.append(event.context.state.name)
+
+
+class TestMailbox(unittest.TestCase):
+    """ Signals queue tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__fsm = mock.Mock(FSMInterface)
+        self.__context = TestContext()
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        del self.__context
+        del self.__fsm
+
+    def test_post_from_listener(self):
+        """ Tests signal posted by listener waits for transition end """
+        listener = PostingListener()
+        listener_manager = ListenerManager()
+        listener_manager.add_listener(listener)
+        fsm = FSMFactory(
+            {
+                'TestContext': {
+                    'states': {'from': {}, 'posting': {}, 'to': {}},
+                    'transitions': [
+                        {
+                            'from': 'from',
+                            'to': 'posting',
+                            'signal': 'go',
+                            'before': ['PostingListener']
+                        },
+                        {
+                            'from': 'posting',
+                            'to': 'to',
+                            'signal': 'next',
+                            'before': ['PostingListener']
+                        }
+                    ]
+                }
+            },
+            GuardManager(),
+            listener_manager
+        ).get_fsm(self.__context)
+        listener.mailbox = Mailbox(fsm)
+
+        listener.mailbox.post(self.__context, 'go')
+
+        self.assertEqual(['from', 'posting'], listener.states)
+        self.assertEqual(State('to'), self.__context.state)
+        self.assertEqual(0, len(listener.mailbox))
+
+    def test_coalesce(self):
+        """ Tests pending duplicate signals coalescing """
+        mailbox = Mailbox(self.__fsm, coalesce=True)
+        other = TestContext()
+
+        def post(context, signal, _):
+            """ Posts signals while first one is sent """
+            if signal == 'go':
+                mailbox.post(context, 'next', {'attempt': 1})
+                mailbox.post(other, 'next')
+                mailbox.post(context, 'next', {'attempt': 2})
+
+        self.__fsm.signal.side_effect = post
+        mailbox.post(self.__context, 'go')
+
+        self.assertEqual(
+            [
+                mock.call(self.__context, 'go', ()),
+                mock.call(self.__context, 'next', {'attempt': 2}),
+                mock.call(other, 'next', ())
+            ],
+            self.__fsm.signal.call_args_list
+        )
+
+    def test_overflow(self):
+        """ Tests posting to full mailbox """
+        mailbox = Mailbox(self.__fsm, max_depth=1)
+
+        def post(context, signal, _):
+            """ Posts signals while first one is sent """
+            if signal == 'go':
+                mailbox.post(context, 'next')
+                mailbox.post(context, 'next')
+
+        self.__fsm.signal.side_effect = post
+
+        with self.assertRaisesRegex(
+                MailboxOverflowException,
+                "Mailbox depth 1 is exceeded"
+        ):
+            mailbox.post(self.__context, 'go')
+
+        mailbox.drain()
+
+        self.assertEqual(
+            mock.call(self.__context, 'next', ()),
+            self.__fsm.signal.call_args
+        )
+        self.assertEqual(0, len(mailbox))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+"""
+    PyFSM
+
+    Instrumentation module tests
+
+"""
+
+import os
+import shutil
+import tempfile
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    Event,
+    FSMFactory,
+    FSMInterface,
+    GuardInterface,
+    GuardManager,
+    ListenerInterface,
+    ListenerManager,
+    Metrics,
+    MeasuredFSM,
+    MeasuredGuardManager,
+    MeasuredListenerManager,
+    MeasuredStorage,
+    State
+)
+from pyfsm.guard import NullGuard, ReverseGuard
+from tests import TestContext
+
+
+class AllowGuard(GuardInterface):
+    """ Test guard """
+
+    def is_satisfied(self, target) -> bool:
+        """ Checks guard condition """
+        return True
+
+
+class NotifyListener(ListenerInterface):
+    """ Test listener """
+
+    def listen(self, event: Event):
+        """ Processes transition event """
+
+
+class TestMetrics(unittest.TestCase):
+    """ Metrics registry tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__metrics = Metrics()
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        del self.__metrics
+
+    def test_export_counter(self):
+        """ Tests counter exporting """
+        self.__metrics.increment('total', (('name', 'a"b'),))
+        self.__metrics.increment('total', (('name', 'a"b'),))
+
+        self.assertEqual(
+            '# TYPE total counter\ntotal{name="a\\"b"} 2\n',
+            self.__metrics.export()
+        )
+
+    def test_export_histogram(self):
+        """ Tests histogram exporting """
+        self.__metrics.observe('latency', (('name', 'a'),), 0.002)
+        self.__metrics.observe('latency', (('name', 'a'),), 2.0)
+
+        lines = self.__metrics.export().splitlines()
+
+        self.assertEqual('# TYPE latency histogram', lines[0])
+        self.assertIn('latency_bucket{name="a",le="0.001"} 0', lines)
+        self.assertIn('latency_bucket{name="a",le="0.005"} 1', lines)
+        self.assertIn('latency_bucket{name="a",le="+Inf"} 2', lines)
+        self.assertIn('latency_sum{name="a"} 2.002', lines)
+        self.assertIn('latency_count{name="a"} 2', lines)
+
+    def test_write(self):
+        """ Tests exporting to file """
+        self.__metrics.increment('total')
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'metrics.prom')
+
+        try:
+            self.__metrics.write(path)
+
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(self.__metrics.export(), file.read())
+        finally:
+            shutil.rmtree(directory)
+
+
+class TestMeasuredGuardManager(unittest.TestCase):
+    """ Measuring guard manager tests """
+
+    def test_get_guard(self):
+        """ Tests guards measuring by registered name """
+        metrics = Metrics()
+        guard_manager = MeasuredGuardManager(GuardManager(), metrics)
+        guard_manager.add_guard(AllowGuard())
+
+        guard = guard_manager.get_guard('AllowGuard')
+        reverse = guard_manager.get_guard('!AllowGuard')
+
+        self.assertIs(guard, guard_manager.get_guard('AllowGuard'))
+        self.assertIsInstance(reverse, ReverseGuard)
+        self.assertIs(guard, reverse.guard)
+        self.assertIs(NullGuard, guard_manager.get_guard('Unknown'))
+        self.assertFalse(reverse.is_satisfied(TestContext()))
+        self.assertIn(
+            'pyfsm_guard_seconds_count{guard="AllowGuard"} 1',
+            metrics.export()
+        )
+
+
+class TestMeasuredListenerManager(unittest.TestCase):
+    """ Measuring listener manager tests """
+
+    def test_listen_batch(self):
+        """ Tests deferred events batch passing to original listener """
+        metrics = Metrics()
+        listener = mock.Mock(ListenerInterface)
+        listener_manager = mock.Mock(ListenerManager)
+        listener_manager.get_listener.return_value = listener
+        events = [mock.Mock(Event), mock.Mock(Event)]
+
+        MeasuredListenerManager(listener_manager, metrics) \
+            .get_listener('NotifyListener') \
+            .listen_batch(events)
+
+        listener.listen_batch.assert_called_once_with(events)
+        listener.listen.assert_not_called()
+        self.assertIn(
+            'pyfsm_listener_batch_seconds_count{listener="NotifyListener"} 1',
+            metrics.export()
+        )
+
+
+class TestMeasuredFSM(unittest.TestCase):
+    """ Measuring state machine tests """
+
+    def test_signal(self):
+        """ Tests signal, guards, listeners and transitions measuring """
+        metrics = Metrics()
+        guard_manager = GuardManager()
+        guard_manager.add_guard(AllowGuard())
+        listener_manager = ListenerManager()
+        listener_manager.add_listener(NotifyListener())
+        factory = FSMFactory(
+            {
+                'TestContext': {
+                    'states': {'from': {}, 'to': {}},
+                    'transitions': [{
+                        'from': 'from',
+                        'to': 'to',
+                        'signal': 'go',
+                        'guards': ['AllowGuard'],
+                        'after': ['NotifyListener']
+                    }]
+                }
+            },
+            MeasuredGuardManager(guard_manager, metrics),
+            MeasuredListenerManager(listener_manager, metrics),
+            storage=MeasuredStorage(metrics)
+        )
+        context = TestContext()
+        fsm = MeasuredFSM(factory.get_fsm(context), 'TestContext', metrics)
+
+        fsm.signal(context, 'go')
+
+        lines = metrics.export().splitlines()
+        self.assertEqual(State('to'), context.state)
+        self.assertIn(
+            'pyfsm_transitions_total{fsm="TestContext",from="from",'
+            'to="to",signal="go"} 1',
+            lines
+        )
+        self.assertIn('pyfsm_guard_seconds_count{guard="AllowGuard"} 1', lines)
+        self.assertIn(
+            'pyfsm_listener_seconds_count{listener="NotifyListener"} 1',
+            lines
+        )
+        self.assertIn(
+            'pyfsm_signal_seconds_count{fsm="TestContext",signal="go"} 1',
+            lines
+        )
+
+    def test_signal_error(self):
+        """ Tests failed signal measuring """
+        metrics = Metrics()
+        fsm_mock = mock.Mock(FSMInterface)
+        fsm_mock.signal.side_effect = ValueError
+        fsm = MeasuredFSM(fsm_mock, 'TestContext', metrics)
+
+        with self.assertRaises(ValueError):
+            fsm.signal(TestContext(), 'go')
+
+        self.assertIn(
+            'pyfsm_signal_seconds_count{fsm="TestContext",signal="go"} 1',
+            metrics.export()
+        )
@@ -0,0 +1,153 @@
+"""
+    PyFSM
+
+    Parallel bulk transitions module tests
+
+"""
+
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    GuardInterface,
+    ListenerInterface,
+    ListenerManager,
+    Outcome,
+    ParallelFSMRunner,
+    State
+)
+from tests import TestContext
+
+
+class AllowedGuard(GuardInterface):
+    """ Context allowed guard """
+
+    def is_satisfied(self, target: TestContext) -> bool:
+        """ Checks guard condition """
+        if target.allowed is None:
+            raise ValueError('Guard failure')
+
+        return target.allowed
+
+
+class NotifyListener(ListenerInterface):
+    """ Notification listener """
+
+    def listen(self, event):
+        """ Processes transition event """
+        raise AssertionError('Listener is called by worker')
+
+
+class TestParallelFSMRunner(unittest.TestCase):
+    """ Parallel runner tests """
+
+    def setUp(self):
+        """ Sets up test environment """
+        config = {
+            'TestContext': {
+                'states': {'from': {}, 'ready': {}, 'to': {}},
+                'transitions': [
+                    {'from': 'from', 'to': 'ready'},
+                    {
+                        'from': 'ready',
+                        'to': 'to',
+                        'signal': 'go',
+                        'guards': ['AllowedGuard'],
+                        'before': ['NotifyListener'],
+                        'after': ['NotifyListener']
+                    }
+                ]
+            }
+        }
+        self.__runner = ParallelFSMRunner(
+            config,
+            [AllowedGuard],
+            [NotifyListener],
+            workers=2,
+            chunk_size=2
+        )
+        self.__contexts = [TestContext() for _ in range(5)]
+        for context, allowed in zip(
+                self.__contexts,
+                (True, False, True, None, True)
+        ):
+            context.allowed = allowed
+
+    def tearDown(self):
+        """ Unsets test environment """
+        self.__runner.close()
+        del self.__contexts
+        del self.__runner
+
+    def test_signal(self):
+        """ Tests signal transitions in workers """
+        results = list(self.__runner.signal(self.__contexts, 'go', {'a': 1}))
+
+        self.assertEqual(
+            [
+                Outcome.STATUS_TRANSITIONED,
+                Outcome.STATUS_REJECTED,
+                Outcome.STATUS_TRANSITIONED,
+                Outcome.STATUS_ERROR,
+                Outcome.STATUS_TRANSITIONED
+            ],
+            [result.status for result in results]
+        )
+        self.assertEqual(
+            ['to', 'ready', 'to', 'ready', 'to'],
+            [result.state for result in results]
+        )
+        self.assertIsInstance(results[3].error, ValueError)
+        self.assertEqual(
+            [
+                ('NotifyListener', 'ready', 'ready', 'to', 'go', {'a': 1}),
+                ('NotifyListener', 'to', 'ready', 'to', 'go', {'a': 1})
+            ],
+            results[0].events
+        )
+        self.assertEqual([], results[1].events)
+        self.assertTrue(
+            all(context.state.name == 'from' for context in self.__contexts)
+        )
+
+    def test_apply(self):
+        """ Tests states setting and listeners replaying """
+        listener = mock.Mock(ListenerInterface)
+        states = []
+        listener.listen.side_effect = lambda event: states.append(
+            event.context.state.name
+        )
+        listener_manager = ListenerManager()
+        listener_manager.add_listener(listener, 'NotifyListener')
+
+        self.__runner.apply(
+            self.__contexts,
+            self.__runner.signal(self.__contexts, 'go'),
+            listener_manager
+        )
+
+        self.assertEqual(
+            ['to', 'ready', 'to', 'ready', 'to'],
+            [context.state.name for context in self.__contexts]
+        )
+        self.assertIsInstance(self.__contexts[0].state, State)
+        self.assertEqual(['ready', 'to'] * 3, states)
+        event = listener.listen.call_args_list[0].args[0]
+        self.assertEqual(
+            ('ready', 'to', 'go'),
+            (event.state_from.name, event.state_to.name, event.signal)
+        )
+
+    def test_refresh(self):
+        """ Tests automatic transitions in workers """
+        with self.__runner as runner:
+            results = list(runner.refresh(self.__contexts))
+
+        self.assertEqual(
+            [Outcome.STATUS_TRANSITIONED] * 5,
+            [result.status for result in results]
+        )
+        self.assertEqual(['ready'] * 5, [result.state for result in results])
+
+
+if __name__ == '__main__':
+    unittest.main()
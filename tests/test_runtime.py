@@ -0,0 +1,129 @@
+"""
+    PyFSM
+
+    Sharded entities runtime module tests
+
+"""
+
+from threading import Barrier
+import unittest2 as unittest
+from pyfsm import (
+    EntityNotFoundException,
+    Event,
+    FSMFactory,
+    GuardManager,
+    ListenerInterface,
+    ListenerManager,
+    ShardedRuntime,
+    State
+)
+from tests.test_journal import IdentifiableContext
+
+
+class BarrierListener(ListenerInterface):
+    """ Test listener waiting for other shards """
+
+    def __init__(self, parties: int):
+        self.barrier = Barrier(parties, timeout=5)
+        self.signals = []
+
+    def listen(self, event: Event):
+        """ Records signal and waits for other listeners """
+        self.signals.append((event.context.id, event.signal))
+
+        if event.signal == 'go':
+            self.barrier.wait()
+
+
+class TestShardedRuntime(unittest.TestCase):
+    """ Sharded runtime tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__listener = BarrierListener(2)
+        listener_manager = ListenerManager()
+        listener_manager.add_listener(self.__listener)
+        fsm = FSMFactory(
+            {
+                'IdentifiableContext': {
+                    'states': {'from': {}, 'to': {}},
+                    'transitions': [
+                        {
+                            'from': 'from',
+                            'to': 'to',
+                            'signal': 'go',
+                            'after': ['BarrierListener']
+                        },
+                        {
+                            'from': 'to',
+                            'to': 'from',
+                            'signal': 'back',
+                            'after': ['BarrierListener']
+                        }
+                    ]
+                }
+            },
+            GuardManager(),
+            listener_manager
+        ).get_fsm(IdentifiableContext(0))
+        self.__runtime = ShardedRuntime(fsm, shards=2)
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        self.__runtime.close()
+        del self.__runtime
+        del self.__listener
+
+    def test_signal(self):
+        """ Tests entities of different shards processed concurrently """
+        for identifier in range(2):
+            self.__runtime.add(IdentifiableContext(identifier))
+
+        futures = [
+            self.__runtime.signal(identifier, 'go')
+            for identifier in range(2)
+        ]
+
+        self.assertEqual(
+            [State('to'), State('to')],
+            [future.result(timeout=5) for future in futures]
+        )
+        self.assertEqual(2, len(self.__runtime))
+
+    def test_signal_order(self):
+        """ Tests signals of one entity processed in order """
+        self.__listener.barrier = Barrier(1)
+        self.__runtime.add(IdentifiableContext(1))
+
+        for signal in ('go', 'back', 'go'):
+            self.__runtime.signal(1, signal)
+        self.__runtime.flush()
+
+        self.assertEqual(
+            [(1, 'go'), (1, 'back'), (1, 'go')],
+            self.__listener.signals
+        )
+        self.assertEqual(State('to'), self.__runtime.get(1).state)
+        self.assertEqual(
+            [0, 3],
+            [stats.processed for stats in self.__runtime.stats()]
+        )
+
+    def test_signal_absent(self):
+        """ Tests signal to absent entity """
+        future = self.__runtime.signal(3, 'go')
+
+        with self.assertRaisesRegex(
+                EntityNotFoundException,
+                "Entity '3' is not found"
+        ):
+            future.result(timeout=5)
+
+        stats = self.__runtime.stats()[1]
+        self.assertEqual(1, stats.errors)
+        self.assertEqual(0, stats.pending)
+        self.assertLessEqual(stats.latency_mean, stats.latency_max)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,41 @@ from pyfsm import (
 from pyfsm.state import StateFactory, StateManager
 
 
+class TestState(unittest.TestCase):
+    """ State tests """
+
+    def test_hash(self):
+        """ Tests state hashing """
+        self.assertEqual(hash(State('state')), hash(State('state')))
+        self.assertEqual(hash('state'), hash(State('state')))
+        self.assertEqual(
+            'value',
+            {State('state'): 'value'}[State('state', 'other')]
+        )
+        self.assertEqual(1, len({State('state'), State('state')}))
+
+    def test_equality(self):
+        """ Tests state comparing """
+        state = State('state')
+
+        self.assertEqual(state, state)
+        self.assertEqual(state, State('state'))
+        self.assertNotEqual(state, State('other'))
+        self.assertNotEqual(state, 'state')
+        self.assertNotEqual(state, None)
+        self.assertFalse(state == 'state')
+
+    def test_read_only(self):
+        """ Tests state changing errors """
+        state = State('state')
+
+        with self.assertRaises(AttributeError):
+            state.name = 'other'
+
+        with self.assertRaises(AttributeError):
+            state.other = 'other'  # pylint: disable=assigning-non-slot
+
+
 class TestStateFactory(unittest.TestCase):
     """ State factory tests """
 
@@ -24,7 +59,18 @@ class TestStateFactory(unittest.TestCase):
         config = {
             'correct': {StateFactory.KEY_TYPE: StateInterface.TYPE_REGULAR},
             'incorrect': {StateFactory.KEY_TYPE: 'tests'},
-            'absent': {}
+            'absent': {},
+            'group': {StateFactory.KEY_TYPE: StateInterface.TYPE_COMPOSITE},
+            'child': {StateFactory.KEY_PARENT: 'group'},
+            'orphan': {StateFactory.KEY_PARENT: 'correct'},
+            'cycle': {
+                StateFactory.KEY_TYPE: StateInterface.TYPE_COMPOSITE,
+                StateFactory.KEY_PARENT: 'loop'
+            },
+            'loop': {
+                StateFactory.KEY_TYPE: StateInterface.TYPE_COMPOSITE,
+                StateFactory.KEY_PARENT: 'cycle'
+            }
         }
         self.__factory = StateFactory(config)
 
@@ -41,6 +87,7 @@ class TestStateFactory(unittest.TestCase):
         self.assertEqual(state_name, state.name)
         self.assertEqual(StateInterface.TYPE_REGULAR, state.type)
         self.assertEqual(state_name, str(state))
+        self.assertFalse(hasattr(state, '__dict__'))
 
     def test_get_state_with_absent_type(self):
         """ Tests state with absent type getting """
@@ -52,6 +99,14 @@ class TestStateFactory(unittest.TestCase):
         self.assertEqual(StateInterface.TYPE_REGULAR, state.type)
         self.assertEqual(state_name, str(state))
 
+    def test_get_state_final(self):
+        """ Tests final state getting """
+        state = StateFactory({
+            'final': {StateFactory.KEY_TYPE: StateInterface.TYPE_FINAL}
+        }).get_state('final')
+
+        self.assertEqual(StateInterface.TYPE_FINAL, state.type)
+
     def test_get_state_with_incorrect_type(self):
         """ Tests state with incorrect type getting """
         with self.assertRaisesRegex(
@@ -60,6 +115,30 @@ class TestStateFactory(unittest.TestCase):
         ):
             self.__factory.get_state('incorrect')
 
+    def test_get_state_with_parent(self):
+        """ Tests nested state getting """
+        state = self.__factory.get_state('child')
+
+        self.assertEqual(State('group'), state.parent)
+        self.assertEqual(StateInterface.TYPE_COMPOSITE, state.parent.type)
+        self.assertIsNone(state.parent.parent)
+
+    def test_get_state_with_regular_parent(self):
+        """ Tests state nested in not composite one """
+        with self.assertRaisesRegex(
+                IncorrectStateTypeException,
+                "Parent state 'correct' of state 'orphan' is not composite"
+        ):
+            self.__factory.get_state('orphan')
+
+    def test_get_state_with_parents_cycle(self):
+        """ Tests states nested in each other """
+        with self.assertRaisesRegex(
+                IncorrectStateConfigException,
+                "States parents cycle through state 'cycle'"
+        ):
+            self.__factory.get_state('cycle')
+
     def test_get_state_absent(self):
         """ Tests absent state getting """
         with self.assertRaisesRegex(
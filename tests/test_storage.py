@@ -0,0 +1,251 @@
+"""
+    PyFSM
+
+    States storage module tests
+
+"""
+
+import sqlite3
+from threading import Thread
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    AttributeStorage,
+    Event,
+    SQLStateStorage,
+    StaleStateException,
+    State,
+    StateInterface,
+    VersionedInterface
+)
+from pyfsm.fsm import FSM
+from pyfsm.transition import Transition, TransitionFactory, TransitionTable
+from tests import TestContext
+
+
+class VersionedContext(VersionedInterface):
+    """ Test versioned context """
+
+    def __init__(self, identifier: int):
+        self.__id = identifier
+        self.__state = State('from')
+        self.__version = 1
+
+    @property
+    def id(self) -> int:
+        """ Gets identifier """
+        return self.__id
+
+    @property
+    def state(self) -> StateInterface:
+        """ Gets state """
+        return self.__state
+
+    @state.setter
+    def state(self, state: StateInterface):
+        """ Sets state """
+        self.__state = state
+
+    @property
+    def version(self) -> int:
+        """ Gets state version """
+        return self.__version
+
+    @version.setter
+    def version(self, version: int):
+        """ Sets state version """
+        self.__version = version
+
+
+class TestAttributeStorage(unittest.TestCase):
+    """ Context attribute storage tests """
+
+    def test_store(self):
+        """ Tests state setting """
+        context = TestContext()
+
+        AttributeStorage().store(
+            Event(context, State('from'), State('to'), None, ())
+        )
+
+        self.assertEqual('to', context.state.name)
+
+
+class TestSQLStateStorage(unittest.TestCase):
+    """ SQL storage tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__connection = sqlite3.connect(':memory:')
+        self.__connection.execute(
+            'CREATE TABLE entity (id INTEGER, state TEXT, version INTEGER)'
+        )
+        self.__connection.executemany(
+            'INSERT INTO entity VALUES (?, ?, ?)',
+            [(1, 'from', 1), (2, 'from', 1)]
+        )
+        self.__connection.commit()
+        self.__storage = SQLStateStorage(self.__connection, 'entity')
+
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        table.add_transition(Transition(State('from'), State('ready'), 'go'))
+        table.add_transition(Transition(State('ready'), State('to')))
+        self.__fsm = FSM('VersionedContext', table, None, self.__storage)
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        self.__connection.close()
+        del self.__fsm
+        del self.__storage
+        del self.__connection
+
+    def test_store(self):
+        """ Tests versioned state writing """
+        context = VersionedContext(1)
+
+        self.__fsm.signal(context, 'go')
+
+        self.assertEqual('to', context.state.name)
+        self.assertEqual(3, context.version)
+        self.assertEqual([(1, 'to', 3), (2, 'from', 1)], self.__get_rows())
+
+    def test_store_stale(self):
+        """ Tests concurrently changed state error """
+        context = VersionedContext(1)
+        self.__connection.execute('UPDATE entity SET version = 2')
+        self.__connection.commit()
+
+        with self.assertRaisesRegex(
+                StaleStateException,
+                "1 of 1 states are changed concurrently"
+        ):
+            self.__fsm.signal(context, 'go')
+
+        self.assertEqual('from', context.state.name)
+        self.assertEqual(1, context.version)
+        self.assertEqual([(1, 'from', 2), (2, 'from', 2)], self.__get_rows())
+
+    def test_batch(self):
+        """ Tests batched writes by one statement """
+        contexts = [VersionedContext(1), VersionedContext(2)]
+
+        with self.__storage.batch():
+            self.__fsm.signal_many(contexts, 'go')
+            self.assertEqual(
+                [(1, 'from', 1), (2, 'from', 1)],
+                self.__get_rows()
+            )
+
+        self.assertEqual([(1, 'to', 2), (2, 'to', 2)], self.__get_rows())
+        self.assertEqual([2, 2], [context.version for context in contexts])
+
+    def test_batch_chunked(self):
+        """ Tests batched writes by several bulk statements """
+        contexts = [VersionedContext(1), VersionedContext(2)]
+        self.__connection.execute(
+            "UPDATE entity SET state = 'to' WHERE id = 2"
+        )
+        self.__connection.commit()
+
+        with mock.patch.object(SQLStateStorage, 'BATCH_SIZE', 1):
+            with self.assertRaisesRegex(
+                    StaleStateException,
+                    '1 of 2 states are changed concurrently'
+            ):
+                with self.__storage.batch():
+                    self.__fsm.signal_many(contexts, 'go')
+
+        self.assertEqual([(1, 'from', 1), (2, 'to', 1)], self.__get_rows())
+
+    def test_batch_stale(self):
+        """ Tests batched writes rollback """
+        contexts = [VersionedContext(1), VersionedContext(2)]
+        self.__connection.execute(
+            "UPDATE entity SET state = 'to' WHERE id = 2"
+        )
+        self.__connection.commit()
+
+        with self.assertRaises(StaleStateException):
+            with self.__storage.batch():
+                self.__fsm.signal_many(contexts, 'go')
+
+        self.assertEqual([(1, 'from', 1), (2, 'to', 1)], self.__get_rows())
+        self.assertEqual(
+            ['from', 'from'],
+            [context.state.name for context in contexts]
+        )
+
+    def test_batch_driver_error(self):
+        """ Tests contexts restoring on batch write error """
+        context = VersionedContext(1)
+        self.__connection.execute('DROP TABLE entity')
+
+        with self.assertRaises(sqlite3.OperationalError):
+            with self.__storage.batch():
+                self.__fsm.signal(context, 'go')
+
+        self.assertEqual('from', context.state.name)
+        self.assertEqual(1, context.version)
+
+    def test_batch_statement(self):
+        """ Tests batched writes by one conditional bulk statement """
+        connection = mock.Mock()
+        cursor = connection.cursor.return_value
+        cursor.rowcount = 2
+        storage = SQLStateStorage(connection, 'entity')
+        contexts = [VersionedContext(1), VersionedContext(2)]
+
+        with storage.batch():
+            for context in contexts:
+                storage.store(
+                    Event(context, State('from'), State('to'), 'go', {})
+                )
+
+        cursor.execute.assert_called_once_with(
+            'UPDATE entity SET state = CASE id WHEN ? THEN ? WHEN ? THEN ? '
+            'END, version = version + 1 WHERE (id = ? AND state = ? AND '
+            'version = ?) OR (id = ? AND state = ? AND version = ?)',
+            [1, 'to', 2, 'to', 1, 'from', 1, 2, 'from', 1]
+        )
+        connection.commit.assert_called_once_with()
+        self.assertEqual([2, 2], [context.version for context in contexts])
+
+    def test_batch_other_thread(self):
+        """ Tests writes of other thread are not collected by batch """
+        connection = mock.Mock()
+        connection.cursor.return_value.rowcount = 1
+        storage = SQLStateStorage(connection, 'entity')
+        context = VersionedContext(1)
+        event = Event(context, State('from'), State('to'), 'go', {})
+
+        with storage.batch():
+            thread = Thread(target=storage.store, args=(event,))
+            thread.start()
+            thread.join()
+
+            connection.commit.assert_called_once_with()
+
+        self.assertEqual(2, context.version)
+        connection.commit.assert_called_once_with()
+
+    def test_batch_error(self):
+        """ Tests contexts restoring on batch error """
+        context = VersionedContext(1)
+
+        with self.assertRaises(ValueError):
+            with self.__storage.batch():
+                self.__fsm.signal(context, 'go')
+                raise ValueError('Batch failure')
+
+        self.assertEqual('from', context.state.name)
+        self.assertEqual([(1, 'from', 1), (2, 'from', 1)], self.__get_rows())
+
+    def __get_rows(self):
+        """ Gets stored rows """
+        return self.__connection.execute(
+            'SELECT id, state, version FROM entity ORDER BY id'
+        ).fetchall()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+    PyFSM
+
+    Timed transitions scheduler module tests
+
+"""
+
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    FSMFactory,
+    GuardManager,
+    ListenerManager,
+    State,
+    TimedFSM
+)
+from tests import TestContext
+
+
+CONFIG = {
+    'TestContext': {
+        'states': {'from': {}, 'paid': {}, 'expired': {}},
+        'transitions': [
+            {'from': 'from', 'to': 'paid', 'signal': 'pay'},
+            {'from': 'from', 'to': 'from', 'signal': 'ping'},
+            {
+                'from': 'from',
+                'to': 'expired',
+                'signal': 'expire',
+                'timeout': 30
+            }
+        ]
+    }
+}
+
+
+class TestTimedFSM(unittest.TestCase):
+    """ Timed state machine tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        self.__clock = mock.Mock(return_value=0.0)
+        factory = FSMFactory(CONFIG, GuardManager(), ListenerManager())
+        self.__fsm = TimedFSM(
+            factory.get_fsm(TestContext()),
+            factory.get_transition_table('TestContext'),
+            self.__clock
+        )
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        del self.__fsm
+        del self.__clock
+
+    def test_tick(self):
+        """ Tests signal sending after timeout """
+        contexts = [TestContext(), TestContext()]
+        self.__fsm.track(contexts[0])
+        self.__clock.return_value = 10.0
+        self.__fsm.refresh_many(contexts)
+
+        self.__clock.return_value = 30.0
+        self.assertEqual(1, self.__fsm.tick())
+        self.assertEqual(0, self.__fsm.tick())
+        self.assertEqual(
+            ['expired', 'from'],
+            [context.state.name for context in contexts]
+        )
+        self.assertEqual(40.0, self.__fsm.next_deadline)
+
+        self.__clock.return_value = 40.0
+        self.assertEqual(1, self.__fsm.tick())
+        self.assertIsNone(self.__fsm.next_deadline)
+
+    def test_tick_after_leaving(self):
+        """ Tests timer dropping on state leaving """
+        context = TestContext()
+        self.__fsm.track(context)
+        self.__fsm.signal(context, 'pay')
+
+        self.__clock.return_value = 60.0
+
+        self.assertEqual(0, self.__fsm.tick())
+        self.assertEqual(State('paid'), context.state)
+
+    def test_tick_after_self_transition(self):
+        """ Tests timer restarting on state reentering """
+        context = TestContext()
+        self.__fsm.track(context)
+        self.__clock.return_value = 20.0
+        self.__fsm.signal(context, 'ping')
+
+        self.__clock.return_value = 31.0
+        self.assertEqual(0, self.__fsm.tick())
+        self.assertEqual(State('from'), context.state)
+
+        self.__clock.return_value = 50.0
+        self.assertEqual(1, self.__fsm.tick())
+        self.assertEqual(State('expired'), context.state)
+
+    def test_tick_after_outer_change(self):
+        """ Tests timer of state context has left outside of scheduler """
+        context = TestContext()
+        self.__fsm.track(context)
+        context.state = State('paid')
+
+        self.__clock.return_value = 60.0
+
+        self.assertEqual(0, self.__fsm.tick())
+        self.assertEqual(State('paid'), context.state)
+
+    def test_cancel(self):
+        """ Tests context timers dropping """
+        context = TestContext()
+        self.__fsm.track(context)
+        self.__fsm.cancel(context)
+
+        self.__clock.return_value = 60.0
+
+        self.assertEqual(0, self.__fsm.tick())
+        self.assertEqual(State('from'), context.state)
+
+
+if __name__ == '__main__':
+    unittest.main()
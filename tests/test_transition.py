@@ -87,6 +87,8 @@ class TestTransitionFactory(unittest.TestCase):
         self.assertEqual(transition.before[0], self.__listeners['before'])
         self.assertEqual(len(transition.after), 1)
         self.assertEqual(transition.after[0], self.__listeners['after'])
+        self.assertTrue(transition.has_listeners)
+        self.assertFalse(hasattr(transition, '__dict__'))
 
     def test_get_transition_without_from_state(self):
         """ Tests transition with absent initial state creation"""
@@ -104,6 +106,24 @@ class TestTransitionFactory(unittest.TestCase):
         ):
             self.__factory.get_transition({'from': 'from'})
 
+    def test_get_transition_timed(self):
+        """ Tests timed transition creation """
+        transition = self.__factory.get_transition(
+            {'from': 'from', 'to': 'to', 'signal': 'expire', 'timeout': 60}
+        )
+
+        self.assertEqual(60, transition.timeout)
+
+    def test_get_transition_timed_without_signal(self):
+        """ Tests timed automatic transition creation """
+        with self.assertRaisesRegex(
+                InvalidTransitionConfig,
+                "Timed transition without signal in config"
+        ):
+            self.__factory.get_transition(
+                {'from': 'from', 'to': 'to', 'timeout': 60}
+            )
+
 
 class TestTransitionTable(unittest.TestCase):
     """ Transitions table tests """
@@ -194,6 +214,149 @@ class TestTransitionTable(unittest.TestCase):
         with self.assertRaises(StopIteration):
             next(found)
 
+    def test_find_transitions_keeps_order(self):
+        """ Tests first match order among candidates """
+        first = Transition(State('from'), State('first'), 'signal')
+        second = Transition(State('from'), State('second'), 'signal')
+        self.__table.add_transition(Transition(State('to'), State('from')))
+        self.__table.add_transition(first)
+        self.__table.add_transition(second)
+
+        found = self.__table.find_transitions(self.__context, 'signal')
+
+        self.assertIs(first, next(found))
+        self.assertIs(second, next(found))
+        with self.assertRaises(StopIteration):
+            next(found)
+
+    def test_get_candidates(self):
+        """ Tests candidates lookup by state and signal """
+        guarded = Transition(
+            State('from'),
+            State('to'),
+            'signal',
+            [ReverseGuard(NullGuard())]
+        )
+        self.__table.add_transition(guarded)
+        self.__table.add_transition(Transition(State('to'), State('from')))
+
+        self.assertEqual(
+            [guarded],
+            self.__table.get_candidates(State('from'), 'signal')
+        )
+        self.assertFalse(self.__table.get_candidates(State('from')))
+        self.assertFalse(self.__table.get_candidates(State('absent')))
+
+    def test_get_candidates_inherited(self):
+        """ Tests composite state transitions inherited by children """
+        group = State('group', State.TYPE_COMPOSITE)
+        child = State('from', parent=group)
+        own = Transition(child, State('to'), 'signal')
+        inherited = Transition(group, State('other'), 'signal')
+        automatic = Transition(group, State('other'))
+        self.__table.add_transition(inherited)
+        self.__table.add_transition(automatic)
+        self.__table.add_states([group, child])
+        self.__table.add_transition(own)
+
+        self.assertEqual(
+            [own, inherited],
+            self.__table.get_candidates(child, 'signal')
+        )
+        self.assertFalse(self.__table.get_candidates(child))
+        self.assertEqual([inherited], self.__table.get_candidates(
+            group,
+            'signal'
+        ))
+        self.assertEqual('group', self.__table.get_parent('from'))
+        self.assertEqual(
+            ['group', 'other', 'from', 'to'],
+            self.__table.get_states()
+        )
+
+    def test_add_transition_from_final(self):
+        """ Tests final state outgoing transition error """
+        self.__table.add_states([State('from', State.TYPE_FINAL)])
+
+        with self.assertRaisesRegex(
+                InvalidTransitionConfig,
+                "Final state 'from' has outgoing transitions"
+        ):
+            self.__table.add_transition(Transition(State('from'), State('to')))
+        self.assertEqual(['from'], self.__table.get_states(State.TYPE_FINAL))
+
+    def test_find_transitions_evaluates_guard_once(self):
+        """ Tests guard result reusing among sibling transitions """
+        guard = mock.Mock(GuardInterface)
+        guard.is_satisfied.return_value = False
+        self.__table.add_transition(
+            Transition(State('from'), State('valid'), None, [guard])
+        )
+        self.__table.add_transition(
+            Transition(
+                State('from'),
+                State('invalid'),
+                None,
+                [ReverseGuard(guard)]
+            )
+        )
+
+        found = list(self.__table.find_transitions(self.__context))
+
+        self.assertEqual(1, len(found))
+        self.assertEqual('invalid', found[0].state_to.name)
+        guard.is_satisfied.assert_called_once_with(self.__context)
+
+    def test_get_automatic_path(self):
+        """ Tests unguarded automatic transitions chain """
+        first = Transition(State('from'), State('middle'))
+        second = Transition(State('middle'), State('to'))
+        third = Transition(State('to'), State('end'), None, [NullGuard()])
+        self.__table.add_transition(first)
+        self.__table.add_transition(second)
+        self.__table.add_transition(third)
+        self.__table.add_transition(
+            Transition(State('end'), State('from'), None, [self.__guard()])
+        )
+        self.__table.add_transition(Transition(State('end'), State('from')))
+
+        self.assertEqual(
+            (first, second, third),
+            self.__table.get_automatic_path(State('from'))
+        )
+        self.assertEqual((), self.__table.get_automatic_path(State('end')))
+        self.assertEqual((), self.__table.get_automatic_path(State('absent')))
+
+    def test_get_automatic_path_with_cycle(self):
+        """ Tests unguarded automatic transitions cycle error """
+        self.__table.add_transition(Transition(State('from'), State('to')))
+        self.__table.add_transition(Transition(State('to'), State('from')))
+
+        with self.assertRaisesRegex(
+                InvalidTransitionConfig,
+                "Automatic transitions cycle from state 'from'"
+        ):
+            self.__table.get_automatic_path(State('from'))
+
+    def test_cycle_on_build(self):
+        """ Tests unguarded automatic transitions cycle error on build """
+        factory = mock.Mock(TransitionFactory)
+        factory.get_transition.side_effect = (
+            Transition(State('from'), State('to')),
+            Transition(State('to'), State('to'))
+        )
+
+        with self.assertRaisesRegex(
+                InvalidTransitionConfig,
+                "Automatic transitions cycle from state 'to'"
+        ):
+            TransitionTable(factory, [{}, {}])
+
+    @classmethod
+    def __guard(cls) -> GuardInterface:
+        """ Gets guard mock """
+        return mock.Mock(GuardInterface)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,175 @@
+"""
+    PyFSM
+
+    Vectorized state engine module tests
+
+"""
+
+import unittest2 as unittest
+import mock
+from pyfsm import (
+    FSMFactory,
+    GuardInterface,
+    GuardManager,
+    InvalidTransitionConfig,
+    ListenerManager,
+    State,
+    VectorFSM,
+    VectorGuardInterface
+)
+from pyfsm.guard import ReverseGuard
+from pyfsm.transition import Transition, TransitionFactory, TransitionTable
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class AdultGuard(GuardInterface, VectorGuardInterface):
+    """ Test vectorized guard """
+
+    def is_satisfied(self, target) -> bool:
+        """ Checks guard condition """
+        return target.age >= 18
+
+    def is_satisfied_vector(self, columns):
+        """ Checks guard condition for each entity """
+        return columns['age'] >= 18
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestVectorFSM(unittest.TestCase):
+    """ Vectorized state machine tests """
+
+    def setUp(self):
+        """ Sets up tests environment """
+        guard = AdultGuard()
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        table.add_transition(
+            Transition(State('new'), State('adult'), 'check', [guard])
+        )
+        table.add_transition(
+            Transition(
+                State('new'),
+                State('minor'),
+                'check',
+                [ReverseGuard(guard)]
+            )
+        )
+        table.add_transition(Transition(State('minor'), State('rejected')))
+        table.add_transition(Transition(State('adult'), State('active')))
+        table.add_transition(
+            Transition(State('active'), State('closed'), 'close')
+        )
+        table.add_states([State('closed', State.TYPE_FINAL)])
+        self.__fsm = VectorFSM(table)
+
+    def tearDown(self):
+        """ Unsets tests environment """
+        del self.__fsm
+
+    def test_encode(self):
+        """ Tests states names encoding """
+        states = self.__fsm.encode(['new', 'closed', 'new'])
+
+        self.assertEqual(numpy.int32, states.dtype)
+        self.assertEqual(['new', 'closed', 'new'], self.__fsm.decode(states))
+
+    def test_encode_unknown(self):
+        """ Tests unknown state encoding error """
+        with self.assertRaisesRegex(
+                InvalidTransitionConfig,
+                "State 'unknown' is not found"
+        ):
+            self.__fsm.encode(['unknown'])
+
+    def test_signal(self):
+        """ Tests guarded signal and automatic transitions """
+        states = self.__fsm.encode(['new', 'new', 'active', 'closed'])
+        columns = {'age': numpy.array([20, 10, 30, 40])}
+
+        states = self.__fsm.signal(states, 'check', columns)
+
+        self.assertEqual(
+            ['active', 'rejected', 'active', 'closed'],
+            self.__fsm.decode(states)
+        )
+        self.assertEqual(
+            ['closed', 'rejected', 'closed', 'closed'],
+            self.__fsm.decode(self.__fsm.signal(states, 'close'))
+        )
+
+    def test_is_final(self):
+        """ Tests final states mask """
+        states = self.__fsm.encode(['new', 'closed', 'active'])
+
+        self.assertEqual(
+            [False, True, False],
+            self.__fsm.is_final(states).tolist()
+        )
+
+    def test_signal_unknown(self):
+        """ Tests unknown signal sending """
+        states = self.__fsm.encode(['new', 'minor'])
+
+        self.assertEqual(
+            ['new', 'rejected'],
+            self.__fsm.decode(self.__fsm.signal(states, 'unknown'))
+        )
+
+    def test_factory_table(self):
+        """ Tests machine of factory table with lazy guards """
+        guard_manager = GuardManager()
+        guard_manager.add_guard(AdultGuard())
+        fsm = VectorFSM(
+            FSMFactory(
+                {
+                    'TestContext': {
+                        'states': {'new': {}, 'adult': {}, 'minor': {}},
+                        'transitions': [
+                            {
+                                'from': 'new',
+                                'to': 'adult',
+                                'signal': 'check',
+                                'guards': ['AdultGuard']
+                            },
+                            {
+                                'from': 'new',
+                                'to': 'minor',
+                                'signal': 'check',
+                                'guards': ['!AdultGuard', 'Unknown']
+                            }
+                        ]
+                    }
+                },
+                guard_manager,
+                ListenerManager()
+            ).get_transition_table('TestContext')
+        )
+
+        states = fsm.signal(
+            fsm.encode(['new', 'new']),
+            'check',
+            {'age': numpy.array([20, 10])}
+        )
+
+        self.assertEqual(['adult', 'minor'], fsm.decode(states))
+
+    def test_not_vectorized_guard(self):
+        """ Tests not vectorized guard error """
+        table = TransitionTable(mock.Mock(TransitionFactory), [])
+        table.add_transition(
+            Transition(
+                State('from'),
+                State('to'),
+                'go',
+                [mock.Mock(GuardInterface)]
+            )
+        )
+
+        with self.assertRaisesRegex(
+                InvalidTransitionConfig,
+                "Guard 'Mock' is not vectorized"
+        ):
+            VectorFSM(table)